@@ -0,0 +1,107 @@
+"""Benchmark world snapshots: capture/restore cost vs re-simulating a prefix.
+
+For each population, agents are pushed toward the target for `--prefix`
+ticks. The benchmark then times:
+
+- `prefix`: re-simulating those ticks, which a warm start would otherwise
+  repeat every generation;
+- `snapshot`: `World.snapshot` plus `save_snapshot` to disk;
+- `restore`: `load_snapshot` plus `World.restore` into a fresh world;
+- `pickle`: a pymunk pickle round trip of the same world, for reference.
+
+World and agent construction is excluded from every column because it is
+needed with or without a snapshot.
+
+    python benchmarks/bench_snapshot.py --populations 20 200 1000 --prefix 120
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import pickle
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from evo_game.agent import Agent  # noqa: E402
+from evo_game.config import load_config  # noqa: E402
+from evo_game.world import World, load_snapshot, save_snapshot  # noqa: E402
+
+
+def _populated_world(app_config, population: int):
+    world = World(app_config.world, app_config.simulation.agent_radius, expected_agents=population)
+    agents = [Agent(world, app_config.simulation) for _ in range(population)]
+    return world, agents
+
+
+def measure(population: int, prefix: int, directory: Path) -> dict:
+    app_config = load_config()
+    dt = 1.0 / app_config.simulation.ticks_per_second
+    world, agents = _populated_world(app_config, population)
+
+    started = time.perf_counter()
+    for _ in range(prefix):
+        for agent in agents:
+            agent.act((0.6, 0.0))
+        world.step(dt)
+    prefix_seconds = time.perf_counter() - started
+
+    path = directory / f"snapshot-{population}.npz"
+    started = time.perf_counter()
+    save_snapshot(world.snapshot(agents), path)
+    snapshot_seconds = time.perf_counter() - started
+
+    fork, clones = _populated_world(app_config, population)
+    started = time.perf_counter()
+    fork.restore(load_snapshot(path), clones)
+    restore_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    blob = pickle.dumps((world, [a.body for a in agents]))
+    pickle.loads(blob)
+    pickle_seconds = time.perf_counter() - started
+
+    return {
+        "population": population,
+        "prefix": prefix_seconds,
+        "snapshot": snapshot_seconds,
+        "restore": restore_seconds,
+        "pickle": pickle_seconds,
+        "snapshot_bytes": path.stat().st_size,
+        "pickle_bytes": len(blob),
+        "saved_per_fork": prefix_seconds - restore_seconds,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--populations", type=int, nargs="+", default=[20, 200, 1000])
+    parser.add_argument("--prefix", type=int, default=120, help="Ticks simulated before the snapshot.")
+    parser.add_argument("--json", type=Path, default=None, help="Optional path for machine-readable results.")
+    args = parser.parse_args()
+
+    columns = ["prefix", "snapshot", "restore", "pickle"]
+    results = []
+    print(f"{'population':>10} " + " ".join(f"{c + ' ms':>12}" for c in columns) + f" {'npz bytes':>10} {'pickle bytes':>12}")
+    with tempfile.TemporaryDirectory() as directory:
+        for population in args.populations:
+            row = measure(population, args.prefix, Path(directory))
+            results.append(row)
+            print(
+                f"{population:>10} "
+                + " ".join(f"{1000 * row[c]:>12.2f}" for c in columns)
+                + f" {row['snapshot_bytes']:>10} {row['pickle_bytes']:>12}"
+            )
+
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Benchmark speciation: neat's `DefaultSpeciesSet` vs `CachedSpeciesSet`.
+
+Evolves populations with random fitness (no simulation) and times only the
+`speciate` calls, checking that both implementations assign the same species.
+
+    python benchmarks/bench_speciation.py --populations 200 1000 3000 --workers 0 4
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+import neat  # noqa: E402
+
+from evo_game import neat_runner  # noqa: E402
+from evo_game.speciation import CachedSpeciesSet  # noqa: E402
+
+
+def run(species_type, population_size: int, generations: int, seed: int, workers: int, threshold: float = 0.0):
+    random.seed(seed)
+    config = neat_runner._load_neat_config(ROOT / "neat-config.cfg", speciation_workers=workers)
+    config.species_set_type = species_type
+    config.pop_size = population_size
+    config.fitness_threshold = float("inf")
+    if threshold > 0:
+        config.species_set_config.compatibility_threshold = threshold
+    population = neat.Population(config)
+    population.reporters.info = lambda message: None
+
+    elapsed = [0.0]
+    speciate = population.species.speciate
+
+    def timed(*args, **kwargs):
+        started = time.perf_counter()
+        speciate(*args, **kwargs)
+        elapsed[0] += time.perf_counter() - started
+
+    population.species.speciate = timed
+    assignments = []
+
+    def evaluate(genomes, _config):
+        assignments.append(dict(population.species.genome_to_species))
+        for _, genome in genomes:
+            genome.fitness = random.random()
+
+    population.run(evaluate, generations)
+    if isinstance(population.species, CachedSpeciesSet):
+        population.species.close()
+    # Generation 0 is speciated inside Population(); only the run's calls are timed.
+    return elapsed[0] / max(generations - 1, 1), assignments
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--populations", type=int, nargs="+", default=[200, 1000])
+    parser.add_argument("--generations", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--compatibility-threshold", type=float, default=0.0, help="Override the config threshold (more species when lower)."
+    )
+    parser.add_argument("--workers", type=int, nargs="+", default=[0], help="Worker counts for the cached set.")
+    parser.add_argument("--json", type=Path, default=None, help="Optional path for machine-readable results.")
+    args = parser.parse_args()
+
+    columns = ["default"] + [f"cached/{w}w" for w in args.workers]
+    results = []
+    print(f"{'population':>10} " + " ".join(f"{c + ' s/gen':>16}" for c in columns) + "  identical")
+    for population_size in args.populations:
+        row = {"population": population_size}
+        row["default"], expected = run(
+            neat.DefaultSpeciesSet, population_size, args.generations, args.seed, 0, args.compatibility_threshold
+        )
+        identical = True
+        for workers, column in zip(args.workers, columns[1:]):
+            row[column], actual = run(
+                CachedSpeciesSet, population_size, args.generations, args.seed, workers, args.compatibility_threshold
+            )
+            identical = identical and actual == expected
+        row["identical"] = identical
+        results.append(row)
+        print(f"{population_size:>10} " + " ".join(f"{row[c]:>16.4f}" for c in columns) + f"  {identical}")
+
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
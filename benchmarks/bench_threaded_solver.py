@@ -0,0 +1,67 @@
+"""Benchmark `World.step` throughput against population size and solver threads.
+
+All agents share one space, as in competitive or interacting tasks.
+
+    python benchmarks/bench_threaded_solver.py --populations 100 500 2000 --threads 1 2
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from evo_game.agent import Agent  # noqa: E402
+from evo_game.config import SimulationSettings, WorldSettings  # noqa: E402
+from evo_game.world import World  # noqa: E402
+
+
+def steps_per_second(population: int, threads: int, steps: int, seed: int) -> tuple[float, int]:
+    sim_settings = SimulationSettings()
+    # Keep density comparable across population sizes so contacts scale linearly.
+    width = max(800.0, population * 4.0 * sim_settings.agent_radius)
+    settings = WorldSettings(width=width, threaded_solver=threads > 1, solver_threads=threads)
+    world = World(settings, sim_settings.agent_radius, expected_agents=population)
+
+    rng = random.Random(seed)
+    for _ in range(population):
+        start = (rng.uniform(20.0, width - 20.0), rng.uniform(60.0, settings.height - 20.0))
+        Agent(world, sim_settings, start_position=start)
+
+    dt = 1.0 / sim_settings.ticks_per_second
+    begin = time.perf_counter()
+    for _ in range(steps):
+        world.step(dt)
+    return steps / (time.perf_counter() - begin), world.solver_threads
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--populations", type=int, nargs="+", default=[100, 500, 2000])
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2])
+    parser.add_argument("--steps", type=int, default=300)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", type=Path, default=None, help="Optional path for machine-readable results.")
+    args = parser.parse_args()
+
+    results = []
+    print(f"{'population':>10} {'threads':>7} {'active':>6} {'steps/s':>10}")
+    for population in args.populations:
+        for threads in args.threads:
+            rate, active = steps_per_second(population, threads, args.steps, args.seed)
+            results.append({"population": population, "threads": threads, "active_threads": active, "steps_per_second": rate})
+            print(f"{population:>10} {threads:>7} {active:>6} {rate:>10.1f}")
+
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""Benchmark per-tick agent logic: `Agent.update`, the task path and the fused kernel.
+
+Times only the control step (sensors, network, bookkeeping); `World.step`
+runs between ticks but is excluded from the measurement. `python` is the
+inline per-agent `Agent.update`; `task` is `Simulation`'s default path, which
+runs networks per agent and the reward/termination `Task` on arrays.
+
+    python benchmarks/bench_tick_kernel.py --populations 50 200 1000
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+import neat  # noqa: E402
+
+from evo_game import neat_runner  # noqa: E402
+from evo_game.agent import Agent  # noqa: E402
+from evo_game.config import load_config  # noqa: E402
+from evo_game.kernel import HAS_NUMBA, FusedTicker, fused_tick  # noqa: E402
+from evo_game.policy import compile_genome  # noqa: E402
+from evo_game.simulation import Simulation  # noqa: E402
+from evo_game.task import PopulationState  # noqa: E402
+from evo_game.world import World  # noqa: E402
+
+
+def _genomes(population: int, seed: int):
+    random.seed(seed)
+    neat_config = neat_runner._load_neat_config(ROOT / "neat-config.cfg")
+    neat_config.pop_size = population
+    genomes = list(neat.Population(neat_config).population.values())
+    for genome in genomes:
+        for _ in range(6):
+            genome.mutate(neat_config.genome_config)
+    return neat_config, genomes
+
+
+def ticks_per_second(backend: str, population: int, steps: int, seed: int) -> float:
+    app_config = load_config()
+    app_config.simulation.max_energy = 1e9  # keep everyone alive for a steady workload
+    neat_config, genomes = _genomes(population, seed)
+    rng = random.Random(seed)
+    starts = [(rng.uniform(30.0, 150.0), rng.uniform(60.0, 300.0)) for _ in genomes]
+    dt = 1.0 / app_config.simulation.ticks_per_second
+
+    if backend == "task":
+        simulation = Simulation(list(enumerate(genomes)), neat_config, app_config)
+        world = simulation.world
+        for agent, start in zip(simulation.agents, starts):
+            agent.body.position = start
+        simulation.states = [PopulationState.from_agents(simulation.agents, world)]
+        simulation.task.reset(world, simulation.states[0])
+
+        def control() -> None:
+            simulation._tick(dt)
+
+        return _time(control, world, steps, dt)
+
+    world = World(app_config.world)
+    agents = [Agent(world, app_config.simulation, start_position=start) for start in starts]
+
+    if backend == "python":
+        networks = [neat.nn.FeedForwardNetwork.create(g, neat_config) for g in genomes]
+
+        def control() -> None:
+            for agent, network in zip(agents, networks):
+                if agent.alive:
+                    agent.update(dt, network)
+
+    else:
+        kernel = fused_tick if backend == "fused-jit" else getattr(fused_tick, "py_func", fused_tick)
+        ticker = FusedTicker(world, agents, [compile_genome(g, neat_config) for g in genomes], app_config.simulation, kernel)
+        ticker.tick(dt)  # warm up / trigger compilation
+
+        def control() -> None:
+            ticker.tick(dt)
+
+    return _time(control, world, steps, dt)
+
+
+def _time(control, world: World, steps: int, dt: float) -> float:
+    elapsed = 0.0
+    for _ in range(steps):
+        started = time.perf_counter()
+        control()
+        elapsed += time.perf_counter() - started
+        world.step(dt)
+    return steps / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--populations", type=int, nargs="+", default=[50, 200, 1000])
+    parser.add_argument("--steps", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--include-pure-python", action="store_true", help="Also time the kernel without numba.")
+    parser.add_argument("--json", type=Path, default=None, help="Optional path for machine-readable results.")
+    args = parser.parse_args()
+
+    backends = ["python", "task"]
+    if HAS_NUMBA:
+        backends.append("fused-jit")
+    if args.include_pure_python or not HAS_NUMBA:
+        backends.append("fused-pure")
+
+    results = []
+    print(f"{'population':>10} " + " ".join(f"{b + ' ticks/s':>18}" for b in backends))
+    for population in args.populations:
+        row = {"population": population}
+        for backend in backends:
+            row[backend] = ticks_per_second(backend, population, args.steps, args.seed)
+        results.append(row)
+        print(f"{population:>10} " + " ".join(f"{row[b]:>18.1f}" for b in backends))
+
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
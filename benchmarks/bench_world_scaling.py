@@ -0,0 +1,86 @@
+"""Benchmark `World.step` cost across world sizes and body counts.
+
+Compares the default bounding-box-tree broadphase with large-world mode
+(spatial hash).
+
+    python benchmarks/bench_world_scaling.py --steps 300 --json bench-world.json
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from evo_game.agent import Agent  # noqa: E402
+from evo_game.config import SimulationSettings, WorldSettings  # noqa: E402
+from evo_game.world import World  # noqa: E402
+
+
+def build_settings(scale: int, obstacles_per_screen: int, large_world: bool, seed: int) -> WorldSettings:
+    rng = random.Random(seed)
+    width, height = 800.0 * scale, 600.0 * scale
+    obstacles = tuple(
+        (rng.uniform(50.0, width - 50.0), rng.uniform(80.0, height - 50.0), rng.uniform(40.0, 160.0), 20.0)
+        for _ in range(obstacles_per_screen * scale * scale)
+    )
+    return WorldSettings(width=width, height=height, obstacles=obstacles, large_world=large_world)
+
+
+def time_world(settings: WorldSettings, bodies: int, steps: int, seed: int) -> float:
+    """Return the mean wall-clock milliseconds per `World.step`."""
+
+    sim_settings = SimulationSettings()
+    world = World(settings, sim_settings.agent_radius, expected_agents=bodies)
+    rng = random.Random(seed)
+    for _ in range(bodies):
+        start = (rng.uniform(20.0, settings.width - 20.0), rng.uniform(60.0, settings.height - 20.0))
+        agent = Agent(world, sim_settings, start_position=start)
+        agent.body.velocity = (rng.uniform(-200.0, 200.0), rng.uniform(-50.0, 50.0))
+
+    dt = 1.0 / sim_settings.ticks_per_second
+    begin = time.perf_counter()
+    for _ in range(steps):
+        world.step(dt)
+    return (time.perf_counter() - begin) * 1000.0 / steps
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 3, 10])
+    parser.add_argument("--bodies", type=int, nargs="+", default=[50, 200, 500])
+    parser.add_argument("--obstacles-per-screen", type=int, default=3)
+    parser.add_argument("--steps", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", type=Path, default=None, help="Optional path for machine-readable results.")
+    args = parser.parse_args()
+
+    results = []
+    print(f"{'scale':>5} {'bodies':>6} {'obstacles':>9} {'tree ms':>9} {'hash ms':>9} {'speedup':>8}")
+    for scale in args.scales:
+        for bodies in args.bodies:
+            row = {"scale": scale, "bodies": bodies}
+            for mode, large_world in (("tree", False), ("hash", True)):
+                settings = build_settings(scale, args.obstacles_per_screen, large_world, args.seed)
+                row["obstacles"] = len(settings.obstacles)
+                row[f"{mode}_ms_per_step"] = time_world(settings, bodies, args.steps, args.seed)
+            row["speedup"] = row["tree_ms_per_step"] / row["hash_ms_per_step"]
+            results.append(row)
+            print(
+                f"{scale:>5} {bodies:>6} {row['obstacles']:>9} {row['tree_ms_per_step']:>9.3f} "
+                f"{row['hash_ms_per_step']:>9.3f} {row['speedup']:>7.2f}x"
+            )
+
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
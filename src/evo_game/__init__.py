@@ -1,3 +1,3 @@
 """Small 2D evolution simulation game."""
 
-__all__ = ["config", "world", "agent", "simulation", "neat_runner", "render", "cli"]
+__all__ = ["config", "world", "agent", "simulation", "neat_runner", "render", "policy", "kernel", "dashboard", "budget", "curriculum", "pipeline", "reproducibility", "scaling", "speciation", "task", "cli"]
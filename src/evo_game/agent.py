@@ -1,7 +1,7 @@
 """Agent implementation that wraps a pymunk body and sensors."""
 from __future__ import annotations
 
-from typing import List
+from typing import List, Sequence
 
 import pymunk
 from pymunk.vec2d import Vec2d
@@ -11,6 +11,9 @@ import neat
 from .config import SimulationSettings, WorldSettings
 from .world import World
 
+# Shapes sharing a non-zero group never collide (used when agent collisions are off).
+AGENT_GROUP = 1
+
 
 class Agent:
     """Simple circular agent controlled by a NEAT network."""
@@ -27,6 +30,8 @@ class Agent:
         self.body.position = initial_pos
         self.shape = pymunk.Circle(self.body, radius)
         self.shape.friction = 1.0
+        if not sim_settings.agent_collisions:
+            self.shape.filter = pymunk.ShapeFilter(group=AGENT_GROUP)
         world.space.add(self.body, self.shape)
 
         self.alive: bool = True
@@ -57,23 +62,18 @@ class Agent:
         return [dx, dy, vx, vy, ground_dist, hazard_dist, target_velocity]
 
     def update(self, dt: float, network: neat.nn.FeedForwardNetwork) -> None:
-        """Update the agent using the provided NEAT network."""
+        """Update the agent using the provided NEAT network.
+
+        This is the single-agent form of the default `task.ReachTargetTask`;
+        `Simulation` evaluates tasks on population arrays instead.
+        """
 
         if not self.alive:
             return
 
-        sensors = self.get_sensor_values()
-        output = network.activate(sensors)
-        force_x = max(-1.0, min(1.0, output[0])) * self.sim_settings.move_force
-        jump_signal = output[1]
-
-        self.body.apply_force_at_local_point((force_x, 0.0))
-
-        self._consume_energy(abs(force_x) * self.sim_settings.energy_per_force)
-
-        if self._can_jump() and jump_signal > 0.5:
-            self.body.apply_impulse_at_local_point((0.0, self.sim_settings.jump_impulse))
-            self._consume_energy(self.sim_settings.energy_per_jump)
+        self.act(network.activate(self.get_sensor_values()))
+        if self.energy <= 0:
+            self.alive = False
 
         current_distance = self._distance_to_target()
         if self.best_distance is None or current_distance < self.best_distance:
@@ -88,27 +88,29 @@ class Agent:
         if position_below_floor(self.body, self.world.settings):
             self.alive = False
 
+    def act(self, output: Sequence[float]) -> None:
+        """Apply the movement force and jump from network outputs and spend energy."""
+
+        force_x = max(-1.0, min(1.0, output[0])) * self.sim_settings.move_force
+        jump_signal = output[1]
+
+        self.body.apply_force_at_local_point((force_x, 0.0))
+        self.energy -= abs(force_x) * self.sim_settings.energy_per_force
+
+        if self._can_jump() and jump_signal > 0.5:
+            self.body.apply_impulse_at_local_point((0.0, self.sim_settings.jump_impulse))
+            self.energy -= self.sim_settings.energy_per_jump
+
     def _can_jump(self) -> bool:
         return self.body.position.y <= self.world.settings.ground_height + self.sim_settings.agent_radius + 2.0
 
     def _check_hazards(self) -> None:
-        if not self.world.hazards:
-            return
-
         pos = Vec2d(*self.body.position)
-        for hazard in self.world.hazards:
-            vertices = [v + hazard.body.position for v in hazard.get_vertices()]  # type: ignore[arg-type]
-            xs = [p.x for p in vertices]
-            ys = [p.y for p in vertices]
-            if min(xs) <= pos.x <= max(xs) and min(ys) <= pos.y <= max(ys):
+        for min_x, max_x, min_y, max_y in self.world.hazard_boxes:
+            if min_x <= pos.x <= max_x and min_y <= pos.y <= max_y:
                 self.alive = False
                 return
 
-    def _consume_energy(self, amount: float) -> None:
-        self.energy -= amount
-        if self.energy <= 0:
-            self.alive = False
-
 
 def position_below_floor(body: pymunk.Body, settings: WorldSettings) -> bool:
     """Check if the body has fallen below the world floor."""
@@ -0,0 +1,57 @@
+"""Wall-clock pacing for generation evaluation."""
+from __future__ import annotations
+
+from collections import deque
+from typing import Deque, Optional, Tuple
+
+from .config import PopulationSettings
+
+
+class AdaptiveStepController:
+    """Resize `max_steps` so each generation takes roughly `target_seconds`.
+
+    Generation time is modelled as `overhead + steps * seconds_per_step`, where
+    the overhead covers reproduction, speciation and setup. Both terms are
+    averaged over the last `window` generations.
+    """
+
+    def __init__(self, target_seconds: float, bounds: Tuple[int, int], window: int = 5, max_change: float = 2.0) -> None:
+        if target_seconds <= 0:
+            raise ValueError("target_seconds must be positive.")
+        self.target_seconds = target_seconds
+        self.min_steps, self.max_steps = bounds
+        self.max_change = max_change
+        self._samples: Deque[Tuple[int, float, float]] = deque(maxlen=max(1, window))
+
+    @classmethod
+    def from_settings(cls, settings: PopulationSettings) -> Optional["AdaptiveStepController"]:
+        """Build a controller from population settings, or None when adaptation is off."""
+
+        if not settings.adaptive_max_steps:
+            return None
+        if settings.target_generations_per_hour > 0:
+            target = 3600.0 / settings.target_generations_per_hour
+        elif settings.generation_time_budget > 0:
+            target = settings.generation_time_budget
+        else:
+            raise ValueError("adaptive_max_steps needs target_generations_per_hour or generation_time_budget.")
+        return cls(target, settings.adaptive_step_bounds, settings.adaptive_window)
+
+    def record(self, steps: int, eval_seconds: float, overhead_seconds: float = 0.0) -> None:
+        if steps > 0:
+            self._samples.append((steps, eval_seconds, overhead_seconds))
+
+    def next_max_steps(self, current: int) -> int:
+        if not self._samples:
+            return current
+
+        steps = sum(s for s, _, _ in self._samples)
+        seconds_per_step = sum(e for _, e, _ in self._samples) / steps
+        overhead = sum(o for _, _, o in self._samples) / len(self._samples)
+        if seconds_per_step <= 0:
+            return current
+
+        desired = (self.target_seconds - overhead) / seconds_per_step
+        # Limit how far one update can move to avoid oscillating on noisy timings.
+        desired = min(max(desired, current / self.max_change), current * self.max_change)
+        return int(min(max(desired, self.min_steps), self.max_steps))
@@ -2,10 +2,11 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import List
 
 import typer
 
-from . import neat_runner
+from . import neat_runner, scaling
 from .config import write_default_config
 
 app = typer.Typer(help="Command line interface for the evolution game.")
@@ -19,10 +20,18 @@ def train(
     show_sensors: bool | None = typer.Option(
         None, help="Override whether sensor overlays are drawn when rendering."
     ),
+    dashboard: str | None = typer.Option(
+        None, help="Serve a live training dashboard at [HOST]:PORT, e.g. ':8080'."
+    ),
+    seed: int | None = typer.Option(
+        None, help="Root seed for a reproducible run (overrides population.seed; recorded in checkpoints)."
+    ),
 ) -> None:
     """Run evolutionary training."""
 
-    neat_runner.run_training(generations, render=render, config_path=config, show_sensors=show_sensors)
+    neat_runner.run_training(
+        generations, render=render, config_path=config, show_sensors=show_sensors, dashboard=dashboard, seed=seed
+    )
 
 
 @app.command(name="visualize-best")
@@ -44,10 +53,65 @@ def resume(
     show_sensors: bool | None = typer.Option(
         None, help="Override whether sensor overlays are drawn when rendering."
     ),
+    dashboard: str | None = typer.Option(
+        None, help="Serve a live training dashboard at [HOST]:PORT, e.g. ':8080'."
+    ),
 ) -> None:
     """Resume training from the last checkpoint."""
 
-    neat_runner.resume_training(render=render, config_path=config, show_sensors=show_sensors)
+    neat_runner.resume_training(render=render, config_path=config, show_sensors=show_sensors, dashboard=dashboard)
+
+
+@app.command(name="export-policy")
+def export_policy(
+    config: Path | None = typer.Option(None, help="Path to a TOML config file."),
+    output: Path | None = typer.Option(None, help="Destination .npz file (defaults to the checkpoint directory)."),
+) -> None:
+    """Export the best saved genome as a compact NumPy policy."""
+
+    neat_runner.export_best_policy(config_path=config, output=output)
+
+
+@app.command()
+def snapshot(
+    steps: int = typer.Option(120, help="Ticks to play the best policy before capturing the world."),
+    output: Path = typer.Option(Path("checkpoints/start-snapshot.npz"), help="Destination .npz snapshot file."),
+    config: Path | None = typer.Option(None, help="Path to a TOML config file."),
+) -> None:
+    """Save a mid-episode world snapshot for simulation.start_snapshot."""
+
+    neat_runner.save_start_snapshot(steps, output, config_path=config)
+
+
+@app.command(name="check-reproducible")
+def check_reproducible(
+    generations: int = typer.Option(3, help="Generations per run."),
+    seed: int = typer.Option(0, help="Root seed shared by every run."),
+    workers: List[int] = typer.Option(
+        [0, 0], help="Evaluation workers for each run (repeatable), e.g. --workers 0 --workers 4."
+    ),
+    config: Path | None = typer.Option(None, help="Path to a TOML config file."),
+) -> None:
+    """Train the same seeded run several times and verify identical generation stats."""
+
+    if not neat_runner.check_reproducibility(generations, seed, workers, config_path=config):
+        raise typer.Exit(code=1)
+
+
+@app.command(name="profile-scaling")
+def profile_scaling(
+    size: List[int] = typer.Option([20, 100, 500, 1000], help="Population size to profile (repeatable)."),
+    generations: int = typer.Option(3, help="Generations per population size."),
+    max_steps: int = typer.Option(120, help="Simulation steps per generation."),
+    seed: int = typer.Option(0, help="Random seed for every run."),
+    top: int = typer.Option(10, help="Allocation sites to keep per stage."),
+    config: Path | None = typer.Option(None, help="Path to a TOML config file."),
+    output: Path = typer.Option(Path("scaling.json"), help="Where to write the JSON scaling report."),
+) -> None:
+    """Measure time and memory per generation across population sizes."""
+
+    scaling.run_scaling(size, generations, max_steps, seed, config_path=config, top_n=top, output=output)
+    typer.echo(f"Wrote scaling report to {output}")
 
 
 @app.command(name="export-config")
@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, Literal, Optional, Tuple
 
 from pydantic import BaseModel, Field
 
@@ -26,6 +26,19 @@ class SimulationSettings(BaseModel):
     energy_per_force: float = Field(0.002, description="Energy cost per unit of applied horizontal force.")
     energy_per_jump: float = Field(0.5, description="Energy cost per jump.")
     max_energy: float = Field(15.0, description="Total energy budget before the agent exhausts.")
+    tick_backend: Literal["python", "fused"] = Field(
+        "python",
+        description="Per-tick agent logic: 'python' runs networks per agent and the task on arrays, 'fused' runs the kernel.fused_tick loop (JIT with numba).",
+    )
+    task: str = Field(
+        "reach_target", description="Registered task (see task.register_task) defining reward, termination and extra sensors."
+    )
+    agent_collisions: bool = Field(
+        True, description="Let agents collide with each other; disable to make each genome's result independent of the others."
+    )
+    start_snapshot: str = Field(
+        "", description="World snapshot (.npz from the snapshot command) every evaluation forks from; empty starts fresh. Not compatible with the curriculum."
+    )
 
 
 class WorldSettings(BaseModel):
@@ -52,6 +65,21 @@ class WorldSettings(BaseModel):
         80.0, description="Horizontal oscillation amplitude for the target (0 to disable)."
     )
     target_motion_speed: float = Field(1.5, description="Speed multiplier for the moving target.")
+    large_world: bool = Field(
+        False, description="Use a spatial-hash broadphase for big worlds (needs the agent radius)."
+    )
+    spatial_hash_cell_size: float = Field(
+        0.0, description="Spatial hash cell size in large-world mode (0 derives it from the agent radius)."
+    )
+    spatial_hash_count: int = Field(
+        0, description="Minimum spatial hash cell count in large-world mode (0 derives it from the body count)."
+    )
+    solver_iterations: int = Field(10, description="Physics solver iterations per step.")
+    collision_slop: float = Field(0.1, description="Allowed shape overlap before the solver pushes shapes apart.")
+    threaded_solver: bool = Field(
+        False, description="Use pymunk's multi-threaded solver (falls back to single-threaded where unsupported)."
+    )
+    solver_threads: int = Field(2, description="Solver threads when the threaded solver is enabled (pymunk caps this at 2).")
 
 
 class PopulationSettings(BaseModel):
@@ -62,6 +90,68 @@ class PopulationSettings(BaseModel):
     max_generations: int = Field(10, description="Maximum generations to run.")
     checkpoint_interval: int = Field(5, description="Generations between checkpoints.")
     checkpoint_dir: Path = Field(Path("checkpoints"), description="Directory for checkpoint files.")
+    generation_time_budget: float = Field(
+        0.0,
+        description="Seconds allowed for evaluating one generation, summed over evaluation workers (0 disables the budget).",
+    )
+    adaptive_max_steps: bool = Field(
+        False, description="Resize simulation.max_steps from recent generation timings to keep a steady pace."
+    )
+    target_generations_per_hour: float = Field(
+        0.0, description="Pace targeted by adaptive_max_steps (0 uses generation_time_budget instead)."
+    )
+    adaptive_step_bounds: Tuple[int, int] = Field(
+        (60, 6000), description="Lower/upper limits for adaptively sized max_steps."
+    )
+    adaptive_window: int = Field(5, description="Number of recent generations averaged by adaptive_max_steps.")
+    speciation_workers: int = Field(
+        0, description="Worker processes for speciation distance batches (0 or 1 computes them in-process)."
+    )
+    evaluation_workers: int = Field(
+        0,
+        description=(
+            "Worker processes that evaluate shards of each generation (0 or 1 evaluates in-process; needs "
+            "simulation.agent_collisions = false). The dashboard then receives generation stats but no agent positions."
+        ),
+    )
+    pipelined: bool = Field(
+        True,
+        description="Start evaluating each generation right after reproduction and write checkpoints/statistics in the background.",
+    )
+    seed: Optional[int] = Field(
+        None, description="Root seed for NEAT reproduction, world variants and evaluation RNGs (unset: unseeded run)."
+    )
+
+
+class EpisodeSettings(BaseModel):
+    """Multi-episode evaluation: every genome runs in several seeded world variants."""
+
+    count: int = Field(1, description="World variants each genome is evaluated in (1 uses the configured world only).")
+    aggregate: Literal["mean", "min"] = Field("mean", description="How per-episode fitness is combined into genome fitness.")
+    seed: int = Field(0, description="Seed for generating the world variants.")
+    resample: bool = Field(False, description="Draw new variants every generation (seeded with seed + generation).")
+    target_jitter: float = Field(60.0, description="Maximum offset in pixels of the target start position in a variant.")
+    amplitude_jitter: float = Field(
+        0.5, description="Maximum relative change of target_motion_amplitude in a variant."
+    )
+    hazard_jitter: float = Field(60.0, description="Maximum horizontal offset in pixels of each hazard in a variant.")
+
+
+class CurriculumSettings(BaseModel):
+    """Adaptive curriculum: start with an easier world and raise difficulty as fitness improves."""
+
+    enabled: bool = Field(False, description="Schedule world difficulty from recent fitness instead of using a static world.")
+    levels: int = Field(5, description="Number of difficulty levels; the last one is the configured world.")
+    start_fraction: float = Field(
+        0.4, description="Target distance and speed at the first level, as a fraction of the configured world's."
+    )
+    window: int = Field(3, description="Generations of fitness averaged before deciding to level up.")
+    promote_best: float = Field(
+        0.8, description="Level up once the average best fitness reaches this fraction of the level's target distance."
+    )
+    promote_mean: float = Field(
+        0.3, description="Leveling up also needs the average mean fitness at this fraction of the target distance."
+    )
 
 
 class RenderSettings(BaseModel):
@@ -77,6 +167,8 @@ class AppConfig(BaseModel):
     simulation: SimulationSettings = SimulationSettings()
     world: WorldSettings = WorldSettings()
     population: PopulationSettings = PopulationSettings()
+    episodes: EpisodeSettings = Field(default_factory=EpisodeSettings)
+    curriculum: CurriculumSettings = Field(default_factory=CurriculumSettings)
     neat_config_path: Path = Field(Path("neat-config.cfg"), description="Path to NEAT configuration file.")
     render: RenderSettings = Field(default_factory=RenderSettings)
 
@@ -130,6 +222,8 @@ def _to_toml(data: Dict[str, Any]) -> str:
         if isinstance(value, dict):
             lines.append(f"[{key}]")
             for inner_key, inner_value in value.items():
+                if inner_value is None:
+                    continue  # TOML has no null; leaving the key out keeps the default
                 lines.append(f"{inner_key} = {_format_value(inner_value)}")
             lines.append("")
         else:
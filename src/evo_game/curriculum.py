@@ -0,0 +1,113 @@
+"""Adaptive curriculum: world difficulty scheduled from recent fitness."""
+from __future__ import annotations
+
+import math
+from collections import deque
+from typing import Deque, Dict, NamedTuple, Optional, Tuple
+
+from .config import AppConfig, WorldSettings
+
+
+class Difficulty(NamedTuple):
+    """Parameters that define one curriculum level (and key the level cache)."""
+
+    target_distance: float
+    hazard_count: int
+    target_speed: float
+
+
+class CurriculumScheduler:
+    """Raise target distance, hazard count and target speed as fitness improves.
+
+    Level 0 places the target at `start_fraction` of the configured distance
+    from the agents' start, with no hazards and a slower target; the last
+    level is the configured world. After each generation `record()` receives
+    the best and mean fitness; once both, averaged over `window` generations,
+    reach their fraction of the current target distance, the next level starts
+    and the averages are reset.
+    """
+
+    def __init__(
+        self,
+        base: WorldSettings,
+        start_x: float,
+        levels: int = 5,
+        start_fraction: float = 0.4,
+        window: int = 3,
+        promote_best: float = 0.8,
+        promote_mean: float = 0.3,
+    ) -> None:
+        if levels < 1:
+            raise ValueError("A curriculum needs at least one level.")
+        self.base = base
+        self.start_x = start_x
+        self.levels = levels
+        self.start_fraction = start_fraction
+        self.promote_best = promote_best
+        self.promote_mean = promote_mean
+        self.level = 0
+        self._samples: Deque[Tuple[float, float]] = deque(maxlen=max(1, window))
+        self._settings: Dict[Difficulty, WorldSettings] = {}
+
+    @classmethod
+    def from_settings(cls, config: AppConfig) -> Optional["CurriculumScheduler"]:
+        """Build a scheduler from the app config, or None when the curriculum is off."""
+
+        settings = config.curriculum
+        if not settings.enabled:
+            return None
+        # Agents spawn at the left wall (see `Agent.__init__`).
+        start_x = config.simulation.agent_radius + 10.0
+        return cls(
+            config.world,
+            start_x,
+            settings.levels,
+            settings.start_fraction,
+            settings.window,
+            settings.promote_best,
+            settings.promote_mean,
+        )
+
+    def difficulty(self, level: int | None = None) -> Difficulty:
+        level = self.level if level is None else level
+        progress = level / (self.levels - 1) if self.levels > 1 else 1.0
+        scale = self.start_fraction + (1.0 - self.start_fraction) * progress
+        return Difficulty(
+            target_distance=(self.base.target_position[0] - self.start_x) * scale,
+            hazard_count=math.floor(progress * len(self.base.hazards) + 0.5),
+            target_speed=self.base.target_motion_speed * scale,
+        )
+
+    def world_settings(self, level: int | None = None) -> WorldSettings:
+        """World settings for a level (the current one by default), cached by difficulty."""
+
+        level = self.level if level is None else level
+        difficulty = self.difficulty(level)
+        settings = self._settings.get(difficulty)
+        if settings is None and level == self.levels - 1:
+            settings = self._settings[difficulty] = self.base
+        elif settings is None:
+            settings = self.base.model_copy(
+                update={
+                    "target_position": (self.start_x + difficulty.target_distance, self.base.target_position[1]),
+                    "hazards": self.base.hazards[: difficulty.hazard_count],
+                    "target_motion_speed": difficulty.target_speed,
+                }
+            )
+            self._settings[difficulty] = settings
+        return settings
+
+    def record(self, best_fitness: float, mean_fitness: float) -> bool:
+        """Add one generation's fitness; returns True when the level went up."""
+
+        self._samples.append((best_fitness, mean_fitness))
+        if self.level >= self.levels - 1 or len(self._samples) < self._samples.maxlen:
+            return False
+        distance = self.difficulty().target_distance
+        best = sum(b for b, _ in self._samples) / len(self._samples)
+        mean = sum(m for _, m in self._samples) / len(self._samples)
+        if best < self.promote_best * distance or mean < self.promote_mean * distance:
+            return False
+        self.level += 1
+        self._samples.clear()
+        return True
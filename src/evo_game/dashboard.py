@@ -0,0 +1,363 @@
+"""Optional live training dashboard served over local HTTP/WebSocket.
+
+The server runs an asyncio event loop on a daemon thread. Training code calls
+`DashboardServer.publish()`, which only serializes the message and hands it to
+the loop, so evaluation never waits on the network. Each browser client has a
+bounded queue; when a client falls behind, its oldest frames are dropped.
+"""
+from __future__ import annotations
+
+import asyncio
+import base64
+import hashlib
+import json
+import struct
+import threading
+import time
+from typing import Any, Dict, Iterable, Optional, Set, Tuple
+
+import neat
+
+_WS_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+# Clients only send control frames (close/ping/pong), whose payload is at most 125 bytes.
+MAX_CLIENT_PAYLOAD = 1024
+
+_INDEX_HTML = """<!doctype html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>Evolution Game - Training</title>
+<style>
+body { background: #1e1e28; color: #e6e6e6; font-family: sans-serif; margin: 20px; }
+canvas { background: #14141c; border: 1px solid #444; }
+td, th { padding: 2px 10px; text-align: right; }
+</style>
+</head>
+<body>
+<h2>Evolution Game - live training</h2>
+<p id="status">connecting...</p>
+<canvas id="world" width="800" height="300"></canvas>
+<table><thead><tr><th>Gen</th><th>Best</th><th>Mean</th><th>Stdev</th><th>Species</th><th>Seconds</th></tr></thead>
+<tbody id="stats"></tbody></table>
+<script>
+const status = document.getElementById("status");
+const stats = document.getElementById("stats");
+const canvas = document.getElementById("world");
+const ctx = canvas.getContext("2d");
+const ws = new WebSocket(`ws://${location.host}/ws`);
+ws.onopen = () => { status.textContent = "connected"; };
+ws.onclose = () => { status.textContent = "disconnected"; };
+ws.onmessage = (event) => {
+  const msg = JSON.parse(event.data);
+  if (msg.type === "generation") {
+    const row = stats.insertRow(0);
+    for (const v of [msg.generation, msg.best_fitness, msg.mean_fitness, msg.stdev_fitness, msg.species, msg.seconds]) {
+      row.insertCell().textContent = typeof v === "number" && !Number.isInteger(v) ? v.toFixed(2) : v;
+    }
+  } else if (msg.type === "agents") {
+    const sx = canvas.width / msg.width, sy = canvas.height / msg.height;
+    ctx.clearRect(0, 0, canvas.width, canvas.height);
+    ctx.fillStyle = "#c85050";
+    ctx.beginPath(); ctx.arc(msg.target[0] * sx, canvas.height - msg.target[1] * sy, 5, 0, 7); ctx.fill();
+    for (const [x, y, alive] of msg.agents) {
+      ctx.fillStyle = alive ? "#50c878" : "#787878";
+      ctx.fillRect(x * sx - 2, canvas.height - y * sy - 2, 4, 4);
+    }
+    status.textContent = `generation ${msg.generation}, step ${msg.step}`;
+  }
+};
+</script>
+</body>
+</html>
+"""
+
+
+def parse_address(address: str) -> Tuple[str, int]:
+    """Parse `[HOST]:PORT` (e.g. `:8080` or `0.0.0.0:8080`) into a host/port pair."""
+
+    host, sep, port = address.rpartition(":")
+    if not sep:
+        host, port = "", address
+    try:
+        port_number = int(port)
+    except ValueError:
+        raise ValueError(f"Invalid dashboard address {address!r}; expected [HOST]:PORT") from None
+    return host or "127.0.0.1", port_number
+
+
+def _offer(queue: "asyncio.Queue[bytes]", frame: bytes) -> bool:
+    """Enqueue a frame, dropping the oldest one if the queue is full.
+
+    Returns False when a frame had to be dropped.
+    """
+
+    dropped = False
+    if queue.full():
+        queue.get_nowait()
+        dropped = True
+    queue.put_nowait(frame)
+    return not dropped
+
+
+def _encode_frame(payload: bytes, opcode: int = 0x1) -> bytes:
+    header = bytes([0x80 | opcode])
+    length = len(payload)
+    if length < 126:
+        header += bytes([length])
+    elif length < 1 << 16:
+        header += bytes([126]) + struct.pack("!H", length)
+    else:
+        header += bytes([127]) + struct.pack("!Q", length)
+    return header + payload
+
+
+class _FrameTooLarge(Exception):
+    """A client frame announced a payload above `MAX_CLIENT_PAYLOAD`."""
+
+
+async def _read_frame(reader: asyncio.StreamReader, max_payload: int = MAX_CLIENT_PAYLOAD) -> Tuple[int, bytes]:
+    first, second = await reader.readexactly(2)
+    opcode = first & 0x0F
+    length = second & 0x7F
+    if length == 126:
+        (length,) = struct.unpack("!H", await reader.readexactly(2))
+    elif length == 127:
+        (length,) = struct.unpack("!Q", await reader.readexactly(8))
+    if length > max_payload:
+        raise _FrameTooLarge(length)
+    mask = await reader.readexactly(4) if second & 0x80 else b""
+    payload = await reader.readexactly(length)
+    if mask:
+        payload = bytes(b ^ mask[i % 4] for i, b in enumerate(payload))
+    return opcode, payload
+
+
+class DashboardServer:
+    """Push training updates to browser clients without blocking training."""
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 8080,
+        queue_size: int = 16,
+        sample_every: int = 30,
+        max_agents: int = 200,
+    ) -> None:
+        self.host = host
+        self.port = port
+        self.queue_size = queue_size
+        self.sample_every = sample_every
+        self.max_agents = max_agents
+        self.dropped_frames = 0
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._clients: Set["asyncio.Queue[bytes]"] = set()
+        self._thread: Optional[threading.Thread] = None
+        self._ready = threading.Event()
+        self._startup_error: Optional[BaseException] = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}/"
+
+    @property
+    def client_count(self) -> int:
+        return len(self._clients)
+
+    def start(self) -> None:
+        """Start serving on a background thread and wait until the socket is bound."""
+
+        self._thread = threading.Thread(target=self._run, name="evo-dashboard", daemon=True)
+        self._thread.start()
+        self._ready.wait()
+        if self._startup_error is not None:
+            raise self._startup_error
+
+    def stop(self) -> None:
+        loop = self._loop
+        if loop is None or self._thread is None:
+            return
+        loop.call_soon_threadsafe(loop.stop)
+        self._thread.join(timeout=5.0)
+        self._loop = None
+
+    def publish(self, message: Dict[str, Any]) -> None:
+        """Queue a JSON message for every connected client. Safe to call from any thread."""
+
+        loop = self._loop
+        if loop is None or not self._clients:
+            return
+        frame = _encode_frame(json.dumps(message, separators=(",", ":")).encode("utf-8"))
+        try:
+            loop.call_soon_threadsafe(self._fanout, frame)
+        except RuntimeError:  # loop closed during shutdown
+            pass
+
+    def should_sample(self, step: int) -> bool:
+        return bool(self._clients) and step % self.sample_every == 0
+
+    def publish_agents(self, generation: int, step: int, world: Any, agents: Iterable[Any]) -> None:
+        """Publish a low-resolution snapshot of agent positions."""
+
+        sampled = []
+        for agent in agents:
+            if len(sampled) >= self.max_agents:
+                break
+            x, y = agent.body.position
+            sampled.append((round(x, 1), round(y, 1), int(agent.alive)))
+        tx, ty = world.target_body.position
+        self.publish(
+            {
+                "type": "agents",
+                "generation": generation,
+                "step": step,
+                "width": world.settings.width,
+                "height": world.settings.height,
+                "target": (round(tx, 1), round(ty, 1)),
+                "agents": sampled,
+            }
+        )
+
+    def _fanout(self, frame: bytes) -> None:
+        for queue in self._clients:
+            if not _offer(queue, frame):
+                self.dropped_frames += 1
+
+    def _run(self) -> None:
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        try:
+            self._server = loop.run_until_complete(asyncio.start_server(self._handle, self.host, self.port))
+            self.port = self._server.sockets[0].getsockname()[1]
+        except BaseException as exc:  # surface bind errors to start()
+            self._startup_error = exc
+            self._ready.set()
+            loop.close()
+            return
+
+        self._loop = loop
+        self._ready.set()
+        try:
+            loop.run_forever()
+        finally:
+            self._server.close()
+            tasks = asyncio.all_tasks(loop)
+            for task in tasks:
+                task.cancel()
+            loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+            loop.close()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            request = await reader.readuntil(b"\r\n\r\n")
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+            writer.close()
+            return
+
+        lines = request.decode("latin-1").split("\r\n")
+        parts = lines[0].split(" ")
+        path = parts[1] if len(parts) > 1 else "/"
+        headers = {}
+        for line in lines[1:]:
+            name, sep, value = line.partition(":")
+            if sep:
+                headers[name.strip().lower()] = value.strip()
+
+        if path == "/ws" and headers.get("upgrade", "").lower() == "websocket":
+            await self._serve_websocket(reader, writer, headers.get("sec-websocket-key", ""))
+        elif path in ("/", "/index.html"):
+            body = _INDEX_HTML.encode("utf-8")
+            writer.write(
+                b"HTTP/1.1 200 OK\r\nContent-Type: text/html; charset=utf-8\r\n"
+                + f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode("ascii")
+                + body
+            )
+            await writer.drain()
+            writer.close()
+        else:
+            writer.write(b"HTTP/1.1 404 Not Found\r\nContent-Length: 0\r\nConnection: close\r\n\r\n")
+            await writer.drain()
+            writer.close()
+
+    async def _serve_websocket(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, key: str) -> None:
+        accept = base64.b64encode(hashlib.sha1((key + _WS_GUID).encode("ascii")).digest()).decode("ascii")
+        writer.write(
+            b"HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n"
+            + f"Sec-WebSocket-Accept: {accept}\r\n\r\n".encode("ascii")
+        )
+        await writer.drain()
+
+        queue: "asyncio.Queue[bytes]" = asyncio.Queue(maxsize=self.queue_size)
+        self._clients.add(queue)
+        sender = asyncio.ensure_future(self._send_loop(queue, writer))
+        try:
+            while True:
+                opcode, payload = await _read_frame(reader)
+                if opcode == 0x8:  # close: echo the status code, then drop the client
+                    writer.write(_encode_frame(payload[:2], opcode=0x8))
+                    await writer.drain()
+                    break
+                if opcode == 0x9:  # ping
+                    writer.write(_encode_frame(payload, opcode=0xA))
+        except _FrameTooLarge:
+            writer.write(_encode_frame(struct.pack("!H", 1009), opcode=0x8))  # 1009: message too big
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self._clients.discard(queue)
+            sender.cancel()
+            writer.close()
+
+    @staticmethod
+    async def _send_loop(queue: "asyncio.Queue[bytes]", writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                writer.write(await queue.get())
+                await writer.drain()
+        except ConnectionError:
+            pass
+
+
+class DashboardReporter(neat.reporting.BaseReporter):
+    """NEAT reporter that forwards per-generation statistics to the dashboard.
+
+    NEAT pickles its reporters along with the species set in every
+    checkpoint, so the reporter pickles without its (live) server.
+    """
+
+    def __init__(self, server: DashboardServer | None) -> None:
+        self.server = server
+        self.generation = 0
+        self._started = 0.0
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {"generation": self.generation}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__init__(None)
+        self.generation = state["generation"]
+
+    def start_generation(self, generation: int) -> None:
+        self.generation = generation
+        self._started = time.perf_counter()
+
+    def post_evaluate(self, config, population, species, best_genome) -> None:
+        if self.server is None:
+            return
+        fitnesses = [g.fitness for g in population.values() if g.fitness is not None]
+        mean = sum(fitnesses) / len(fitnesses) if fitnesses else 0.0
+        variance = sum((f - mean) ** 2 for f in fitnesses) / len(fitnesses) if fitnesses else 0.0
+        self.server.publish(
+            {
+                "type": "generation",
+                "generation": self.generation,
+                "best_fitness": best_genome.fitness if best_genome else 0.0,
+                "mean_fitness": mean,
+                "stdev_fitness": variance**0.5,
+                "species": len(species.species),
+                "population": len(population),
+                "seconds": time.perf_counter() - self._started,
+                "dropped_frames": self.server.dropped_frames,
+            }
+        )
@@ -0,0 +1,336 @@
+"""Optional Numba-JIT fused tick kernel for sensors, control and fitness.
+
+`fused_tick` performs, in one compiled loop over agents, everything
+`Agent.update` does per tick: sensor readings, network evaluation, output
+clamping, energy use, the jump decision, fitness bookkeeping and death checks.
+Physics stays in pymunk; `FusedTicker` gathers body state into arrays before
+the kernel and applies the resulting forces afterwards.
+
+Numba is optional. Without it the kernel runs as plain Python with identical
+results, which is mainly useful for testing.
+"""
+from __future__ import annotations
+
+import math
+from typing import Any, Callable, List, Sequence
+
+import numpy as np
+
+from .config import SimulationSettings
+from .policy import ACTIVATION_NAMES, CompiledPolicy
+
+try:
+    import numba
+except ImportError:  # pragma: no cover - numba is an optional dependency
+    numba = None
+
+HAS_NUMBA = numba is not None
+
+
+def _jit(func: Callable[..., Any]) -> Callable[..., Any]:
+    if numba is None:  # pragma: no cover - exercised without numba installed
+        return func
+    return numba.njit(cache=True, nogil=True)(func)
+
+
+_SIGMOID = ACTIVATION_NAMES.index("sigmoid")
+_TANH = ACTIVATION_NAMES.index("tanh")
+_SIN = ACTIVATION_NAMES.index("sin")
+_GAUSS = ACTIVATION_NAMES.index("gauss")
+_RELU = ACTIVATION_NAMES.index("relu")
+_ELU = ACTIVATION_NAMES.index("elu")
+_LELU = ACTIVATION_NAMES.index("lelu")
+_SELU = ACTIVATION_NAMES.index("selu")
+_SOFTPLUS = ACTIVATION_NAMES.index("softplus")
+_IDENTITY = ACTIVATION_NAMES.index("identity")
+_CLAMPED = ACTIVATION_NAMES.index("clamped")
+_INV = ACTIVATION_NAMES.index("inv")
+_LOG = ACTIVATION_NAMES.index("log")
+_EXP = ACTIVATION_NAMES.index("exp")
+_ABS = ACTIVATION_NAMES.index("abs")
+_HAT = ACTIVATION_NAMES.index("hat")
+_SQUARE = ACTIVATION_NAMES.index("square")
+_CUBE = ACTIVATION_NAMES.index("cube")
+
+# Indices into the `params` array passed to the kernel.
+P_WIDTH, P_HEIGHT, P_GROUND, P_SENSOR_RANGE, P_MOVE_FORCE = 0, 1, 2, 3, 4
+P_AGENT_RADIUS, P_ENERGY_PER_FORCE, P_ENERGY_PER_JUMP = 5, 6, 7
+
+
+@_jit
+def _activate(code: int, z: float) -> float:
+    if code == _TANH:
+        return math.tanh(max(-60.0, min(60.0, 2.5 * z)))
+    if code == _SIGMOID:
+        return 1.0 / (1.0 + math.exp(-max(-60.0, min(60.0, 5.0 * z))))
+    if code == _SIN:
+        return math.sin(max(-60.0, min(60.0, 5.0 * z)))
+    if code == _GAUSS:
+        z = max(-3.4, min(3.4, z))
+        return math.exp(-5.0 * z * z)
+    if code == _RELU:
+        return z if z > 0.0 else 0.0
+    if code == _ELU:
+        return z if z > 0.0 else math.exp(z) - 1
+    if code == _LELU:
+        return z if z > 0.0 else 0.005 * z
+    if code == _SELU:
+        lam = 1.0507009873554804934193349852946
+        alpha = 1.6732632423543772848170429916717
+        return lam * z if z > 0.0 else lam * alpha * (math.exp(z) - 1)
+    if code == _SOFTPLUS:
+        return 0.2 * math.log(1 + math.exp(max(-60.0, min(60.0, 5.0 * z))))
+    if code == _CLAMPED:
+        return max(-1.0, min(1.0, z))
+    if code == _INV:
+        return 1.0 / z if z != 0.0 else 0.0
+    if code == _LOG:
+        return math.log(max(1e-7, z))
+    if code == _EXP:
+        return math.exp(max(-60.0, min(60.0, z)))
+    if code == _ABS:
+        return abs(z)
+    if code == _HAT:
+        return max(0.0, 1 - abs(z))
+    if code == _SQUARE:
+        return z * z
+    if code == _CUBE:
+        return z * z * z
+    return z  # identity
+
+
+@_jit
+def fused_tick(
+    dt,
+    state,
+    target,
+    hazards,
+    params,
+    input_base,
+    node_range,
+    node_slots,
+    node_bias,
+    node_response,
+    node_activation,
+    conn_ptr,
+    conn_src,
+    conn_weight,
+    output_slots,
+    values,
+    alive,
+    fitness,
+    best_distance,
+    initial_distance,
+    energy,
+    force_out,
+    jump_out,
+):
+    """Advance every living agent by one control tick.
+
+    `state` rows are `(x, y, vx, vy)`, `target` is `(x, y, vx)` and `hazards`
+    rows are `(min_x, max_x, min_y, max_y)`. Network arrays are the
+    concatenation of every agent's `CompiledPolicy` with slots offset by
+    `input_base[i]`. Writes the horizontal force and jump flag for each agent
+    that was alive at the start of the tick and returns that agent count.
+    """
+
+    width = params[P_WIDTH]
+    height = params[P_HEIGHT]
+    ground = params[P_GROUND]
+    sensor_range = params[P_SENSOR_RANGE]
+    norm = max(width, height)
+    active = 0
+    for i in range(alive.shape[0]):
+        force_out[i] = 0.0
+        jump_out[i] = False
+        if not alive[i]:
+            continue
+        active += 1
+        x = state[i, 0]
+        y = state[i, 1]
+
+        hazard_dist = 1.0
+        if hazards.shape[0] > 0:
+            min_dist = math.inf
+            for h in range(hazards.shape[0]):
+                cx = min(max(x, hazards[h, 0]), hazards[h, 1])
+                cy = min(max(y, hazards[h, 2]), hazards[h, 3])
+                dist = math.sqrt((x - cx) ** 2 + (y - cy) ** 2)
+                min_dist = min(min_dist, dist)
+            hazard_dist = min(1.0, min_dist / norm)
+
+        base = input_base[i]
+        values[base + 0] = (target[0] - x) / width
+        values[base + 1] = (target[1] - y) / height
+        values[base + 2] = state[i, 2] / sensor_range
+        values[base + 3] = state[i, 3] / sensor_range
+        values[base + 4] = (y - ground) / height
+        values[base + 5] = hazard_dist
+        values[base + 6] = target[2] / max(1.0, sensor_range)
+
+        for n in range(node_range[i, 0], node_range[i, 1]):
+            s = 0.0
+            for c in range(conn_ptr[n], conn_ptr[n + 1]):
+                s += values[conn_src[c]] * conn_weight[c]
+            values[node_slots[n]] = _activate(node_activation[n], node_bias[n] + node_response[n] * s)
+
+        force_x = max(-1.0, min(1.0, values[output_slots[i, 0]])) * params[P_MOVE_FORCE]
+        jump_signal = values[output_slots[i, 1]]
+        force_out[i] = force_x
+
+        energy[i] -= abs(force_x) * params[P_ENERGY_PER_FORCE]
+        if energy[i] <= 0:
+            alive[i] = False
+
+        if y <= ground + params[P_AGENT_RADIUS] + 2.0 and jump_signal > 0.5:
+            jump_out[i] = True
+            energy[i] -= params[P_ENERGY_PER_JUMP]
+            if energy[i] <= 0:
+                alive[i] = False
+
+        current = math.sqrt((target[0] - x) ** 2 + (target[1] - y) ** 2)
+        if current < best_distance[i]:
+            best_distance[i] = current
+            fitness[i] = max(fitness[i], initial_distance[i] - current)
+        fitness[i] += dt
+
+        for h in range(hazards.shape[0]):
+            if hazards[h, 0] <= x <= hazards[h, 1] and hazards[h, 2] <= y <= hazards[h, 3]:
+                alive[i] = False
+                break
+
+        if y < 0 or y < ground - 5.0:
+            alive[i] = False
+    return active
+
+
+class FusedTicker:
+    """Drive a population of `Agent`s through `fused_tick` instead of `Agent.update`.
+
+    Agent attributes (`alive`, `fitness`, `energy`, `best_distance`) are kept in
+    sync after every tick, so renderers and fitness write-back are unchanged.
+    """
+
+    def __init__(
+        self,
+        world: Any,
+        agents: Sequence[Any],
+        policies: Sequence[CompiledPolicy],
+        sim_settings: SimulationSettings,
+        kernel: Callable[..., int] = fused_tick,
+    ) -> None:
+        if len(agents) != len(policies):
+            raise ValueError("FusedTicker needs exactly one policy per agent.")
+        for policy in policies:
+            if not policy.feed_forward or policy.num_inputs != 7 or policy.num_outputs < 2:
+                raise ValueError("The fused kernel needs feed-forward policies with 7 inputs and 2 outputs.")
+
+        self.world = world
+        self.agents = list(agents)
+        self.sim_settings = sim_settings
+        self.kernel = kernel
+        count = len(self.agents)
+        settings = world.settings
+
+        self.params = np.array(
+            [
+                settings.width,
+                settings.height,
+                settings.ground_height,
+                sim_settings.sensor_range,
+                sim_settings.move_force,
+                sim_settings.agent_radius,
+                sim_settings.energy_per_force,
+                sim_settings.energy_per_jump,
+            ],
+            dtype=np.float64,
+        )
+        self.hazards = np.array(world.hazard_boxes, dtype=np.float64).reshape(-1, 4)
+        self._pack(policies)
+
+        self.state = np.zeros((count, 4), dtype=np.float64)
+        self.target = np.zeros(3, dtype=np.float64)
+        self.alive = np.array([a.alive for a in self.agents], dtype=np.bool_)
+        self.fitness = np.array([a.fitness for a in self.agents], dtype=np.float64)
+        self.best_distance = np.array(
+            [math.inf if a.best_distance is None else a.best_distance for a in self.agents], dtype=np.float64
+        )
+        self.initial_distance = np.array([a.initial_distance for a in self.agents], dtype=np.float64)
+        self.energy = np.array([a.energy for a in self.agents], dtype=np.float64)
+        self.force = np.zeros(count, dtype=np.float64)
+        self.jump = np.zeros(count, dtype=np.bool_)
+
+    def _pack(self, policies: Sequence[CompiledPolicy]) -> None:
+        slot_base = np.cumsum([0] + [p.num_slots for p in policies])
+        node_base = np.cumsum([0] + [p.num_nodes for p in policies])
+        conn_base = np.cumsum([0] + [p.conn_src.shape[0] for p in policies])
+
+        self.input_base = slot_base[:-1].astype(np.int64)
+        self.node_range = np.stack([node_base[:-1], node_base[1:]], axis=1).astype(np.int64)
+        self.values = np.zeros(int(slot_base[-1]), dtype=np.float64)
+
+        def cat(parts: List[np.ndarray], dtype: Any) -> np.ndarray:
+            return np.concatenate(parts).astype(dtype) if parts else np.zeros(0, dtype=dtype)
+
+        self.node_slots = cat([p.node_slots + b for p, b in zip(policies, slot_base)], np.int64)
+        self.node_bias = cat([p.node_bias for p in policies], np.float64)
+        self.node_response = cat([p.node_response for p in policies], np.float64)
+        self.node_activation = cat([p.node_activation for p in policies], np.int64)
+        self.conn_ptr = np.concatenate(
+            [[0]] + [p.conn_ptr[1:] + c for p, c in zip(policies, conn_base)]
+        ).astype(np.int64)
+        self.conn_src = cat([p.conn_src + b for p, b in zip(policies, slot_base)], np.int64)
+        self.conn_weight = cat([p.conn_weight for p in policies], np.float64)
+        self.output_slots = np.stack([p.output_slots[:2] + b for p, b in zip(policies, slot_base)]).astype(np.int64)
+
+    def tick(self, dt: float) -> int:
+        """Run one control tick; returns how many agents were alive at its start."""
+
+        state = self.state
+        for i, agent in enumerate(self.agents):
+            if self.alive[i]:
+                body = agent.body
+                state[i, 0], state[i, 1] = body.position
+                state[i, 2], state[i, 3] = body.velocity
+        target_body = self.world.target_body
+        self.target[0], self.target[1] = target_body.position
+        self.target[2] = target_body.velocity.x
+
+        was_alive = self.alive.copy()
+        active = self.kernel(
+            dt,
+            state,
+            self.target,
+            self.hazards,
+            self.params,
+            self.input_base,
+            self.node_range,
+            self.node_slots,
+            self.node_bias,
+            self.node_response,
+            self.node_activation,
+            self.conn_ptr,
+            self.conn_src,
+            self.conn_weight,
+            self.output_slots,
+            self.values,
+            self.alive,
+            self.fitness,
+            self.best_distance,
+            self.initial_distance,
+            self.energy,
+            self.force,
+            self.jump,
+        )
+
+        jump_impulse = (0.0, self.sim_settings.jump_impulse)
+        for i in np.flatnonzero(was_alive):
+            agent = self.agents[i]
+            agent.body.apply_force_at_local_point((float(self.force[i]), 0.0))
+            if self.jump[i]:
+                agent.body.apply_impulse_at_local_point(jump_impulse)
+            agent.alive = bool(self.alive[i])
+            agent.fitness = float(self.fitness[i])
+            agent.energy = float(self.energy[i])
+            agent.best_distance = float(self.best_distance[i])
+        return int(active)
@@ -2,30 +2,291 @@
 from __future__ import annotations
 
 import pickle
+import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional, Sequence, Tuple
 
 import neat
 
+from .budget import AdaptiveStepController
 from .config import AppConfig, load_config
+from .curriculum import CurriculumScheduler
+from .dashboard import DashboardReporter, DashboardServer, parse_address
+from .pipeline import BackgroundCheckpointer, BackgroundReporter, PipelineStats, run_generations
+from .policy import export_genome, load_policy
+from .reproducibility import (
+    GenerationStatsReporter,
+    apply_run_seed,
+    derive_seed,
+    first_difference,
+    isolated_rng,
+    run_seed,
+    seed_process,
+    seed_run,
+)
 from .simulation import Simulation
+from .speciation import CachedSpeciesSet
+from .world import World, WorldSnapshot, load_snapshot, save_snapshot
 
 
-def _load_neat_config(path: Path) -> neat.Config:
+def _load_neat_config(path: Path, speciation_workers: int = 0) -> neat.Config:
     if not path.exists():
         raise FileNotFoundError(f"NEAT config not found at {path}")
-    return neat.config.Config(
+    config = neat.config.Config(
         neat.DefaultGenome,
         neat.DefaultReproduction,
         neat.DefaultSpeciesSet,
         neat.DefaultStagnation,
         path,
     )
+    # Parsed from the [DefaultSpeciesSet] section, then swapped for the
+    # cached implementation so existing config files keep working.
+    config.species_set_type = CachedSpeciesSet
+    config.species_set_config.workers = speciation_workers
+    return config
 
 
-def _evaluate_genomes(genomes, neat_config: neat.Config, app_config: AppConfig, render: bool, generation: int) -> None:
-    simulation = Simulation(genomes, neat_config, app_config, render=render, generation=generation)
+def _evaluate_shard(
+    genomes, neat_config: neat.Config, app_config: AppConfig, generation: int, snapshot, seed: Optional[int]
+) -> Tuple[List[float], int, bool, float]:
+    """Evaluate one shard of a generation (in a worker process).
+
+    Returns fitness, steps, truncation and the seconds the worker spent.
+    """
+
+    started = time.perf_counter()
+    if seed is not None:
+        seed_process(seed)
+    simulation = Simulation(genomes, neat_config, app_config, generation=generation, snapshot=snapshot)
     simulation.run()
+    fitnesses = [genome.fitness for _, genome in genomes]
+    return fitnesses, simulation.steps_run, simulation.truncated, time.perf_counter() - started
+
+
+class _GenerationEvaluator:
+    """Fitness function handed to `Population.run`.
+
+    Runs one `Simulation` per generation, reports truncated generations and,
+    when enabled, resizes `max_steps` from recent timings. With a curriculum,
+    one `World` is kept across generations and patched to the current level.
+
+    With `population.evaluation_workers > 1` the genomes are split into
+    contiguous shards evaluated by worker processes. Agents then must not
+    collide with each other (`simulation.agent_collisions = false`), which
+    makes every genome's fitness independent of how the population is split.
+    `prefetch` submits the next generation's shards as soon as its offspring
+    exist (see `pipeline.run_generations`), so the workers build networks and
+    simulate while the main process speciates, reports and checkpoints.
+    """
+
+    def __init__(
+        self,
+        population: neat.Population,
+        app_config: AppConfig,
+        render: bool,
+        dashboard: DashboardServer | None = None,
+    ) -> None:
+        self.population = population
+        self.app_config = app_config
+        self.render = render
+        self.dashboard = dashboard
+        self.step_controller = AdaptiveStepController.from_settings(app_config.population)
+        self._last_finished: float | None = None
+        # Loaded once and forked by every generation's Simulation.
+        start_snapshot = app_config.simulation.start_snapshot
+        self.snapshot: WorldSnapshot | None = load_snapshot(start_snapshot) if start_snapshot else None
+        self.curriculum = CurriculumScheduler.from_settings(app_config)
+        if self.curriculum and self.snapshot is not None:
+            # A snapshot pins the world it was taken in; the curriculum changes that world every level.
+            raise ValueError("curriculum.enabled cannot be combined with simulation.start_snapshot.")
+        self.world: World | None = None
+        self.seed = run_seed(population.config)
+
+        workers = app_config.population.evaluation_workers
+        self.executor: ProcessPoolExecutor | None = None
+        if workers > 1:
+            if app_config.simulation.agent_collisions:
+                raise ValueError("Sharded evaluation needs simulation.agent_collisions = false.")
+            if render:
+                raise ValueError("Rendering needs in-process evaluation (population.evaluation_workers <= 1).")
+            if dashboard is not None:
+                print("Dashboard: sharded evaluation streams generation stats only, no agent positions.")
+            self.executor = ProcessPoolExecutor(max_workers=workers)
+        self.workers = workers
+        self.stats = PipelineStats(workers)
+        self._pending: Optional[Tuple[int, List[int], list, list, float]] = None
+
+    def __call__(self, genomes, neat_config: neat.Config) -> None:
+        started = time.perf_counter()
+        generation = self.population.generation
+
+        if self.executor:
+            pending = self._pending
+            self._pending = None
+            if pending is not None and pending[:2] == (generation, [key for key, _ in genomes]):
+                # Evaluation started early; time it from submission.
+                started = pending[4]
+            else:
+                pending = self._submit_shards(genomes, neat_config, generation)
+            steps_run, truncated, spent = self._collect_shards(pending)
+        else:
+            steps_run, truncated = self._evaluate(genomes, neat_config, generation)
+            spent = time.perf_counter() - started
+            self.stats.add_evaluator_busy(spent)
+        # Overhead ends where evaluation starts (at submission for a prefetched generation), so no gap counts twice.
+        overhead = max(0.0, started - self._last_finished) if self._last_finished is not None else 0.0
+        elapsed = time.perf_counter() - started
+        self._last_finished = time.perf_counter()
+
+        if truncated:
+            print(
+                f"Generation {generation} truncated after {steps_run} steps "
+                f"({spent:.2f}s, budget {self.app_config.population.generation_time_budget:.2f}s)"
+            )
+        if self.curriculum:
+            fitnesses = [genome.fitness for _, genome in genomes]
+            if self.curriculum.record(max(fitnesses), sum(fitnesses) / len(fitnesses)):
+                print(f"Curriculum level {self.curriculum.level}/{self.curriculum.levels - 1}: {self.curriculum.difficulty()}")
+        if self.step_controller:
+            self.step_controller.record(steps_run, elapsed, overhead)
+            sim_settings = self.app_config.simulation
+            new_max_steps = self.step_controller.next_max_steps(sim_settings.max_steps)
+            if new_max_steps != sim_settings.max_steps:
+                print(f"Adjusting max_steps {sim_settings.max_steps} -> {new_max_steps}")
+                sim_settings.max_steps = new_max_steps
+
+    def _evaluate(self, genomes, neat_config: neat.Config, generation: int) -> Tuple[int, bool]:
+        seed = derive_seed(self.seed, "evaluation", generation, 0) if self.seed is not None else None
+        with isolated_rng(seed):
+            simulation = Simulation(
+                genomes,
+                neat_config,
+                self.app_config,
+                render=self.render,
+                generation=generation,
+                dashboard=self.dashboard,
+                snapshot=self.snapshot,
+                world=self._level_world(len(genomes)) if self.curriculum else None,
+            )
+            simulation.run()
+        return simulation.steps_run, simulation.truncated
+
+    def prefetch(self, genomes, neat_config: neat.Config, generation: int) -> None:
+        """Start evaluating `generation` in the workers; `__call__` collects the results."""
+
+        if self.executor:
+            self._pending = self._submit_shards(genomes, neat_config, generation)
+
+    def _submit_shards(self, genomes, neat_config: neat.Config, generation: int):
+        started = time.perf_counter()
+        size = -(-len(genomes) // self.workers)
+        shards = [genomes[i : i + size] for i in range(0, len(genomes), size)]
+        app_config = self.app_config
+        if self.curriculum:
+            app_config = app_config.model_copy(update={"world": self.curriculum.world_settings()})
+        budget = app_config.population.generation_time_budget
+        if budget > 0:
+            # The budget covers the whole generation, so each shard gets its share of it.
+            population = app_config.population.model_copy(update={"generation_time_budget": budget / len(shards)})
+            app_config = app_config.model_copy(update={"population": population})
+        futures = [
+            self.executor.submit(
+                _evaluate_shard,
+                shard,
+                neat_config,
+                app_config,
+                generation,
+                self.snapshot,
+                derive_seed(self.seed, "evaluation", generation, index) if self.seed is not None else None,
+            )
+            for index, shard in enumerate(shards)
+        ]
+        return generation, [key for key, _ in genomes], shards, futures, started
+
+    def _collect_shards(self, pending) -> Tuple[int, bool, float]:
+        """Apply the shard results; returns steps, truncation and the seconds summed over shards."""
+
+        _, _, shards, futures, _ = pending
+        steps_run, truncated, spent = 0, False, 0.0
+        # Results are applied in shard order, whatever order the workers finish in.
+        for shard, future in zip(shards, futures):
+            fitnesses, steps, shard_truncated, busy = future.result()
+            for (_, genome), fitness in zip(shard, fitnesses):
+                genome.fitness = fitness
+            steps_run = max(steps_run, steps)
+            truncated = truncated or shard_truncated
+            spent += busy
+            self.stats.add_evaluator_busy(busy)
+        budget = self.app_config.population.generation_time_budget
+        return steps_run, truncated or (budget > 0 and spent > budget), spent
+
+    def close(self) -> None:
+        if self.executor:
+            # A prefetched generation that will never be collected is dropped.
+            self.executor.shutdown(cancel_futures=True)
+            self.executor = None
+        self._pending = None
+
+    def _level_world(self, agent_count: int) -> World:
+        """The reusable world, emptied and switched to the current curriculum level."""
+
+        settings = self.curriculum.world_settings()
+        if self.world is None:
+            self.world = World(settings, self.app_config.simulation.agent_radius, expected_agents=agent_count)
+        else:
+            self.world.reset()
+            self.world.apply_settings(settings)
+        return self.world
+
+
+def _start_dashboard(address: Optional[str], population: neat.Population) -> Optional[DashboardServer]:
+    if not address:
+        return None
+    host, port = parse_address(address)
+    server = DashboardServer(host, port)
+    server.start()
+    population.add_reporter(DashboardReporter(server))
+    print(f"Dashboard available at {server.url}")
+    return server
+
+
+def _add_reporters(population: neat.Population, app_config: AppConfig, stats: PipelineStats) -> list:
+    """Attach the stdout, statistics and checkpoint reporters; returns the background ones to close."""
+
+    checkpoint_dir = app_config.population.checkpoint_dir
+    interval = app_config.population.checkpoint_interval
+    prefix = str(checkpoint_dir / "neat-checkpoint-")
+    population.add_reporter(neat.StdOutReporter(True))
+    if not app_config.population.pipelined:
+        population.add_reporter(neat.StatisticsReporter())
+        population.add_reporter(neat.Checkpointer(interval, filename_prefix=prefix))
+        return []
+    background = [
+        BackgroundReporter(neat.StatisticsReporter(), stats),
+        BackgroundCheckpointer(interval, filename_prefix=prefix, stats=stats),
+    ]
+    for reporter in background:
+        population.add_reporter(reporter)
+    return background
+
+
+def _run_population(
+    population: neat.Population, evaluator: _GenerationEvaluator, generations: Optional[int], background: Sequence = ()
+):
+    """Run the generation loop (pipelined unless disabled) and shut down its helpers."""
+
+    try:
+        if evaluator.app_config.population.pipelined:
+            winner = run_generations(population, evaluator, generations, evaluator.stats)
+            print(evaluator.stats.summary())
+        else:
+            winner = population.run(evaluator, generations)
+    finally:
+        evaluator.close()
+        for reporter in background:
+            reporter.close()
+    return winner
 
 
 def run_training(
@@ -33,27 +294,43 @@ def run_training(
     render: bool = False,
     config_path: Optional[Path] = None,
     show_sensors: bool | None = None,
+    dashboard: Optional[str] = None,
+    seed: Optional[int] = None,
 ) -> None:
-    """Run training for a set number of generations."""
+    """Run training for a set number of generations.
+
+    `seed` (or `population.seed`) makes the run reproducible; it is recorded in checkpoints.
+    """
 
     app_config = load_config(config_path)
     if show_sensors is not None:
         app_config.render.show_sensors = show_sensors
-    neat_config = _load_neat_config(app_config.neat_config_path)
+    if seed is not None:
+        app_config.population.seed = seed
+    neat_config = _load_neat_config(app_config.neat_config_path, app_config.population.speciation_workers)
+    if app_config.population.seed is not None:
+        seed_run(app_config.population.seed, app_config, neat_config)
 
     population = neat.Population(neat_config)
-    population.add_reporter(neat.StdOutReporter(True))
-    population.add_reporter(neat.StatisticsReporter())
     checkpoint_dir = app_config.population.checkpoint_dir
     checkpoint_dir.mkdir(parents=True, exist_ok=True)
-    population.add_reporter(neat.Checkpointer(app_config.population.checkpoint_interval, filename_prefix=str(checkpoint_dir / "neat-checkpoint-")))
+    server = _start_dashboard(dashboard, population)
 
-    winner = population.run(lambda g, c: _evaluate_genomes(g, c, app_config, render, population.generation), num_generations)
+    evaluator = _GenerationEvaluator(population, app_config, render, server)
+    background = _add_reporters(population, app_config, evaluator.stats)
+    try:
+        winner = _run_population(population, evaluator, num_generations, background)
+    finally:
+        if server:
+            server.stop()
+        if isinstance(population.species, CachedSpeciesSet):
+            population.species.close()
 
     best_path = checkpoint_dir / "best-genome.pkl"
     with best_path.open("wb") as f:
         pickle.dump((neat_config, winner), f)
-    print(f"Training finished. Best genome saved to {best_path}")
+    policy_path = export_genome(winner, neat_config, checkpoint_dir / "best-policy.npz", {"generation": population.generation})
+    print(f"Training finished. Best genome saved to {best_path} (policy: {policy_path})")
 
 
 def run_best(render: bool = True, config_path: Optional[Path] = None, show_sensors: bool | None = None) -> None:
@@ -63,6 +340,13 @@ def run_best(render: bool = True, config_path: Optional[Path] = None, show_senso
     if show_sensors is not None:
         app_config.render.show_sensors = show_sensors
     checkpoint_dir = app_config.population.checkpoint_dir
+    policy_path = checkpoint_dir / "best-policy.npz"
+    if policy_path.exists():
+        policy = load_policy(policy_path)
+        simulation = Simulation([], None, app_config, render=render, generation=0, policies=[policy])
+        simulation.run()
+        return
+
     best_path = checkpoint_dir / "best-genome.pkl"
     if not best_path.exists():
         print("No best genome found. Run training first.")
@@ -76,7 +360,70 @@ def run_best(render: bool = True, config_path: Optional[Path] = None, show_senso
     simulation.run()
 
 
-def resume_training(render: bool = False, config_path: Optional[Path] = None, show_sensors: bool | None = None) -> None:
+def save_start_snapshot(steps: int, output: Path, config_path: Optional[Path] = None) -> Optional[Path]:
+    """Play the best saved policy for `steps` ticks and save the world as a snapshot.
+
+    Set `simulation.start_snapshot` to the written file to start every
+    evaluation from that moment.
+    """
+
+    app_config = load_config(config_path)
+    app_config.simulation.max_steps = steps
+    app_config.simulation.start_snapshot = ""
+    app_config.episodes.count = 1
+    policy_path = app_config.population.checkpoint_dir / "best-policy.npz"
+    if not policy_path.exists():
+        print("No best policy found. Run training first.")
+        return None
+
+    simulation = Simulation([], None, app_config, policies=[load_policy(policy_path)])
+    simulation.run()
+    agent = simulation.agents[0]
+    if not agent.alive:
+        print(f"Warning: the agent died after {simulation.steps_run} steps; the snapshot holds its final state.")
+    destination = save_snapshot(simulation.world.snapshot([agent]), output)
+    print(f"Saved snapshot at t={simulation.world.time:.2f}s to {destination}")
+    return destination
+
+
+def export_best_policy(config_path: Optional[Path] = None, output: Optional[Path] = None) -> Optional[Path]:
+    """Convert the pickled best genome into a compact `.npz` policy."""
+
+    app_config = load_config(config_path)
+    checkpoint_dir = app_config.population.checkpoint_dir
+    best_path = checkpoint_dir / "best-genome.pkl"
+    if not best_path.exists():
+        print("No best genome found. Run training first.")
+        return None
+
+    with best_path.open("rb") as f:
+        neat_config, genome = pickle.load(f)
+
+    destination = export_genome(genome, neat_config, output or checkpoint_dir / "best-policy.npz")
+    print(f"Exported best policy to {destination}")
+    return destination
+
+
+def _restore_checkpoint(path: Path, app_config: AppConfig) -> neat.Population:
+    """Restore a population from a checkpoint and re-derive a seeded run's non-NEAT seeds."""
+
+    population = neat.Checkpointer.restore_checkpoint(str(path))
+    if isinstance(population.species, CachedSpeciesSet):
+        population.species.workers = app_config.population.speciation_workers
+    seed = run_seed(population.config)
+    if seed is not None:
+        # NEAT's RNG state comes back with the checkpoint; re-derive the rest.
+        apply_run_seed(seed, app_config, population.config)
+        print(f"Resuming seeded run (seed {seed})")
+    return population
+
+
+def resume_training(
+    render: bool = False,
+    config_path: Optional[Path] = None,
+    show_sensors: bool | None = None,
+    dashboard: Optional[str] = None,
+) -> None:
     """Resume training from the latest checkpoint."""
 
     app_config = load_config(config_path)
@@ -86,18 +433,78 @@ def resume_training(render: bool = False, config_path: Optional[Path] = None, sh
     latest = _find_latest_checkpoint(checkpoint_dir)
     if not latest:
         print("No checkpoint found; starting new training run.")
-        run_training(app_config.population.max_generations, render=render, config_path=config_path)
+        run_training(app_config.population.max_generations, render=render, config_path=config_path, dashboard=dashboard)
         return
 
     neat_config = _load_neat_config(app_config.neat_config_path)
-    population = neat.Checkpointer.restore_checkpoint(str(latest))
-    population.add_reporter(neat.StdOutReporter(True))
-    population.add_reporter(neat.StatisticsReporter())
-    population.add_reporter(neat.Checkpointer(app_config.population.checkpoint_interval, filename_prefix=str(checkpoint_dir / "neat-checkpoint-")))
-    population.run(lambda g, c: _evaluate_genomes(g, c, app_config, render, population.generation), app_config.population.max_generations)
+    population = _restore_checkpoint(latest, app_config)
+    server = _start_dashboard(dashboard, population)
+    evaluator = _GenerationEvaluator(population, app_config, render, server)
+    background = _add_reporters(population, app_config, evaluator.stats)
+    try:
+        _run_population(population, evaluator, app_config.population.max_generations, background)
+    finally:
+        if server:
+            server.stop()
+        if isinstance(population.species, CachedSpeciesSet):
+            population.species.close()
+
+
+def _seeded_run_stats(app_config: AppConfig, generations: int, seed: int) -> List[dict]:
+    """Train a fresh seeded population without checkpoints and return its generation stats."""
+
+    neat_config = _load_neat_config(app_config.neat_config_path, app_config.population.speciation_workers)
+    seed_run(seed, app_config, neat_config)
+    population = neat.Population(neat_config)
+    population.reporters.info = lambda message: None
+    stats = GenerationStatsReporter()
+    population.add_reporter(stats)
+    evaluator = _GenerationEvaluator(population, app_config, render=False)
+    try:
+        _run_population(population, evaluator, generations)
+    finally:
+        if isinstance(population.species, CachedSpeciesSet):
+            population.species.close()
+    return stats.records
+
+
+def check_reproducibility(
+    generations: int, seed: int, workers: Sequence[int] = (0, 0), config_path: Optional[Path] = None
+) -> bool:
+    """Run the same seeded training once per entry of `workers` and compare generation stats.
+
+    Each run uses that many evaluation workers, so `(0, 4)` checks serial
+    against sharded evaluation. Returns True when every run matches the first
+    bit for bit.
+    """
+
+    runs = []
+    for count in workers:
+        app_config = load_config(config_path)
+        app_config.population.evaluation_workers = count
+        # Wall-clock driven settings can never be reproduced.
+        app_config.population.generation_time_budget = 0.0
+        app_config.population.adaptive_max_steps = False
+        if max(workers) > 1:
+            # Sharded runs need independent agents, so every run in the comparison uses them.
+            app_config.simulation.agent_collisions = False
+        started = time.perf_counter()
+        runs.append(_seeded_run_stats(app_config, generations, seed))
+        print(f"Run {len(runs)} ({count} evaluation workers): {len(runs[-1])} generations in {time.perf_counter() - started:.1f}s")
+
+    identical = True
+    for index, records in enumerate(runs[1:], start=2):
+        difference = first_difference(runs[0], records)
+        if difference:
+            identical = False
+            print(f"Run {index} differs from run 1 at {difference}")
+    if identical:
+        print(f"All {len(runs)} runs produced identical generation stats (seed {seed}).")
+    return identical
 
 
 def _find_latest_checkpoint(directory: Path) -> Optional[Path]:
-    checkpoints = sorted(directory.glob("neat-checkpoint-*.pkl"))
-    return checkpoints[-1] if checkpoints else None
+    # neat.Checkpointer names files "<prefix><generation>" without an extension.
+    checkpoints = [p for p in directory.glob("neat-checkpoint-*") if p.name.rsplit("-", 1)[-1].isdigit()]
+    return max(checkpoints, key=lambda p: int(p.name.rsplit("-", 1)[-1])) if checkpoints else None
 
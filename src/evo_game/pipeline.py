@@ -0,0 +1,370 @@
+"""Pipelined NEAT generation loop with background checkpoints and reporting.
+
+`run_generations` is a drop-in for `neat.Population.run` that keeps the
+evaluators busy between generations: as soon as reproduction has produced the
+offspring, the fitness function may start evaluating them (see
+`_GenerationEvaluator.prefetch`) while the main thread speciates, reports and
+checkpoints. `BackgroundCheckpointer` and `BackgroundReporter` move file writes
+and statistics bookkeeping off the loop, and `PipelineStats` records where the
+loop still waits.
+"""
+from __future__ import annotations
+
+import copy
+import gzip
+import os
+import pickle
+import random
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, Iterator, Optional
+
+import neat
+from neat.population import CompleteExtinctionException
+from neat.reporting import BaseReporter
+
+STAGES = ("evaluate", "reproduce", "speciate", "report")
+# BaseReporter callbacks BackgroundReporter forwards.
+_CALLBACKS = (
+    "start_generation",
+    "end_generation",
+    "post_evaluate",
+    "post_reproduction",
+    "complete_extinction",
+    "found_solution",
+    "species_stagnant",
+    "info",
+)
+
+
+class PipelineStats:
+    """Wall-clock time per stage of the generation loop and evaluator utilization.
+
+    Main-loop stages add up to the loop's wall time. Evaluator busy time is
+    the compute time reported by the evaluators themselves (summed over worker
+    processes), so `1 - evaluators` is the share of evaluator capacity left
+    idle. Background work (checkpoint writes, reporters) overlaps the loop and
+    is reported separately.
+    """
+
+    def __init__(self, evaluators: int = 1) -> None:
+        self.evaluators = max(1, evaluators)
+        self.stage_seconds: Dict[str, float] = dict.fromkeys(STAGES, 0.0)
+        self.background_seconds: Dict[str, float] = {}
+        self.evaluator_seconds = 0.0
+        self.wall_seconds = 0.0
+        self.generations = 0
+        self._generation: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            self.stage_seconds[name] += elapsed
+            self._generation[name] = self._generation.get(name, 0.0) + elapsed
+
+    def add_evaluator_busy(self, seconds: float) -> None:
+        self.evaluator_seconds += seconds
+        self._generation["evaluators"] = self._generation.get("evaluators", 0.0) + seconds
+
+    def add_background(self, name: str, seconds: float) -> None:
+        """Record work done off the main loop (thread-safe)."""
+
+        with self._lock:
+            self.background_seconds[name] = self.background_seconds.get(name, 0.0) + seconds
+
+    def end_generation(self, wall_seconds: float) -> Dict[str, float]:
+        """Close one generation; returns its stage and evaluator shares of `wall_seconds`."""
+
+        self.wall_seconds += wall_seconds
+        self.generations += 1
+        shares = self._shares(self._generation, wall_seconds)
+        self._generation = {}
+        return shares
+
+    def utilization(self) -> Dict[str, float]:
+        """Stage and evaluator shares of the total wall time so far."""
+
+        return self._shares({**self.stage_seconds, "evaluators": self.evaluator_seconds}, self.wall_seconds)
+
+    def _shares(self, seconds: Dict[str, float], wall: float) -> Dict[str, float]:
+        if wall <= 0:
+            return {name: 0.0 for name in STAGES + ("evaluators",)}
+        shares = {name: seconds.get(name, 0.0) / wall for name in STAGES}
+        shares["evaluators"] = min(1.0, seconds.get("evaluators", 0.0) / (wall * self.evaluators))
+        return shares
+
+    def summary(self) -> str:
+        shares = self.utilization()
+        stages = " ".join(f"{name} {100 * shares[name]:.0f}%" for name in STAGES)
+        line = (
+            f"Pipeline over {self.generations} generations ({self.wall_seconds:.1f}s): "
+            f"evaluators busy {100 * shares['evaluators']:.0f}% ({self.evaluators}); main loop {stages}"
+        )
+        if self.background_seconds:
+            background = ", ".join(f"{name} {seconds:.2f}s" for name, seconds in sorted(self.background_seconds.items()))
+            line += f"; background {background}"
+        return line
+
+
+class _BackgroundWorker:
+    """A single thread running submitted jobs in order; job errors surface in `check`/`close`.
+
+    NEAT pickles its reporters along with the species set in every
+    checkpoint, so a worker pickles as an idle one (without its stats).
+    """
+
+    def __init__(self, name: str, stats: PipelineStats | None) -> None:
+        self.name = name
+        self.stats = stats
+        self._executor: ThreadPoolExecutor | None = None
+        self._last: Future | None = None
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {"name": self.name}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__init__(state["name"], None)
+
+    def submit(self, job: Callable[[], None]) -> None:
+        self.check()
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=self.name)
+        self._last = self._executor.submit(self._timed, job)
+
+    def _timed(self, job: Callable[[], None]) -> None:
+        started = time.perf_counter()
+        job()
+        if self.stats is not None:
+            self.stats.add_background(self.name, time.perf_counter() - started)
+
+    def check(self) -> None:
+        """Re-raise the error of the last finished job, if any."""
+
+        if self._last is not None and self._last.done():
+            self._last.result()
+
+    def wait(self) -> None:
+        """Wait for every queued job (they run in order) and re-raise the last one's error."""
+
+        if self._last is not None:
+            self._last.result()
+
+    def close(self) -> None:
+        """Wait for every queued job and re-raise the last one's error."""
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        if self._last is not None:
+            self._last.result()
+
+
+class BackgroundCheckpointer(neat.Checkpointer):
+    """`neat.Checkpointer` that compresses and writes checkpoints on a background thread.
+
+    The state is pickled on the calling thread, so the checkpoint holds exactly
+    the population, species and RNG state at the end of the generation. Files
+    are written under a temporary name and renamed, so `restore_checkpoint`
+    (and `_find_latest_checkpoint`) never see a partial file. Call `close()`
+    to wait for pending writes.
+    """
+
+    def __init__(
+        self,
+        generation_interval: Optional[int],
+        time_interval_seconds: Optional[float] = None,
+        filename_prefix: str = "neat-checkpoint-",
+        stats: PipelineStats | None = None,
+    ) -> None:
+        super().__init__(generation_interval, time_interval_seconds, filename_prefix)
+        self._writer = _BackgroundWorker("checkpoint", stats)
+
+    def save_checkpoint(self, config, population, species_set, generation) -> None:
+        filename = f"{self.filename_prefix}{generation}"
+        print(f"Saving checkpoint to {filename}")
+        data = pickle.dumps(
+            (generation, config, population, species_set, random.getstate()), protocol=pickle.HIGHEST_PROTOCOL
+        )
+        self._writer.submit(lambda: _write_gzip(filename, data))
+
+    def close(self) -> None:
+        self._writer.close()
+
+
+def _write_gzip(filename: str, data: bytes) -> None:
+    partial = f"{filename}.partial"
+    with gzip.open(partial, "wb", compresslevel=5) as f:
+        f.write(data)
+    os.replace(partial, filename)
+
+
+class BackgroundReporter(BaseReporter):
+    """Run another reporter's callbacks in order on a background thread.
+
+    Only the callbacks the wrapped reporter overrides are queued. The
+    population and species passed to them are frozen with shallow copies
+    first, because the loop reuses genome and species objects in later
+    generations. Only wrap reporters that do not read the wall clock (e.g.
+    `neat.StatisticsReporter`); `StdOutReporter` times generations between
+    callbacks and must stay inline. Pickling (NEAT checkpoints pickle the
+    reporters) waits for the queued callbacks, so the wrapped reporter is
+    never copied mid-update.
+    """
+
+    def __init__(self, reporter: BaseReporter, stats: PipelineStats | None = None) -> None:
+        self.reporter = reporter
+        self._worker = _BackgroundWorker(type(reporter).__name__, stats)
+        self._callbacks = frozenset(
+            name for name in _CALLBACKS if getattr(type(reporter), name) is not getattr(BaseReporter, name)
+        )
+
+    def __getstate__(self) -> Dict[str, Any]:
+        self._worker.wait()
+        return self.__dict__.copy()
+
+    def start_generation(self, generation):
+        if "start_generation" in self._callbacks:
+            self._worker.submit(lambda: self.reporter.start_generation(generation))
+
+    def end_generation(self, config, population, species_set):
+        if "end_generation" in self._callbacks:
+            population, species_set = _freeze(population, species_set)
+            self._worker.submit(lambda: self.reporter.end_generation(config, population, species_set))
+
+    def post_evaluate(self, config, population, species, best_genome):
+        if "post_evaluate" in self._callbacks:
+            frozen, species = _freeze(population, species)
+            best = frozen.get(best_genome.key, best_genome)
+            self._worker.submit(lambda: self.reporter.post_evaluate(config, frozen, species, best))
+
+    def post_reproduction(self, config, population, species):
+        if "post_reproduction" in self._callbacks:
+            population, species = _freeze(population, species)
+            self._worker.submit(lambda: self.reporter.post_reproduction(config, population, species))
+
+    def complete_extinction(self):
+        if "complete_extinction" in self._callbacks:
+            self._worker.submit(self.reporter.complete_extinction)
+
+    def found_solution(self, config, generation, best):
+        if "found_solution" in self._callbacks:
+            best = copy.copy(best)
+            self._worker.submit(lambda: self.reporter.found_solution(config, generation, best))
+
+    def species_stagnant(self, sid, species):
+        if "species_stagnant" in self._callbacks:
+            self._worker.submit(lambda: self.reporter.species_stagnant(sid, species))
+
+    def info(self, msg):
+        if "info" in self._callbacks:
+            self._worker.submit(lambda: self.reporter.info(msg))
+
+    def close(self) -> None:
+        self._worker.close()
+
+
+def _freeze(population: Dict[int, Any], species_set: Any) -> tuple[Dict[int, Any], Any]:
+    """Shallow copies of the genomes and species that later generations would mutate."""
+
+    genomes = {key: copy.copy(genome) for key, genome in population.items()}
+    species = {}
+    for sid, s in species_set.species.items():
+        frozen = copy.copy(s)
+        frozen.members = {key: genomes.get(key, member) for key, member in s.members.items()}
+        frozen.fitness_history = list(s.fitness_history)
+        species[sid] = frozen
+    return genomes, SimpleNamespace(species=species, genome_to_species=dict(species_set.genome_to_species))
+
+
+def run_generations(
+    population: neat.Population,
+    fitness_function: Callable[[list, neat.Config], None],
+    n: Optional[int] = None,
+    stats: PipelineStats | None = None,
+) -> Any:
+    """Run `population` like `neat.Population.run`, starting each evaluation early.
+
+    Right after reproduction (and extinction handling), when another generation
+    will follow, the offspring are handed to `fitness_function.prefetch(genomes,
+    config, generation)` if it exists; the fitness function is then called with
+    the same genomes after speciation and reporting, as in `Population.run`.
+    Reproduction, speciation and the RNG are untouched, so a seeded run gives
+    the same result pipelined or not. Stage timings go to `stats` and a share
+    summary is reported through `info` each generation.
+    """
+
+    config = population.config
+    if config.no_fitness_termination and n is None:
+        raise RuntimeError("Cannot have no generational limit with no fitness termination")
+    stats = stats or PipelineStats()
+    prefetch = getattr(fitness_function, "prefetch", None)
+
+    k = 0
+    while n is None or k < n:
+        k += 1
+        started = time.perf_counter()
+        population.reporters.start_generation(population.generation)
+
+        with stats.stage("evaluate"):
+            fitness_function(list(population.population.items()), config)
+
+        with stats.stage("report"):
+            best = None
+            for g in population.population.values():
+                if g.fitness is None:
+                    raise RuntimeError(f"Fitness not assigned to genome {g.key}")
+                if best is None or g.fitness > best.fitness:
+                    best = g
+            population.reporters.post_evaluate(config, population.population, population.species, best)
+
+        if population.best_genome is None or best.fitness > population.best_genome.fitness:
+            population.best_genome = best
+
+        if not config.no_fitness_termination:
+            fv = population.fitness_criterion(g.fitness for g in population.population.values())
+            if fv >= config.fitness_threshold:
+                stats.end_generation(time.perf_counter() - started)
+                population.reporters.found_solution(config, population.generation, best)
+                break
+
+        with stats.stage("reproduce"):
+            population.population = population.reproduction.reproduce(
+                config, population.species, config.pop_size, population.generation
+            )
+            if not population.species.species:
+                population.reporters.complete_extinction()
+                if config.reset_on_extinction:
+                    population.population = population.reproduction.create_new(
+                        config.genome_type, config.genome_config, config.pop_size
+                    )
+                else:
+                    raise CompleteExtinctionException()
+
+        if prefetch is not None and (n is None or k < n):
+            prefetch(list(population.population.items()), config, population.generation + 1)
+
+        with stats.stage("speciate"):
+            population.species.speciate(config, population.population, population.generation)
+
+        with stats.stage("report"):
+            population.reporters.end_generation(config, population.population, population.species)
+
+        shares = stats.end_generation(time.perf_counter() - started)
+        population.reporters.info(
+            f"Pipeline: evaluators busy {100 * shares['evaluators']:.0f}%, main loop "
+            + " ".join(f"{name} {100 * shares[name]:.0f}%" for name in STAGES)
+        )
+        population.generation += 1
+
+    if config.no_fitness_termination:
+        population.reporters.found_solution(config, population.generation, population.best_genome)
+
+    return population.best_genome
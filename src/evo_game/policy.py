@@ -0,0 +1,428 @@
+"""Compact NumPy policy format and a NEAT-free inference runtime.
+
+A compiled policy stores a genome's expressed network as flat, topologically
+ordered arrays. Loading one only needs NumPy, so playback and batch inference
+never have to unpickle a `neat.Config` or build `FeedForwardNetwork` objects.
+"""
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+FORMAT_VERSION = 1
+
+
+def _sigmoid(z: np.ndarray) -> np.ndarray:
+    return 1.0 / (1.0 + np.exp(-np.clip(5.0 * z, -60.0, 60.0)))
+
+
+def _inv(z: np.ndarray) -> np.ndarray:
+    with np.errstate(divide="ignore", over="ignore"):
+        out = 1.0 / z
+    return np.where(np.isfinite(out), out, 0.0)
+
+
+def _selu(z: np.ndarray) -> np.ndarray:
+    lam = 1.0507009873554804934193349852946
+    alpha = 1.6732632423543772848170429916717
+    return np.where(z > 0.0, lam * z, lam * alpha * (np.exp(np.minimum(z, 0.0)) - 1))
+
+
+# Vectorized equivalents of neat-python's built-in activation functions. The
+# position of each name is its integer code in compiled policies.
+ACTIVATIONS: Dict[str, Callable[[np.ndarray], np.ndarray]] = {
+    "sigmoid": _sigmoid,
+    "tanh": lambda z: np.tanh(np.clip(2.5 * z, -60.0, 60.0)),
+    "sin": lambda z: np.sin(np.clip(5.0 * z, -60.0, 60.0)),
+    "gauss": lambda z: np.exp(-5.0 * np.clip(z, -3.4, 3.4) ** 2),
+    "relu": lambda z: np.where(z > 0.0, z, 0.0),
+    "elu": lambda z: np.where(z > 0.0, z, np.exp(np.minimum(z, 0.0)) - 1),
+    "lelu": lambda z: np.where(z > 0.0, z, 0.005 * z),
+    "selu": _selu,
+    "softplus": lambda z: 0.2 * np.log(1 + np.exp(np.clip(5.0 * z, -60.0, 60.0))),
+    "identity": lambda z: z,
+    "clamped": lambda z: np.clip(z, -1.0, 1.0),
+    "inv": _inv,
+    "log": lambda z: np.log(np.maximum(z, 1e-7)),
+    "exp": lambda z: np.exp(np.clip(z, -60.0, 60.0)),
+    "abs": np.abs,
+    "hat": lambda z: np.maximum(0.0, 1 - np.abs(z)),
+    "square": lambda z: z**2,
+    "cube": lambda z: z**3,
+}
+ACTIVATION_NAMES = tuple(ACTIVATIONS)
+
+_ARRAY_FIELDS = (
+    "output_slots",
+    "node_slots",
+    "node_bias",
+    "node_response",
+    "node_activation",
+    "conn_ptr",
+    "conn_src",
+    "conn_weight",
+)
+
+
+@dataclass(eq=False)
+class CompiledPolicy:
+    """Flat array representation of one evolved network.
+
+    Slots `0..num_inputs-1` hold the inputs, every evaluated node writes one
+    slot, and any node that is never evaluated keeps a constant zero slot.
+    Node `i` reads the connections `conn_ptr[i]:conn_ptr[i + 1]`.
+    """
+
+    num_inputs: int
+    num_slots: int
+    output_slots: np.ndarray
+    node_slots: np.ndarray
+    node_bias: np.ndarray
+    node_response: np.ndarray
+    node_activation: np.ndarray
+    conn_ptr: np.ndarray
+    conn_src: np.ndarray
+    conn_weight: np.ndarray
+    feed_forward: bool = True
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    _runtime: Optional["PolicyBatch"] = field(default=None, init=False, repr=False)
+
+    @property
+    def num_outputs(self) -> int:
+        return int(self.output_slots.shape[0])
+
+    @property
+    def num_nodes(self) -> int:
+        return int(self.node_slots.shape[0])
+
+    def activate(self, inputs: Sequence[float]) -> List[float]:
+        """Evaluate the policy for one input vector (neat `activate` compatible)."""
+
+        if len(inputs) != self.num_inputs:
+            raise RuntimeError(f"Expected {self.num_inputs} inputs, got {len(inputs)}")
+        if self._runtime is None:
+            self._runtime = PolicyBatch([self]) if self.feed_forward else RecurrentBatch([self])
+        return self._runtime.activate(np.asarray(inputs, dtype=np.float64)[None, :])[0].tolist()
+
+    def reset(self) -> None:
+        """Clear recurrent state (no-op for feed-forward policies)."""
+
+        if isinstance(self._runtime, RecurrentBatch):
+            self._runtime.reset()
+
+
+def compile_genome(genome: Any, neat_config: Any, metadata: Optional[Dict[str, Any]] = None) -> CompiledPolicy:
+    """Compile a NEAT genome into a `CompiledPolicy`.
+
+    The node order and per-node link order are taken from neat-python's own
+    network builder (`FeedForwardNetwork` or `RecurrentNetwork`, following the
+    genome config) so the compiled policy sums inputs in the same order.
+    """
+
+    from neat.nn import FeedForwardNetwork, RecurrentNetwork
+
+    genome_config = neat_config.genome_config
+    feed_forward = bool(genome_config.feed_forward)
+    network_type = FeedForwardNetwork if feed_forward else RecurrentNetwork
+    network = network_type.create(genome, neat_config)
+
+    input_keys = list(genome_config.input_keys)
+    slots: Dict[int, int] = {key: i for i, key in enumerate(input_keys)}
+    for node_key, *_ in network.node_evals:
+        slots[node_key] = len(slots)
+
+    def slot_for(key: int) -> int:
+        # Nodes that are referenced but never evaluated read as a constant 0.0.
+        if key not in slots:
+            slots[key] = len(slots)
+        return slots[key]
+
+    node_slots, bias, response, activation = [], [], [], []
+    conn_ptr, conn_src, conn_weight = [0], [], []
+    for node_key, _, _, node_bias, node_response, links in network.node_evals:
+        gene = genome.nodes[node_key]
+        if gene.aggregation != "sum":
+            raise ValueError(f"Unsupported aggregation {gene.aggregation!r} on node {node_key}; only 'sum' is compiled.")
+        if gene.activation not in ACTIVATIONS:
+            raise ValueError(f"Unsupported activation {gene.activation!r} on node {node_key}.")
+        node_slots.append(slots[node_key])
+        bias.append(node_bias)
+        response.append(node_response)
+        activation.append(ACTIVATION_NAMES.index(gene.activation))
+        for src, weight in links:
+            conn_src.append(slot_for(src))
+            conn_weight.append(weight)
+        conn_ptr.append(len(conn_src))
+
+    output_slots = [slot_for(key) for key in genome_config.output_keys]
+
+    info: Dict[str, Any] = {
+        "genome_key": getattr(genome, "key", None),
+        "fitness": getattr(genome, "fitness", None),
+    }
+    info.update(metadata or {})
+    return CompiledPolicy(
+        num_inputs=len(input_keys),
+        num_slots=len(slots),
+        output_slots=np.asarray(output_slots, dtype=np.int32),
+        node_slots=np.asarray(node_slots, dtype=np.int32),
+        node_bias=np.asarray(bias, dtype=np.float64),
+        node_response=np.asarray(response, dtype=np.float64),
+        node_activation=np.asarray(activation, dtype=np.int16),
+        conn_ptr=np.asarray(conn_ptr, dtype=np.int32),
+        conn_src=np.asarray(conn_src, dtype=np.int32),
+        conn_weight=np.asarray(conn_weight, dtype=np.float64),
+        feed_forward=feed_forward,
+        metadata=info,
+    )
+
+
+def save_policy(policy: CompiledPolicy, path: Path | str) -> Path:
+    """Write a compiled policy to a single compressed `.npz` file."""
+
+    destination = Path(path)
+    header = {
+        "format_version": FORMAT_VERSION,
+        "num_inputs": policy.num_inputs,
+        "num_slots": policy.num_slots,
+        "feed_forward": policy.feed_forward,
+        "activations": list(ACTIVATION_NAMES),
+        "metadata": policy.metadata,
+    }
+    arrays = {name: getattr(policy, name) for name in _ARRAY_FIELDS}
+    with destination.open("wb") as f:
+        np.savez_compressed(f, header=np.array(json.dumps(header)), **arrays)
+    return destination
+
+
+def load_policy(path: Path | str) -> CompiledPolicy:
+    """Load a policy written by `save_policy`."""
+
+    with np.load(Path(path), allow_pickle=False) as data:
+        header = json.loads(str(data["header"]))
+        if header.get("format_version") != FORMAT_VERSION:
+            raise ValueError(f"Unsupported policy format version {header.get('format_version')!r}")
+        arrays = {name: data[name] for name in _ARRAY_FIELDS}
+
+    # Remap activation codes in case the name table changed since export.
+    saved_names = header["activations"]
+    remap = np.asarray([ACTIVATION_NAMES.index(name) for name in saved_names], dtype=np.int16)
+    arrays["node_activation"] = remap[arrays["node_activation"]]
+    return CompiledPolicy(
+        num_inputs=int(header["num_inputs"]),
+        num_slots=int(header["num_slots"]),
+        feed_forward=bool(header["feed_forward"]),
+        metadata=header.get("metadata", {}),
+        **arrays,
+    )
+
+
+def export_genome(genome: Any, neat_config: Any, path: Path | str, metadata: Optional[Dict[str, Any]] = None) -> Path:
+    """Compile a genome and save it as a `.npz` policy."""
+
+    return save_policy(compile_genome(genome, neat_config, metadata), path)
+
+
+def _activation_groups(codes: np.ndarray) -> List[tuple[Callable[[np.ndarray], np.ndarray], Optional[np.ndarray]]]:
+    """Split node activation codes into (function, index) groups; index None means all nodes."""
+
+    unique_codes = np.unique(codes)
+    if len(unique_codes) == 1:
+        return [(ACTIVATIONS[ACTIVATION_NAMES[unique_codes[0]]], None)]
+    return [(ACTIVATIONS[ACTIVATION_NAMES[code]], np.flatnonzero(codes == code)) for code in unique_codes]
+
+
+def _apply_activations(z: np.ndarray, groups: List[tuple[Callable[[np.ndarray], np.ndarray], Optional[np.ndarray]]]) -> np.ndarray:
+    for function, index in groups:
+        if index is None:
+            z = function(z)
+        else:
+            z[index] = function(z[index])
+    return z
+
+
+@dataclass
+class _Level:
+    node_flat: np.ndarray
+    bias: np.ndarray
+    response: np.ndarray
+    conn_src_flat: np.ndarray
+    conn_dst: np.ndarray
+    conn_weight: np.ndarray
+    activation_groups: List[tuple[Callable[[np.ndarray], np.ndarray], Optional[np.ndarray]]]
+
+
+class PolicyBatch:
+    """Evaluate many compiled feed-forward policies in one vectorized pass.
+
+    Node values for the whole batch live in a `(num_policies, width)` array.
+    Nodes are grouped by depth across all policies, so one activation costs a
+    handful of NumPy operations per network layer instead of per node.
+    """
+
+    def __init__(self, policies: Sequence[CompiledPolicy]) -> None:
+        if not policies:
+            raise ValueError("PolicyBatch needs at least one policy.")
+        num_inputs = policies[0].num_inputs
+        num_outputs = policies[0].num_outputs
+        for policy in policies:
+            if not policy.feed_forward:
+                raise ValueError("PolicyBatch only evaluates feed-forward policies.")
+            if policy.num_inputs != num_inputs or policy.num_outputs != num_outputs:
+                raise ValueError("All policies in a batch must share input and output sizes.")
+
+        self.num_policies = len(policies)
+        self.num_inputs = num_inputs
+        self.num_outputs = num_outputs
+        self.width = max(p.num_slots for p in policies)
+        self.values = np.zeros((self.num_policies, self.width), dtype=np.float64)
+        self.output_flat = np.stack(
+            [row * self.width + p.output_slots for row, p in enumerate(policies)]
+        ).astype(np.intp)
+        self.levels = self._build_levels(policies)
+
+    def _build_levels(self, policies: Sequence[CompiledPolicy]) -> List[_Level]:
+        per_level: Dict[int, list] = {}
+        for row, policy in enumerate(policies):
+            base = row * self.width
+            depth = np.zeros(policy.num_slots, dtype=np.int64)
+            for i in range(policy.num_nodes):
+                start, end = policy.conn_ptr[i], policy.conn_ptr[i + 1]
+                sources = policy.conn_src[start:end]
+                level = int(depth[sources].max()) + 1 if end > start else 1
+                depth[policy.node_slots[i]] = level
+                per_level.setdefault(level, []).append((base, policy, i, start, end))
+
+        levels: List[_Level] = []
+        for level in sorted(per_level):
+            entries = per_level[level]
+            node_flat, bias, response, codes = [], [], [], []
+            src_flat, dst, weight = [], [], []
+            for local, (base, policy, i, start, end) in enumerate(entries):
+                node_flat.append(base + policy.node_slots[i])
+                bias.append(policy.node_bias[i])
+                response.append(policy.node_response[i])
+                codes.append(policy.node_activation[i])
+                src_flat.append(base + policy.conn_src[start:end])
+                dst.append(np.full(end - start, local, dtype=np.intp))
+                weight.append(policy.conn_weight[start:end])
+
+            levels.append(
+                _Level(
+                    node_flat=np.asarray(node_flat, dtype=np.intp),
+                    bias=np.asarray(bias, dtype=np.float64),
+                    response=np.asarray(response, dtype=np.float64),
+                    conn_src_flat=np.concatenate(src_flat).astype(np.intp),
+                    conn_dst=np.concatenate(dst),
+                    conn_weight=np.concatenate(weight),
+                    activation_groups=_activation_groups(np.asarray(codes)),
+                )
+            )
+        return levels
+
+    def activate(self, inputs: np.ndarray) -> np.ndarray:
+        """Map a `(num_policies, num_inputs)` array to `(num_policies, num_outputs)`."""
+
+        inputs = np.asarray(inputs, dtype=np.float64)
+        if inputs.shape != (self.num_policies, self.num_inputs):
+            raise RuntimeError(
+                f"Expected inputs of shape {(self.num_policies, self.num_inputs)}, got {inputs.shape}"
+            )
+        self.values[:, : self.num_inputs] = inputs
+        flat = self.values.reshape(-1)
+        for level in self.levels:
+            contributions = flat[level.conn_src_flat] * level.conn_weight
+            sums = np.bincount(level.conn_dst, weights=contributions, minlength=level.node_flat.shape[0])
+            flat[level.node_flat] = _apply_activations(level.bias + level.response * sums, level.activation_groups)
+        return flat[self.output_flat]
+
+
+class RecurrentBatch:
+    """Evaluate many compiled recurrent policies with persistent state.
+
+    Follows neat-python's `RecurrentNetwork` semantics: every node is updated
+    synchronously from the previous tick's values (with the current inputs
+    written in), so one tick of the whole population is a single gather,
+    `bincount` and activation pass. State lives in two `(num_policies, width)`
+    buffers that are swapped each tick; `reset()` clears it between episodes.
+    """
+
+    def __init__(self, policies: Sequence[CompiledPolicy]) -> None:
+        if not policies:
+            raise ValueError("RecurrentBatch needs at least one policy.")
+        num_inputs = policies[0].num_inputs
+        num_outputs = policies[0].num_outputs
+        for policy in policies:
+            if policy.feed_forward:
+                raise ValueError("RecurrentBatch only evaluates recurrent policies.")
+            if policy.num_inputs != num_inputs or policy.num_outputs != num_outputs:
+                raise ValueError("All policies in a batch must share input and output sizes.")
+
+        self.num_policies = len(policies)
+        self.num_inputs = num_inputs
+        self.num_outputs = num_outputs
+        self.width = max(p.num_slots for p in policies)
+        self.buffers = [np.zeros((self.num_policies, self.width), dtype=np.float64) for _ in range(2)]
+        self.active = 0
+
+        node_flat, src_flat, dst, codes = [], [], [], []
+        node_count = 0
+        for row, policy in enumerate(policies):
+            base = row * self.width
+            node_flat.append(base + policy.node_slots)
+            src_flat.append(base + policy.conn_src)
+            dst.append(node_count + np.repeat(np.arange(policy.num_nodes), np.diff(policy.conn_ptr)))
+            codes.append(policy.node_activation)
+            node_count += policy.num_nodes
+
+        self.node_count = node_count
+        self.node_flat = np.concatenate(node_flat).astype(np.intp)
+        self.node_bias = np.concatenate([p.node_bias for p in policies])
+        self.node_response = np.concatenate([p.node_response for p in policies])
+        self.conn_src_flat = np.concatenate(src_flat).astype(np.intp)
+        self.conn_dst = np.concatenate(dst).astype(np.intp)
+        self.conn_weight = np.concatenate([p.conn_weight for p in policies])
+        self.activation_groups = _activation_groups(np.concatenate(codes)) if node_count else []
+        self.output_flat = np.stack(
+            [row * self.width + p.output_slots for row, p in enumerate(policies)]
+        ).astype(np.intp)
+
+    @property
+    def state(self) -> np.ndarray:
+        """Node values after the most recent tick, shape `(num_policies, width)`."""
+
+        return self.buffers[self.active]
+
+    def reset(self, rows: Optional[Sequence[int]] = None) -> None:
+        """Zero the state of every policy, or only of the given rows."""
+
+        for buffer in self.buffers:
+            if rows is None:
+                buffer.fill(0.0)
+            else:
+                buffer[np.asarray(rows, dtype=np.intp)] = 0.0
+
+    def activate(self, inputs: np.ndarray) -> np.ndarray:
+        """Advance every network one tick; maps `(P, num_inputs)` to `(P, num_outputs)`."""
+
+        inputs = np.asarray(inputs, dtype=np.float64)
+        if inputs.shape != (self.num_policies, self.num_inputs):
+            raise RuntimeError(
+                f"Expected inputs of shape {(self.num_policies, self.num_inputs)}, got {inputs.shape}"
+            )
+        current = self.buffers[self.active]
+        nxt = self.buffers[1 - self.active]
+        self.active = 1 - self.active
+        current[:, : self.num_inputs] = inputs
+        nxt[:, : self.num_inputs] = inputs
+
+        if self.node_count:
+            contributions = current.reshape(-1)[self.conn_src_flat] * self.conn_weight
+            sums = np.bincount(self.conn_dst, weights=contributions, minlength=self.node_count)
+            z = self.node_bias + self.node_response * sums
+            nxt.reshape(-1)[self.node_flat] = _apply_activations(z, self.activation_groups)
+        return nxt.reshape(-1)[self.output_flat]
@@ -62,11 +62,11 @@ class Renderer:
             pygame.draw.line(self.screen, (200, 200, 200), a, b, 3)
 
         for obstacle in self.world.obstacles:
-            points = [self._to_screen(p) for p in obstacle.get_vertices()]  # type: ignore[arg-type]
+            points = [self._to_screen(p + obstacle.body.position) for p in obstacle.get_vertices()]  # type: ignore[arg-type]
             pygame.draw.polygon(self.screen, (100, 120, 200), points)
 
         for hazard in self.world.hazards:
-            points = [self._to_screen(p) for p in hazard.get_vertices()]  # type: ignore[arg-type]
+            points = [self._to_screen(p + hazard.body.position) for p in hazard.get_vertices()]  # type: ignore[arg-type]
             pygame.draw.polygon(self.screen, (200, 90, 60), points)
 
         if self.world.settings.target_motion_amplitude > 0:
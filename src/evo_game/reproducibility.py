@@ -0,0 +1,129 @@
+"""Root seeds and generation statistics for reproducible training runs.
+
+Every random stream in a run is derived from one root seed: NEAT's use of the
+global `random` module, the episode variants, and the RNGs of each
+evaluation (in-process or in a worker). `GenerationStatsReporter` records
+exact per-generation statistics so two runs can be compared bit for bit.
+"""
+from __future__ import annotations
+
+import hashlib
+import math
+import random
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+import numpy as np
+from neat.reporting import BaseReporter
+
+from .config import AppConfig
+
+
+def derive_seed(root: int, *labels: Any) -> int:
+    """A 63-bit seed for the stream named by `labels`, derived from `root`."""
+
+    digest = hashlib.sha256(repr((root,) + labels).encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "little") >> 1
+
+
+def seed_process(seed: int) -> None:
+    """Seed the global `random` and NumPy generators of the current process."""
+
+    random.seed(seed)
+    np.random.seed(seed % 2**32)
+
+
+@contextmanager
+def isolated_rng(seed: Optional[int]) -> Iterator[None]:
+    """Seed the global RNGs for a block and restore their previous state after it.
+
+    Used for in-process evaluation so it neither consumes nor perturbs NEAT's
+    random stream. Does nothing when `seed` is None.
+    """
+
+    if seed is None:
+        yield
+        return
+    python_state, numpy_state = random.getstate(), np.random.get_state()
+    seed_process(seed)
+    try:
+        yield
+    finally:
+        random.setstate(python_state)
+        np.random.set_state(numpy_state)
+
+
+def seed_run(seed: int, app_config: AppConfig, neat_config: Any) -> None:
+    """Seed a new run: NEAT's global RNG and the episode variants.
+
+    The root seed is stored on the NEAT config so checkpoints (which pickle
+    the config along with the RNG state) record it.
+    """
+
+    random.seed(derive_seed(seed, "neat"))
+    apply_run_seed(seed, app_config, neat_config)
+
+
+def apply_run_seed(seed: int, app_config: AppConfig, neat_config: Any) -> None:
+    """Derive the non-NEAT seeds of a run; used when starting and resuming."""
+
+    app_config.episodes.seed = derive_seed(seed, "episodes")
+    neat_config.run_seed = seed
+
+
+def run_seed(neat_config: Any) -> Optional[int]:
+    """The root seed recorded on a (possibly restored) NEAT config, if any."""
+
+    return getattr(neat_config, "run_seed", None)
+
+
+def _hex(value: float) -> str:
+    return float(value).hex()
+
+
+class GenerationStatsReporter(BaseReporter):
+    """Record exact fitness and species statistics for every generation.
+
+    Floats are stored with `float.hex`, and `digest` hashes every genome's key
+    and fitness, so equal records mean bitwise-equal evaluations.
+    """
+
+    def __init__(self) -> None:
+        self.records: List[Dict[str, Any]] = []
+        self._generation = 0
+
+    def start_generation(self, generation: int) -> None:
+        self._generation = generation
+
+    def post_evaluate(self, config: Any, population: Dict[int, Any], species: Any, best_genome: Any) -> None:
+        pairs = sorted((key, genome.fitness) for key, genome in population.items())
+        fitnesses = [fitness for _, fitness in pairs]
+        mean = math.fsum(fitnesses) / len(fitnesses)
+        variance = math.fsum((f - mean) ** 2 for f in fitnesses) / len(fitnesses)
+        digest = hashlib.sha256(repr([(key, _hex(f)) for key, f in pairs]).encode("utf-8")).hexdigest()
+        self.records.append(
+            {
+                "generation": self._generation,
+                "best_key": best_genome.key,
+                "best": _hex(best_genome.fitness),
+                "mean": _hex(mean),
+                "stdev": _hex(math.sqrt(variance)),
+                "digest": digest,
+            }
+        )
+
+    def end_generation(self, config: Any, population: Dict[int, Any], species_set: Any) -> None:
+        if self.records:
+            self.records[-1]["species"] = sorted((sid, len(s.members)) for sid, s in species_set.species.items())
+
+
+def first_difference(a: List[Dict[str, Any]], b: List[Dict[str, Any]]) -> Optional[str]:
+    """Describe the first mismatch between two runs' records, or None if identical."""
+
+    for left, right in zip(a, b):
+        for field in sorted(left.keys() | right.keys()):
+            if left.get(field) != right.get(field):
+                return f"generation {left.get('generation')}: {field} {left.get(field)!r} != {right.get(field)!r}"
+    if len(a) != len(b):
+        return f"runs have {len(a)} and {len(b)} generations"
+    return None
@@ -0,0 +1,224 @@
+"""Population scaling and memory profiling harness.
+
+Runs short seeded trainings at a ladder of population sizes and records, per
+generation, the wall-clock time and `tracemalloc` peak of each stage
+(evaluation, reproduction, speciation), plus the top allocation sites inside
+the simulation and NEAT code. The result is a JSON-friendly scaling curve.
+"""
+from __future__ import annotations
+
+import functools
+import json
+import random
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import neat
+
+from .config import load_config
+from .neat_runner import _load_neat_config
+from .simulation import Simulation
+
+STAGES = ("evaluation", "reproduction", "speciation")
+
+# Enough frames to reach our code from inside pymunk/cffi allocation calls.
+_TRACE_FRAMES = 12
+
+# Allocations are attributed to the innermost frame from one of these files.
+_TRACKED_FILES = {
+    "evaluation": ("evo_game/simulation.py", "evo_game/agent.py", "evo_game/world.py", "evo_game/policy.py"),
+    "reproduction": ("neat/reproduction.py", "neat/genome.py", "neat/genes.py", "neat/stagnation.py"),
+    "speciation": ("evo_game/speciation.py", "neat/species.py", "neat/genome.py", "neat/genes.py"),
+}
+
+
+def _top_sites(
+    after: tracemalloc.Snapshot, before: tracemalloc.Snapshot, tracked: Tuple[str, ...], limit: int
+) -> List[Dict[str, Any]]:
+    """Largest allocations made between `before` and `after`, by closest tracked line.
+
+    The snapshots are compared per traceback rather than per `lineno`, so
+    memory allocated inside pymunk or neat is still charged to the line in our
+    tracked files that called into it.
+    """
+
+    sites: Dict[Tuple[str, int], List[int]] = {}
+    for diff in after.compare_to(before, "traceback"):
+        if diff.size_diff <= 0:
+            continue
+        # Frames are ordered oldest first; walk inwards to the closest tracked frame.
+        for frame in reversed(diff.traceback):
+            filename = frame.filename.replace("\\", "/")
+            if any(filename.endswith(suffix) for suffix in tracked):
+                entry = sites.setdefault((filename, frame.lineno), [0, 0])
+                entry[0] += diff.size_diff
+                entry[1] += max(diff.count_diff, 0)
+                break
+
+    ranked = sorted(sites.items(), key=lambda item: item[1][0], reverse=True)[:limit]
+    return [
+        {"file": "/".join(Path(filename).parts[-2:]), "line": lineno, "bytes": size, "count": count}
+        for (filename, lineno), (size, count) in ranked
+    ]
+
+
+class _StageProfiler:
+    """Times each stage and, when tracing, captures its memory peak and allocation sites."""
+
+    def __init__(self, trace: bool, top_n: int) -> None:
+        self.trace = trace
+        self.top_n = top_n
+        self.current: Dict[str, Any] = {}
+        self.sites: Dict[str, List[Dict[str, Any]]] = {}
+        self._before: Dict[str, tracemalloc.Snapshot] = {}
+
+    def measure(self, stage: str, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        if not self.trace:
+            started = time.perf_counter()
+            result = func(*args, **kwargs)
+            self.current[f"{stage}_seconds"] = time.perf_counter() - started
+            return result
+
+        self._before[stage] = tracemalloc.take_snapshot()
+        tracemalloc.reset_peak()
+        base, _ = tracemalloc.get_traced_memory()
+        result = func(*args, **kwargs)
+        self.current[f"{stage}_peak_bytes"] = tracemalloc.get_traced_memory()[1] - base
+        return result
+
+    def capture_sites(self, stage: str) -> None:
+        if self.trace:
+            after = tracemalloc.take_snapshot()
+            self.sites[stage] = _top_sites(after, self._before[stage], _TRACKED_FILES[stage], self.top_n)
+
+    def wrap(self, stage: str, func: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            result = self.measure(stage, func, *args, **kwargs)
+            self.capture_sites(stage)
+            return result
+
+        return wrapper
+
+
+def _profile_run(
+    population_size: int,
+    generations: int,
+    max_steps: int,
+    seed: int,
+    config_path: Optional[Path],
+    profiler: _StageProfiler,
+) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+    app_config = load_config(config_path)
+    app_config.simulation.max_steps = max_steps
+    app_config.population.population_size = population_size
+    neat_config = _load_neat_config(app_config.neat_config_path)
+    neat_config.pop_size = population_size
+    neat_config.fitness_threshold = float("inf")  # never stop early while profiling
+
+    random.seed(seed)
+    population = profiler.measure("setup", neat.Population, neat_config)
+    setup = dict(profiler.current)
+    population.reproduction.reproduce = profiler.wrap("reproduction", population.reproduction.reproduce)
+    population.species.speciate = profiler.wrap("speciation", population.species.speciate)
+
+    records: List[Dict[str, Any]] = []
+
+    def evaluate(genomes, config) -> None:
+        profiler.current = {"generation": population.generation}
+        records.append(profiler.current)
+
+        def run_simulation() -> None:
+            simulation = Simulation(genomes, config, app_config, generation=population.generation)
+            simulation.run()
+            # Capture while the world and agents are still alive.
+            profiler.capture_sites("evaluation")
+
+        profiler.measure("evaluation", run_simulation)
+
+    population.run(evaluate, generations)
+    return setup, records
+
+
+def profile_population_size(
+    population_size: int,
+    generations: int = 3,
+    max_steps: int = 120,
+    seed: int = 0,
+    config_path: Optional[Path] = None,
+    top_n: int = 10,
+) -> Dict[str, Any]:
+    """Profile a short seeded training run at one population size.
+
+    The run is done twice with the same seed: once untraced for timings and
+    once under `tracemalloc` for memory, since tracing distorts wall-clock time.
+    """
+
+    timer = _StageProfiler(trace=False, top_n=top_n)
+    setup, records = _profile_run(population_size, generations, max_steps, seed, config_path, timer)
+
+    tracer = _StageProfiler(trace=True, top_n=top_n)
+    tracemalloc.start(_TRACE_FRAMES)
+    try:
+        memory_setup, memory_records = _profile_run(population_size, generations, max_steps, seed, config_path, tracer)
+        traced_peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    setup.update(memory_setup)
+    for record, memory in zip(records, memory_records):
+        record.update(memory)
+
+    generation_seconds = [sum(r.get(f"{stage}_seconds", 0.0) for stage in STAGES) for r in records]
+    stage_peaks = [r.get(f"{stage}_peak_bytes", 0) for r in records for stage in STAGES]
+    return {
+        "population_size": population_size,
+        "setup_seconds": setup["setup_seconds"],
+        "setup_peak_bytes": setup["setup_peak_bytes"],
+        "mean_generation_seconds": sum(generation_seconds) / len(generation_seconds) if generation_seconds else 0.0,
+        "peak_bytes": max([setup["setup_peak_bytes"]] + stage_peaks),
+        "traced_peak_bytes": traced_peak,
+        "generations": records,
+        "top_sites": tracer.sites,
+    }
+
+
+def run_scaling(
+    population_sizes: Sequence[int],
+    generations: int = 3,
+    max_steps: int = 120,
+    seed: int = 0,
+    config_path: Optional[Path] = None,
+    top_n: int = 10,
+    output: Optional[Path] = None,
+) -> Dict[str, Any]:
+    """Profile each population size in turn and optionally write the curve as JSON."""
+
+    results = []
+    for size in population_sizes:
+        result = profile_population_size(size, generations, max_steps, seed, config_path, top_n)
+        results.append(result)
+        print(
+            f"pop {size:>6}: {result['mean_generation_seconds']:.3f}s/generation, "
+            f"peak {result['peak_bytes'] / 2**20:.1f} MiB"
+        )
+
+    report = {
+        "seed": seed,
+        "generations": generations,
+        "max_steps": max_steps,
+        "curve": [
+            {
+                "population_size": r["population_size"],
+                "mean_generation_seconds": r["mean_generation_seconds"],
+                "peak_bytes": r["peak_bytes"],
+            }
+            for r in results
+        ],
+        "results": results,
+    }
+    if output is not None:
+        Path(output).write_text(json.dumps(report, indent=2))
+    return report
@@ -1,49 +1,164 @@
 """Simulation loop for a single generation."""
 from __future__ import annotations
 
-from typing import Iterable, List, Tuple
+import copy
+import time
+from typing import Iterable, List, Sequence, Tuple
 
 import neat
+import numpy as np
 
 from .agent import Agent
 from .config import AppConfig
+from .dashboard import DashboardServer
+from .kernel import FusedTicker
+from .policy import CompiledPolicy, RecurrentBatch, compile_genome
 from .render import Renderer
-from .world import World
+from .task import PopulationState, ReachTargetTask, Task, make_task
+from .world import World, WorldSnapshot, load_snapshot, world_variants
 
 
 class Simulation:
     """Runs a population of agents through a physics simulation."""
 
-    def __init__(self, genomes: Iterable[Tuple[int, neat.DefaultGenome]], neat_config: neat.Config, app_config: AppConfig, render: bool = False, generation: int = 0) -> None:
+    def __init__(
+        self,
+        genomes: Iterable[Tuple[int, neat.DefaultGenome]],
+        neat_config: neat.Config | None,
+        app_config: AppConfig,
+        render: bool = False,
+        generation: int = 0,
+        policies: Sequence[CompiledPolicy] | None = None,
+        dashboard: DashboardServer | None = None,
+        task: Task | None = None,
+        snapshot: WorldSnapshot | None = None,
+        world: World | None = None,
+    ) -> None:
         self.genomes = list(genomes)
         self.neat_config = neat_config
         self.app_config = app_config
-        self.world = World(app_config.world)
+        agent_count = len(policies) if policies is not None else len(self.genomes)
+        if snapshot is None and app_config.simulation.start_snapshot:
+            snapshot = load_snapshot(app_config.simulation.start_snapshot)
+        self.snapshot = snapshot
+        episodes = app_config.episodes
+        seed = episodes.seed + generation if episodes.resample else episodes.seed
+        if snapshot is not None:
+            base_settings = snapshot.settings
+        else:
+            base_settings = world.settings if world is not None else app_config.world
+        # One world per episode variant, all stepped in the same loop. A passed-in
+        # world (emptied with `World.reset`) is reused as the first one.
+        self.worlds = [
+            world
+            if world is not None and index == 0
+            else World(settings, app_config.simulation.agent_radius, expected_agents=agent_count)
+            for index, settings in enumerate(world_variants(base_settings, episodes, seed))
+        ]
+        self.world = self.worlds[0]
         self.render_enabled = render
         self.renderer: Renderer | None = Renderer(self.world, [], app_config) if render else None
         self.generation = generation
+        self.dashboard = dashboard
+        self.steps_run = 0
+        self.truncated = False
 
-        self.networks: List[neat.nn.FeedForwardNetwork] = []
+        self.networks: List[neat.nn.FeedForwardNetwork | CompiledPolicy] = []
+        # Agents of every episode, episode-major: agent `e * len(networks) + i` runs network `i` in world `e`.
         self.agents: List[Agent] = []
-        self._create_agents()
+        fused = app_config.simulation.tick_backend == "fused"
+        if policies is not None:
+            recurrent = any(not policy.feed_forward for policy in policies)
+        else:
+            recurrent = not neat_config.genome_config.feed_forward
+        if fused and recurrent:
+            raise ValueError("The fused tick backend only supports feed-forward genomes.")
+        self.task = task if task is not None else make_task(app_config.simulation)
+        if fused and type(self.task) is not ReachTargetTask:
+            raise ValueError("The fused tick backend only implements the built-in reach_target task.")
+        # Tasks keep per-episode state, so every extra world gets its own copy.
+        self.tasks: List[Task] = [self.task] + [copy.deepcopy(self.task) for _ in self.worlds[1:]]
+        self.states: List[PopulationState] = []
+        if policies is not None:
+            self._create_policy_agents(policies)
+        else:
+            self._create_agents(compiled=fused or recurrent)
+        for world in self.worlds[1:]:
+            self.agents.extend(Agent(world, app_config.simulation) for _ in self.networks)
+        if snapshot is not None:
+            self._fork(snapshot)
+        # Recurrent networks are stepped together so their state stays in one array.
+        self.recurrent: RecurrentBatch | None = (
+            RecurrentBatch(self.networks * len(self.worlds)) if recurrent and self.agents else None
+        )
+        self.tickers: List[FusedTicker] = (
+            [
+                FusedTicker(world, self.episode_agents(e), self.networks, app_config.simulation)
+                for e, world in enumerate(self.worlds)
+            ]
+            if fused
+            else []
+        )
+        self.episode_fitness = np.zeros((len(self.worlds), len(self.networks)))
         if self.renderer:
-            self.renderer.agents = self.agents
+            self.renderer.agents = self.episode_agents(0)
 
-    def _create_agents(self) -> None:
+    def episode_agents(self, episode: int) -> List[Agent]:
+        """The agents living in `worlds[episode]`, in genome order."""
+
+        count = len(self.networks)
+        return self.agents[episode * count : (episode + 1) * count]
+
+    def _fork(self, snapshot: WorldSnapshot) -> None:
+        """Start every world and agent from `snapshot` instead of the initial layout."""
+
+        for e, world in enumerate(self.worlds):
+            world.restore(snapshot, self.episode_agents(e))
+        for agent in self.agents:
+            agent.initial_distance = agent._distance_to_target()
+
+    def _create_agents(self, compiled: bool = False) -> None:
         for _, genome in self.genomes:
             genome.fitness = 0.0
-            network = neat.nn.FeedForwardNetwork.create(genome, self.neat_config)
+            if compiled:
+                network = compile_genome(genome, self.neat_config)
+            else:
+                network = neat.nn.FeedForwardNetwork.create(genome, self.neat_config)
             agent = Agent(self.world, self.app_config.simulation)
             self.networks.append(network)
             self.agents.append(agent)
 
+    def _create_policy_agents(self, policies: Sequence[CompiledPolicy]) -> None:
+        for policy in policies:
+            self.networks.append(policy)
+            self.agents.append(Agent(self.world, self.app_config.simulation))
+
     def run(self) -> None:
+        """Simulate until every agent dies, `max_steps` elapse, or the time budget runs out.
+
+        When `population.generation_time_budget` is exceeded the remaining agents
+        keep their current fitness and `truncated` is set.
+        """
+
         dt = 1.0 / self.app_config.simulation.ticks_per_second
         max_steps = self.app_config.simulation.max_steps
+        budget = self.app_config.population.generation_time_budget
+        deadline = time.perf_counter() + budget if budget > 0 else None
         step = 0
         best_fitness = 0.0
+        if self.recurrent:
+            self.recurrent.reset()
+        if not self.tickers:
+            self.states = [PopulationState.from_agents(self.episode_agents(e), w) for e, w in enumerate(self.worlds)]
+            for task, world, state in zip(self.tasks, self.worlds, self.states):
+                task.reset(world, state)
+        shown = self.episode_agents(0)
 
         while step < max_steps:
+            if deadline is not None and time.perf_counter() >= deadline:
+                self.truncated = True
+                break
+
             if self.renderer:
                 if not self.renderer.handle_events():
                     break
@@ -51,25 +166,68 @@ class Simulation:
                     self.renderer.draw(self.generation, step, best_fitness)
                     continue
 
-            all_dead = True
-            for agent, network in zip(self.agents, self.networks):
-                if not agent.alive:
-                    continue
-                all_dead = False
-                agent.update(dt, network)
+            if self.tickers:
+                all_dead = sum(ticker.tick(dt) for ticker in self.tickers) == 0
+            else:
+                all_dead = self._tick(dt)
 
-            self.world.step(dt)
+            for world in self.worlds:
+                world.step(dt)
 
-            best_fitness = max((a.fitness for a in self.agents), default=0.0)
+            best_fitness = max((a.fitness for a in shown), default=0.0)
 
             if self.renderer:
                 self.renderer.draw(self.generation, step, best_fitness)
+            if self.dashboard and self.dashboard.should_sample(step):
+                self.dashboard.publish_agents(self.generation, step, self.world, shown)
 
             if all_dead:
                 break
 
             step += 1
 
-        for (_, genome), agent in zip(self.genomes, self.agents):
-            genome.fitness = max(agent.fitness, 0.0)
-
+        self.steps_run = step
+        count = len(self.networks)
+        self.episode_fitness = np.array([a.fitness for a in self.agents], dtype=np.float64).reshape(len(self.worlds), count)
+        if self.app_config.episodes.aggregate == "min":
+            fitness = self.episode_fitness.min(axis=0)
+        else:
+            fitness = self.episode_fitness.mean(axis=0)
+        for (_, genome), value in zip(self.genomes, fitness.tolist()):
+            genome.fitness = max(value, 0.0)
+
+    def _tick(self, dt: float) -> bool:
+        """Run networks and actions per agent, then each episode's task on arrays; True when all agents are dead."""
+
+        for e, (world, state) in enumerate(zip(self.worlds, self.states)):
+            state.gather(self.episode_agents(e), world)
+        living_mask = np.concatenate([state.living for state in self.states])
+        living = np.flatnonzero(living_mask).tolist()
+        if not living:
+            return True
+
+        inputs = np.concatenate(
+            [task.sensors(world, state) for task, world, state in zip(self.tasks, self.worlds, self.states)]
+        )
+        count = len(self.networks)
+        if self.recurrent:
+            # Dead agents get zero inputs; their rows are computed but never read.
+            inputs[~living_mask] = 0.0
+            outputs = self.recurrent.activate(inputs).tolist()
+        else:
+            outputs = {i: self.networks[i % count].activate(inputs[i].tolist()) for i in living}
+
+        for i in living:
+            agent = self.agents[i]
+            agent.act(outputs[i])
+            self.states[i // count].energy[i % count] = agent.energy
+
+        for task, world, state in zip(self.tasks, self.worlds, self.states):
+            task.reward(world, state, dt)
+            state.alive &= ~task.termination(world, state)
+        for i in living:
+            agent = self.agents[i]
+            state = self.states[i // count]
+            agent.alive = bool(state.alive[i % count])
+            agent.fitness = float(state.fitness[i % count])
+        return False
@@ -0,0 +1,436 @@
+"""Cached, vectorized replacement for neat-python's default speciation.
+
+`CachedSpeciesSet` runs the same algorithm as `neat.DefaultSpeciesSet` and
+produces the same species, but it computes compatibility distances from
+per-genome NumPy gene arrays instead of walking gene dictionaries pair by
+pair:
+
+- each representative is compared with every remaining genome in one batch,
+  matching homologous genes through sorted gene-key arrays;
+- distances between genomes that survive into the next generation (elites and
+  representatives) are memoized, so they are not recomputed;
+- the first batch of every generation (old representatives against the whole
+  population) can be sharded across worker processes.
+
+Homologous gene distances are summed in the representative's gene order, the
+same order `DefaultGenome.distance` uses, so every distance is bitwise equal to
+the default one. Memoization relies on neat's invariant that a genome key is
+never reused for different genes.
+"""
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from operator import attrgetter
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from neat.math_util import mean, stdev
+from neat.species import DefaultSpeciesSet, Species
+
+# Connection keys (in, out) are packed into one int64 as in * 2**32 + out.
+_CONNECTION_KEY_SHIFT = 1 << 32
+
+# Genomes assigned per vectorized step while partitioning into species.
+_WINDOW = 256
+
+_NODE_VALUES = attrgetter("bias", "response", "time_constant")
+_NODE_NAMES = attrgetter("activation", "aggregation")
+_CONNECTION_VALUES = attrgetter("weight", "enabled")
+
+
+def _connection_key(key: Tuple[int, int]) -> int:
+    return key[0] * _CONNECTION_KEY_SHIFT + key[1]
+
+
+@dataclass
+class _Genes:
+    """Gene keys (insertion order) and the attributes used by the distance function."""
+
+    node_keys: np.ndarray
+    node_attrs: np.ndarray  # bias, response, time_constant, activation code, aggregation code
+    conn_keys: np.ndarray
+    conn_attrs: np.ndarray  # weight, enabled
+
+
+@dataclass
+class _Coefficients:
+    disjoint: float
+    weight: float
+
+
+class _GeneTable:
+    """All genes of one kind for a list of genomes, sorted by (genome row, gene key)."""
+
+    def __init__(self, keys: Sequence[np.ndarray], attrs: Sequence[np.ndarray], width: int) -> None:
+        self.counts = np.array([len(k) for k in keys], dtype=np.int64)
+        all_keys = np.concatenate(keys) if keys else np.zeros(0, dtype=np.int64)
+        self.universe, ranks = np.unique(all_keys, return_inverse=True)
+        rows = np.repeat(np.arange(len(keys), dtype=np.int64), self.counts)
+        codes = rows * max(len(self.universe), 1) + ranks.reshape(-1)
+        order = np.argsort(codes, kind="stable")
+        self.codes = codes[order]
+        self.attrs = (np.concatenate(attrs) if keys else np.zeros((0, width)))[order]
+
+    def lookup(self, keys: np.ndarray, rows: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Attributes of `keys` in each genome row, shape (rows, keys, width), plus a found mask."""
+
+        size = len(self.universe)
+        if size == 0 or len(keys) == 0 or len(self.codes) == 0:
+            found = np.zeros((len(rows), len(keys)), dtype=bool)
+            return np.zeros(found.shape + (self.attrs.shape[1],)), found
+        ranks = np.minimum(np.searchsorted(self.universe, keys), size - 1)
+        known = self.universe[ranks] == keys
+        query = rows[:, None] * size + ranks[None, :]
+        positions = np.minimum(np.searchsorted(self.codes, query), len(self.codes) - 1)
+        found = (self.codes[positions] == query) & known[None, :]
+        return self.attrs[positions], found
+
+
+class _GenePool:
+    """Gene tables for a list of genomes, used to compare one genome against many."""
+
+    def __init__(self, genes: Sequence[_Genes], coefficients: _Coefficients) -> None:
+        self.coefficients = coefficients
+        self.nodes = _GeneTable([g.node_keys for g in genes], [g.node_attrs for g in genes], 5)
+        self.connections = _GeneTable([g.conn_keys for g in genes], [g.conn_attrs for g in genes], 2)
+
+    def distances(self, genes: _Genes, rows: np.ndarray) -> np.ndarray:
+        """`genes.distance(other)` for every genome in `rows`, bitwise equal to `DefaultGenome.distance`."""
+
+        weight = self.coefficients.weight
+        other, found = self.nodes.lookup(genes.node_keys, rows)
+        own = genes.node_attrs
+        d = np.abs(own[:, 0] - other[..., 0]) + np.abs(own[:, 1] - other[..., 1])
+        d += np.abs(own[:, 2] - other[..., 2])
+        d += own[:, 3] != other[..., 3]
+        d += own[:, 4] != other[..., 4]
+        node_distance = self._component(d * weight, found, len(genes.node_keys), self.nodes.counts[rows])
+
+        other, found = self.connections.lookup(genes.conn_keys, rows)
+        own = genes.conn_attrs
+        d = np.abs(own[:, 0] - other[..., 0])
+        d += own[:, 1] != other[..., 1]
+        conn_distance = self._component(d * weight, found, len(genes.conn_keys), self.connections.counts[rows])
+        return node_distance + conn_distance
+
+    def _component(self, gene_distance: np.ndarray, found: np.ndarray, own_count: int, counts: np.ndarray) -> np.ndarray:
+        # cumsum adds left to right like the default's loop; the zeros for
+        # non-homologous genes leave the running sum unchanged.
+        if own_count:
+            homologous = np.where(found, gene_distance, 0.0).cumsum(axis=1)[:, -1]
+        else:
+            homologous = np.zeros(len(counts))
+        matches = found.sum(axis=1)
+        disjoint = (own_count - matches) + (counts - matches)
+        largest = np.maximum(own_count, counts)
+        safe = np.where(largest > 0, largest, 1)
+        return np.where(largest > 0, (homologous + self.coefficients.disjoint * disjoint) / safe, 0.0)
+
+
+def _distance_block(reps: Sequence[_Genes], genes: Sequence[_Genes], coefficients: _Coefficients) -> np.ndarray:
+    """Distances from each representative to each genome, shape (reps, genomes). Runs in workers."""
+
+    pool = _GenePool(genes, coefficients)
+    rows = np.arange(len(genes), dtype=np.int64)
+    return np.array([pool.distances(rep, rows) for rep in reps]).reshape(len(reps), len(genes))
+
+
+class _RowBuffer:
+    """Growable (representatives, genomes) matrix of distances and cache-hit flags."""
+
+    def __init__(self, width: int) -> None:
+        self.size = 0
+        self.values = np.empty((8, width))
+        self.hits = np.zeros((8, width), dtype=bool)
+
+    def append(self, row: np.ndarray, hit: np.ndarray) -> None:
+        if self.size == len(self.values):
+            self.values = np.concatenate([self.values, np.empty_like(self.values)])
+            self.hits = np.concatenate([self.hits, np.zeros_like(self.hits)])
+        self.values[self.size] = row
+        self.hits[self.size] = hit
+        self.size += 1
+
+    def block(self, cols: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        return self.values[: self.size, cols], self.hits[: self.size, cols]
+
+
+class CachedSpeciesSet(DefaultSpeciesSet):
+    """Drop-in `DefaultSpeciesSet` with memoized, vectorized distance computation.
+
+    Reads the `[DefaultSpeciesSet]` config section (see `_load_neat_config`).
+    Set `workers` above 1 to shard the per-generation distance batch across
+    that many processes.
+    """
+
+    def __init__(self, config, reporters) -> None:
+        super().__init__(config, reporters)
+        self.workers = getattr(config, "workers", 0)
+        self._init_caches()
+
+    def _init_caches(self) -> None:
+        self._genes: Dict[int, _Genes] = {}
+        self._memo: Dict[int, Tuple[np.ndarray, np.ndarray]] = {}
+        self._codes: Dict[str, int] = {}
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def speciate(self, config, population, generation):
+        """Place genomes into species exactly like `DefaultSpeciesSet.speciate`."""
+
+        assert isinstance(population, dict)
+
+        compatibility_threshold = self.species_set_config.compatibility_threshold
+        genome_config = config.genome_config
+        coefficients = _Coefficients(
+            genome_config.compatibility_disjoint_coefficient, genome_config.compatibility_weight_coefficient
+        )
+
+        # Columns are genomes in ascending key order, the default's processing order.
+        gids = sorted(population.keys())
+        gid_array = np.array(gids, dtype=np.int64)
+        col_of = {gid: col for col, gid in enumerate(gids)}
+        self._extract([population[gid] for gid in gids if gid not in self._genes])
+        pool_genes = [self._genes[gid] for gid in gids]
+        pool = _GenePool(pool_genes, coefficients)
+        unspeciated = np.ones(len(gids), dtype=bool)
+        # Distances in the order the default's GenomeDistanceCache would store them,
+        # so the reported mean and standard deviation come out identical.
+        logged: List[np.ndarray] = []
+
+        # The default caches distances symmetrically, so a pair queried in both
+        # directions reuses the first direction's value. Only old representatives
+        # are queried before they can appear as the other genome, so remember
+        # their rows and the columns each one queried.
+        queried_by: Dict[int, Tuple[np.ndarray, np.ndarray]] = {}
+
+        def reuse_earlier(rep_key: int, row: np.ndarray, mask: np.ndarray) -> np.ndarray:
+            hit = np.zeros(len(gids), dtype=bool)
+            earlier = queried_by.get(rep_key)
+            if earlier is not None:
+                hit |= earlier[1] & mask
+                row[hit] = earlier[0][hit]
+            own = col_of.get(rep_key)
+            if own is not None:
+                for key, (other_row, other_mask) in queried_by.items():
+                    col = col_of.get(key)
+                    if col is not None and key != rep_key and mask[col] and not hit[col] and other_mask[own]:
+                        row[col] = other_row[own]
+                        hit[col] = True
+            return hit
+
+        def log(row: np.ndarray, new: np.ndarray, self_col: Optional[int] = None) -> None:
+            repeats = np.full(len(gids), 2)
+            if self_col is not None:
+                repeats[self_col] = 1  # a genome compared with itself is stored once
+            logged.append(np.repeat(row[new], repeats[new]))
+
+        old_species = [self.species[sid] for sid in sorted(self.species.keys())]
+        old_rows = self._old_rows([s.representative for s in old_species], gid_array, pool, pool_genes, coefficients)
+
+        new_representatives = {}
+        new_members = {}
+        for s, row in zip(old_species, old_rows):
+            if not unspeciated.any():
+                raise ValueError("min() arg is an empty sequence")
+            rep_key = s.representative.key
+            mask = unspeciated.copy()
+            hit = reuse_earlier(rep_key, row, mask)
+            queried_by[rep_key] = (row, mask)
+            log(row, mask & ~hit, col_of.get(rep_key))
+
+            # The new representative is the genome closest to the current representative.
+            col = int(np.argmin(np.where(mask, row, np.inf)))
+            new_representatives[s.key] = gids[col]
+            new_members[s.key] = [gids[col]]
+            unspeciated[col] = False
+
+        rows = _RowBuffer(len(gids))
+
+        def add_row(rep) -> None:
+            mask = unspeciated.copy()
+            row = np.full(len(gids), np.inf)
+            cols = np.flatnonzero(mask)
+            row[cols] = self._raw_row(rep, cols, gid_array, pool)
+            rows.append(row, reuse_earlier(rep.key, row, mask))
+
+        for rid in new_representatives.values():
+            add_row(population[rid])
+
+        # Partition population into species based on genetic similarity.
+        # Genomes are still taken in ascending key order, but a window of them
+        # is assigned at once; only a genome close to no representative (a new
+        # species) ends the window, since later genomes must also see its row.
+        rep_sids = list(new_representatives)
+        pending = np.flatnonzero(unspeciated)
+        while len(pending):
+            window = pending[:_WINDOW]
+            distances, hits = rows.block(window)
+            close = distances < compatibility_threshold
+            orphans = np.flatnonzero(~close.any(axis=0))
+            stop = int(orphans[0]) if len(orphans) else len(window)
+
+            logged.append(np.repeat(distances[:, : stop + 1].T[~hits[:, : stop + 1].T], 2))
+            if stop:
+                best = np.argmin(np.where(close[:, :stop], distances[:, :stop], np.inf), axis=0)
+                for col, rep_index in zip(window[:stop].tolist(), best.tolist()):
+                    new_members[rep_sids[rep_index]].append(gids[col])
+                unspeciated[window[:stop]] = False
+            if stop < len(window):
+                # No species is similar enough, create a new species, using
+                # this genome as its representative.
+                gid = gids[window[stop]]
+                unspeciated[window[stop]] = False
+                sid = next(self.indexer)
+                new_representatives[sid] = gid
+                new_members[sid] = [gid]
+                rep_sids.append(sid)
+                add_row(population[gid])
+                stop += 1
+            pending = pending[stop:]
+
+        # Update species collection based on new speciation.
+        self.genome_to_species = {}
+        for sid in sorted(new_representatives.keys()):
+            rid = new_representatives[sid]
+            s = self.species.get(sid)
+            if s is None:
+                s = Species(sid, generation)
+                self.species[sid] = s
+
+            members = new_members[sid]
+            for gid in members:
+                self.genome_to_species[gid] = sid
+
+            member_dict = {gid: population[gid] for gid in members}
+            s.update(population[rid], member_dict)
+
+        if len(population) > 1:
+            values = np.concatenate(logged).tolist() if logged else []
+            gdmean = mean(values)
+            gdstdev = stdev(values)
+            self.reporters.info(f"Mean genetic distance {gdmean:.3f}, standard deviation {gdstdev:.3f}")
+
+        self._prune(population)
+
+    def _old_rows(self, reps, gid_array, pool, pool_genes, coefficients) -> List[np.ndarray]:
+        """Rows of the previous representatives against the whole population, sharded when enabled."""
+
+        cols = np.arange(len(gid_array), dtype=np.int64)
+        if self.workers <= 1 or len(cols) < 2 * self.workers or not reps:
+            return [self._raw_row(rep, cols, gid_array, pool) for rep in reps]
+
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        rep_genes = [self._genes_of(rep) for rep in reps]
+        bounds = np.linspace(0, len(cols), self.workers + 1).astype(int)
+        chunks = [(start, stop) for start, stop in zip(bounds[:-1], bounds[1:]) if stop > start]
+        futures = [
+            self._executor.submit(_distance_block, rep_genes, pool_genes[start:stop], coefficients)
+            for start, stop in chunks
+        ]
+        block = np.concatenate([future.result() for future in futures], axis=1)
+        for rep, row in zip(reps, block):
+            self._remember(rep.key, gid_array, row)
+        return list(block)
+
+    def _raw_row(self, rep, cols: np.ndarray, gid_array: np.ndarray, pool: _GenePool) -> np.ndarray:
+        """`rep.distance(genome)` for the genomes in `cols`, reusing memoized values."""
+
+        keys = gid_array[cols]
+        row = np.empty(len(cols))
+        todo = np.ones(len(cols), dtype=bool)
+        cached = self._memo.get(rep.key)
+        if cached is not None and len(cached[0]):
+            known_keys, known = cached
+            positions = np.minimum(np.searchsorted(known_keys, keys), len(known_keys) - 1)
+            hit = known_keys[positions] == keys
+            row[hit] = known[positions[hit]]
+            todo = ~hit
+        if todo.any():
+            row[todo] = pool.distances(self._genes_of(rep), cols[todo])
+            self._remember(rep.key, keys[todo], row[todo])
+        return row
+
+    def _remember(self, rep_key: int, keys: np.ndarray, distances: np.ndarray) -> None:
+        cached = self._memo.get(rep_key)
+        if cached is not None:
+            keys = np.concatenate([cached[0], keys])
+            distances = np.concatenate([cached[1], distances])
+        keys, first = np.unique(keys, return_index=True)
+        self._memo[rep_key] = (keys, distances[first])
+
+    def _genes_of(self, genome) -> _Genes:
+        genes = self._genes.get(genome.key)
+        if genes is None:
+            self._extract([genome])
+            genes = self._genes[genome.key]
+        return genes
+
+    def _code(self, name: str) -> int:
+        return self._codes.setdefault(name, len(self._codes))
+
+    def _extract(self, genomes: Sequence) -> None:
+        """Convert genomes to `_Genes`, building each array once for the whole batch."""
+
+        node_keys, node_values, node_names, conn_keys, conn_values = [], [], [], [], []
+        node_counts, conn_counts = [], []
+        for genome in genomes:
+            nodes = genome.nodes.values()
+            connections = genome.connections.values()
+            node_keys.extend(genome.nodes.keys())
+            node_values.extend(map(_NODE_VALUES, nodes))
+            node_names.extend(map(_NODE_NAMES, nodes))
+            conn_keys.extend(map(_connection_key, genome.connections.keys()))
+            conn_values.extend(map(_CONNECTION_VALUES, connections))
+            node_counts.append(len(nodes))
+            conn_counts.append(len(connections))
+
+        node_attrs = np.empty((len(node_keys), 5))
+        node_attrs[:, :3] = np.array(node_values, dtype=np.float64).reshape(-1, 3)
+        if node_names:
+            names, inverse = np.unique(np.array(node_names, dtype=object).reshape(-1), return_inverse=True)
+            codes = np.array([self._code(name) for name in names], dtype=np.float64)
+            node_attrs[:, 3:] = codes[inverse].reshape(-1, 2)
+
+        node_split = np.cumsum(node_counts)[:-1]
+        conn_split = np.cumsum(conn_counts)[:-1]
+        parts = zip(
+            np.split(np.array(node_keys, dtype=np.int64), node_split),
+            np.split(node_attrs, node_split),
+            np.split(np.array(conn_keys, dtype=np.int64), conn_split),
+            np.split(np.array(conn_values, dtype=np.float64).reshape(-1, 2), conn_split),
+        )
+        for genome, (nk, na, ck, ca) in zip(genomes, parts):
+            self._genes[genome.key] = _Genes(nk, na, ck, ca)
+
+    def _prune(self, population) -> None:
+        # Only genomes that survive into the next generation (elites and the
+        # new representatives, all members of this population) can be reused.
+        alive = np.array(sorted(population.keys()), dtype=np.int64)
+        memo = {}
+        for rep_key, (keys, distances) in self._memo.items():
+            if rep_key in population:
+                keep = np.isin(keys, alive)
+                memo[rep_key] = (keys[keep], distances[keep])
+        self._memo = memo
+        self._genes = {gid: genes for gid, genes in self._genes.items() if gid in population}
+
+    def close(self) -> None:
+        """Shut down the worker pool, if one was started."""
+
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __getstate__(self):
+        # Caches and the worker pool are rebuilt on demand after a checkpoint restore.
+        state = super().__getstate__()
+        for name in ("_genes", "_memo", "_codes", "_executor"):
+            state.pop(name, None)
+        return state
+
+    def __setstate__(self, state):
+        super().__setstate__(state)
+        self.__dict__.setdefault("workers", 0)
+        self._init_caches()
@@ -0,0 +1,191 @@
+"""Pluggable tasks: reward, termination and extra sensors for a population.
+
+A `Task` decides what agents are rewarded for and when they die. Its methods
+receive a `PopulationState` holding arrays for the whole population and are
+called once per tick, after every living agent has acted:
+
+1. `sensor_extras` may append task-specific readings to the base sensors;
+2. agents act on their network outputs (forces, jumps, energy use);
+3. `reward` updates `state.fitness`;
+4. `termination` returns which agents die.
+
+Register a new task with `register_task` and select it by name with
+`simulation.task` in `config.toml`.
+"""
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Sequence
+
+import numpy as np
+
+from .config import SimulationSettings
+
+# Sensor readings every task gets, in network input order.
+BASE_SENSORS = ("target_dx", "target_dy", "velocity_x", "velocity_y", "ground_distance", "hazard_distance", "target_velocity")
+
+
+@dataclass
+class PopulationState:
+    """Per-agent arrays shared by `Simulation` and the active `Task`.
+
+    `position` and `velocity` are body states at the start of the current
+    tick. `living` marks agents that were alive at the start of the tick (and
+    therefore acted); rows of other agents must be left untouched.
+    """
+
+    position: np.ndarray
+    velocity: np.ndarray
+    alive: np.ndarray
+    living: np.ndarray
+    fitness: np.ndarray
+    energy: np.ndarray
+    target_position: np.ndarray
+    target_velocity: np.ndarray
+
+    @classmethod
+    def from_agents(cls, agents: Sequence[Any], world: Any) -> "PopulationState":
+        count = len(agents)
+        state = cls(
+            position=np.zeros((count, 2)),
+            velocity=np.zeros((count, 2)),
+            alive=np.array([a.alive for a in agents], dtype=bool),
+            living=np.zeros(count, dtype=bool),
+            fitness=np.array([a.fitness for a in agents], dtype=np.float64),
+            energy=np.array([a.energy for a in agents], dtype=np.float64),
+            target_position=np.zeros(2),
+            target_velocity=np.zeros(2),
+        )
+        state.gather(agents, world)
+        return state
+
+    def __len__(self) -> int:
+        return len(self.alive)
+
+    def gather(self, agents: Sequence[Any], world: Any) -> None:
+        """Read body and target state for the agents that are currently alive."""
+
+        np.copyto(self.living, self.alive)
+        position, velocity = self.position, self.velocity
+        for i in np.flatnonzero(self.living).tolist():
+            body = agents[i].body
+            position[i] = body.position
+            velocity[i] = body.velocity
+        target = world.target_body
+        self.target_position[:] = target.position
+        self.target_velocity[:] = target.velocity
+
+
+def base_sensors(world: Any, sim_settings: SimulationSettings, state: PopulationState) -> np.ndarray:
+    """`Agent.get_sensor_values` for the whole population, shape (agents, 7)."""
+
+    settings = world.settings
+    x, y = state.position[:, 0], state.position[:, 1]
+    sensors = np.empty((len(state), len(BASE_SENSORS)))
+    sensors[:, 0] = (state.target_position[0] - x) / settings.width
+    sensors[:, 1] = (state.target_position[1] - y) / settings.height
+    sensors[:, 2] = state.velocity[:, 0] / sim_settings.sensor_range
+    sensors[:, 3] = state.velocity[:, 1] / sim_settings.sensor_range
+    sensors[:, 4] = (y - settings.ground_height) / settings.height
+    sensors[:, 5] = world.hazard_distances(state.position)
+    sensors[:, 6] = state.target_velocity[0] / max(1.0, sim_settings.sensor_range)
+    return sensors
+
+
+def target_distance(state: PopulationState) -> np.ndarray:
+    """Distance from every agent to the target, computed like `Vec2d.get_distance`."""
+
+    return np.sqrt(
+        (state.target_position[0] - state.position[:, 0]) ** 2 + (state.target_position[1] - state.position[:, 1]) ** 2
+    )
+
+
+class Task(ABC):
+    """Reward, termination and extra sensors, evaluated on population arrays.
+
+    Subclasses must implement `reward` and `termination`.
+    """
+
+    #: Number of columns `sensor_extras` appends after the base sensors.
+    num_sensor_extras = 0
+
+    def __init__(self, sim_settings: SimulationSettings) -> None:
+        self.sim_settings = sim_settings
+
+    def reset(self, world: Any, state: PopulationState) -> None:
+        """Start a new episode; called before the first tick."""
+
+    def sensors(self, world: Any, state: PopulationState) -> np.ndarray:
+        """Network inputs for every agent: the base sensors plus any extras."""
+
+        base = base_sensors(world, self.sim_settings, state)
+        if not self.num_sensor_extras:
+            return base
+        return np.concatenate([base, self.sensor_extras(world, state)], axis=1)
+
+    def sensor_extras(self, world: Any, state: PopulationState) -> np.ndarray:
+        """Task-specific readings, shape (agents, num_sensor_extras)."""
+
+        return np.zeros((len(state), 0))
+
+    @abstractmethod
+    def reward(self, world: Any, state: PopulationState, dt: float) -> None:
+        """Update `state.fitness` for the living agents after they acted."""
+
+    @abstractmethod
+    def termination(self, world: Any, state: PopulationState) -> np.ndarray:
+        """Boolean mask of agents that die this tick."""
+
+
+class ReachTargetTask(Task):
+    """The built-in task: approach the target, stay alive, avoid hazards and falls.
+
+    Fitness is the best improvement in distance to the target plus `dt` per tick
+    survived. Agents die when out of energy, inside a hazard or below the floor.
+    """
+
+    def reset(self, world: Any, state: PopulationState) -> None:
+        self.best_distance = np.full(len(state), np.inf)
+        self.initial_distance = target_distance(state)
+
+    def reward(self, world: Any, state: PopulationState, dt: float) -> None:
+        current = target_distance(state)
+        improved = state.living & (current < self.best_distance)
+        self.best_distance[improved] = current[improved]
+        state.fitness[improved] = np.maximum(state.fitness[improved], self.initial_distance[improved] - current[improved])
+        state.fitness[state.living] += dt
+
+    def termination(self, world: Any, state: PopulationState) -> np.ndarray:
+        x, y = state.position[:, 0], state.position[:, 1]
+        dead = state.energy <= 0
+        for min_x, max_x, min_y, max_y in world.hazard_boxes:
+            dead |= (min_x <= x) & (x <= max_x) & (min_y <= y) & (y <= max_y)
+        dead |= (y < 0) | (y < world.settings.ground_height - 5.0)
+        return dead
+
+
+TASKS: Dict[str, Callable[[SimulationSettings], Task]] = {"reach_target": ReachTargetTask}
+
+
+def register_task(name: str, factory: Callable[[SimulationSettings], Task]) -> None:
+    """Make a task available to `simulation.task` under `name`.
+
+    Raises TypeError when `factory` is a `Task` subclass that leaves `reward`
+    or `termination` unimplemented.
+    """
+
+    missing = getattr(factory, "__abstractmethods__", None)
+    if isinstance(factory, type) and missing:
+        raise TypeError(f"Task {factory.__name__} does not implement {', '.join(sorted(missing))}")
+    TASKS[name] = factory
+
+
+def make_task(sim_settings: SimulationSettings) -> Task:
+    """Build the task named by `sim_settings.task`."""
+
+    try:
+        factory = TASKS[sim_settings.task]
+    except KeyError:
+        raise ValueError(f"Unknown task {sim_settings.task!r}; registered tasks: {', '.join(sorted(TASKS))}") from None
+    return factory(sim_settings)
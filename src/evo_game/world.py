@@ -1,32 +1,104 @@
 """Physics world setup using pymunk."""
 from __future__ import annotations
 
-from typing import List, Tuple
+import json
+import random
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Sequence, Tuple
 
+import numpy as np
 import pymunk
 
-from .config import WorldSettings
+from .config import EpisodeSettings, WorldSettings
+
+# pymunk's threaded space ignores thread counts above this value.
+MAX_SOLVER_THREADS = 2
+_Box = Tuple[float, float, float, float]
+# WorldSettings fields `World.apply_settings` can change without rebuilding the space.
+PATCHABLE_SETTINGS = frozenset(
+    {"target_position", "target_motion_amplitude", "target_motion_speed", "hazards", "gravity_x", "gravity_y"}
+)
+SNAPSHOT_FORMAT_VERSION = 1
+
+
+@dataclass
+class WorldSnapshot:
+    """Dynamic state of a `World` and its agents at one instant.
+
+    Static geometry is rebuilt from `settings`, so a snapshot only holds the
+    clock, the target state and one row per agent: `bodies` is
+    `(agents, 6)` with position, velocity, angle and angular velocity.
+    """
+
+    settings: WorldSettings
+    time: float
+    target: np.ndarray
+    bodies: np.ndarray
+    energy: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.bodies)
+
+
+def create_space(settings: WorldSettings) -> Tuple[pymunk.Space, int]:
+    """Create a pymunk space, honoring the threaded-solver settings when possible.
+
+    Returns the space and the number of solver threads actually in use. The
+    threaded solver is unavailable on Windows and pointless for a single
+    thread, so both cases fall back to a regular space.
+    """
+
+    threads = max(1, min(settings.solver_threads, MAX_SOLVER_THREADS))
+    if settings.threaded_solver and threads > 1 and sys.platform != "win32":
+        try:
+            space = pymunk.Space(threaded=True)
+            space.threads = threads
+            return space, threads
+        except Exception:  # pragma: no cover - depends on the pymunk build
+            pass
+    return pymunk.Space(), 1
 
 
 class World:
     """Container for the pymunk space and static geometry."""
 
-    def __init__(self, settings: WorldSettings) -> None:
+    def __init__(
+        self, settings: WorldSettings, agent_radius: float | None = None, expected_agents: int = 0
+    ) -> None:
+        if settings.large_world and agent_radius is None:
+            raise ValueError("large_world needs the agent radius to size the spatial hash")
         self.settings = settings
-        self.space = pymunk.Space()
+        self.space, self.solver_threads = create_space(settings)
         self.space.gravity = (settings.gravity_x, settings.gravity_y)
+        self.space.iterations = settings.solver_iterations
+        self.space.collision_slop = settings.collision_slop
         self.time = 0.0
 
         self.static_body = self.space.static_body
         self.boundaries: List[pymunk.Shape] = []
         self.obstacles: List[pymunk.Shape] = []
         self.hazards: List[pymunk.Shape] = []
+        self.hazard_boxes: List[Tuple[float, float, float, float]] = []
+        # Hazard shapes and boxes per hazard layout, so switching layouts back and forth reuses them.
+        self._hazard_sets: Dict[Tuple[_Box, ...], Tuple[List[pymunk.Body], List[pymunk.Shape], List[_Box]]] = {}
 
         self._create_boundaries()
         self._create_obstacles()
         self._create_hazards()
         self.target_body, self.target_shape = self._create_target(settings.target_position)
 
+        if settings.large_world:
+            self._use_spatial_hash(agent_radius, expected_agents)
+
+    def _use_spatial_hash(self, agent_radius: float, expected_agents: int) -> None:
+        # Cells about two agent diameters wide keep most moving agents in a
+        # single cell; the table is sized ~10x the body count per pymunk's advice.
+        cell_size = self.settings.spatial_hash_cell_size or 4.0 * agent_radius
+        count = self.settings.spatial_hash_count or max(1000, 10 * (expected_agents + len(self.space.shapes)))
+        self.space.use_spatial_hash(cell_size, count)
+
     def _create_boundaries(self) -> None:
         width, height = self.settings.width, self.settings.height
         ground_y = self.settings.ground_height
@@ -50,13 +122,28 @@ class World:
             self.obstacles.append(shape)
 
     def _create_hazards(self) -> None:
-        for x, y, w, h in self.settings.hazards:
-            body = pymunk.Body(body_type=pymunk.Body.STATIC)
-            body.position = (x, y)
-            shape = pymunk.Poly.create_box(body, size=(w, h))
-            shape.sensor = True
+        self._use_hazards(tuple(self.settings.hazards))
+
+    def _use_hazards(self, layout: Tuple[_Box, ...]) -> None:
+        """Swap the hazards in the space for `layout`, building its shapes only the first time."""
+
+        for shape in self.hazards:
+            self.space.remove(shape.body, shape)
+        cached = self._hazard_sets.get(layout)
+        if cached is None:
+            bodies, shapes = [], []
+            for x, y, w, h in layout:
+                body = pymunk.Body(body_type=pymunk.Body.STATIC)
+                body.position = (x, y)
+                shape = pymunk.Poly.create_box(body, size=(w, h))
+                shape.sensor = True
+                bodies.append(body)
+                shapes.append(shape)
+            # Shapes only hold weak references to their bodies, so the cache keeps them alive.
+            cached = self._hazard_sets[layout] = (bodies, shapes, [_bounding_box(shape) for shape in shapes])
+        bodies, self.hazards, self.hazard_boxes = cached
+        for body, shape in zip(bodies, self.hazards):
             self.space.add(body, shape)
-            self.hazards.append(shape)
 
     def _create_target(self, position: Tuple[float, float]) -> Tuple[pymunk.Body, pymunk.Shape]:
         body = pymunk.Body(body_type=pymunk.Body.KINEMATIC)
@@ -66,6 +153,43 @@ class World:
         self.space.add(body, shape)
         return body, shape
 
+    def reset(self) -> None:
+        """Remove all agent bodies and rewind the clock and target, keeping static geometry.
+
+        pymunk numbers shapes per space, so agents added after a reset get other
+        ids than in a fresh world and colliding agents may resolve contacts in a
+        different (but still deterministic) order.
+        """
+
+        for body in list(self.space.bodies):
+            if body.body_type == pymunk.Body.DYNAMIC:
+                self.space.remove(body, *body.shapes)
+        self.time = 0.0
+        self.target_body.position = self.settings.target_position
+        self.target_body.velocity = (0.0, 0.0)
+
+    def apply_settings(self, settings: WorldSettings) -> None:
+        """Switch to `settings`, patching only the bodies affected by the change.
+
+        Only fields in `PATCHABLE_SETTINGS` may differ; anything else (size,
+        ground, obstacles, broadphase) needs a new `World`.
+        """
+
+        changed = {name for name in WorldSettings.model_fields if getattr(settings, name) != getattr(self.settings, name)}
+        fixed = changed - PATCHABLE_SETTINGS
+        if fixed:
+            raise ValueError(f"Changing {', '.join(sorted(fixed))} requires a new World.")
+        self.settings = settings
+        if "hazards" in changed:
+            self._use_hazards(tuple(settings.hazards))
+        if changed & {"gravity_x", "gravity_y"}:
+            self.space.gravity = (settings.gravity_x, settings.gravity_y)
+        if changed & {"target_position", "target_motion_amplitude", "target_motion_speed"}:
+            self.target_body.position = settings.target_position
+            self.target_body.velocity = (0.0, 0.0)
+            if self.time > 0:
+                self._update_target(0.0)
+
     def step(self, dt: float) -> None:
         """Advance the physics simulation by dt seconds."""
         self.time += dt
@@ -85,19 +209,57 @@ class World:
         self.target_body.position = (new_x, base_y)
         self.target_body.velocity = (offset.x * speed, 0.0)
 
+    def snapshot(self, agents: Sequence[Any] = ()) -> WorldSnapshot:
+        """Capture the clock, target and the given agents' bodies and energy."""
+
+        target = self.target_body
+        return WorldSnapshot(
+            settings=self.settings,
+            time=self.time,
+            target=np.array([*target.position, *target.velocity], dtype=np.float64),
+            bodies=np.array(
+                [[*a.body.position, *a.body.velocity, a.body.angle, a.body.angular_velocity] for a in agents],
+                dtype=np.float64,
+            ).reshape(-1, 6),
+            energy=np.array([a.energy for a in agents], dtype=np.float64),
+        )
+
+    def restore(self, snapshot: WorldSnapshot, agents: Sequence[Any] = ()) -> None:
+        """Put the world and `agents` into the state captured by `snapshot`.
+
+        Agent `i` takes snapshot row `i % len(snapshot)`, so a one-agent
+        snapshot forks into any number of agents. A world built from different
+        settings (an episode variant) keeps its own target path at the
+        snapshot's time. pymunk's contact cache is not part of the snapshot, so
+        resting contacts are re-solved on the first step.
+        """
+
+        self.time = snapshot.time
+        if snapshot.settings == self.settings:
+            self.target_body.position = tuple(snapshot.target[:2])
+            self.target_body.velocity = tuple(snapshot.target[2:])
+        else:
+            self._update_target(0.0)
+        if not len(snapshot):
+            return
+        for i, agent in enumerate(agents):
+            row = i % len(snapshot)
+            x, y, vx, vy, angle, angular_velocity = snapshot.bodies[row].tolist()
+            body = agent.body
+            body.position = (x, y)
+            body.velocity = (vx, vy)
+            body.angle = angle
+            body.angular_velocity = angular_velocity
+            agent.energy = float(snapshot.energy[row])
+
     def hazard_distance(self, position: pymunk.Vec2d) -> float:
         """Return the minimum normalized distance to any hazard box (1.0 if none)."""
 
-        if not self.hazards:
+        if not self.hazard_boxes:
             return 1.0
 
         min_dist = float("inf")
-        for hazard in self.hazards:
-            vertices = [v + hazard.body.position for v in hazard.get_vertices()]  # type: ignore[arg-type]
-            xs = [p.x for p in vertices]
-            ys = [p.y for p in vertices]
-            min_x, max_x = min(xs), max(xs)
-            min_y, max_y = min(ys), max(ys)
+        for min_x, max_x, min_y, max_y in self.hazard_boxes:
             closest_x = min(max(position.x, min_x), max_x)
             closest_y = min(max(position.y, min_y), max_y)
             dist = (position - pymunk.Vec2d(closest_x, closest_y)).length
@@ -106,3 +268,95 @@ class World:
         norm = max(self.settings.width, self.settings.height)
         return min(1.0, min_dist / norm)
 
+    def hazard_distances(self, positions: np.ndarray) -> np.ndarray:
+        """`hazard_distance` for an (N, 2) array of positions."""
+
+        if not self.hazard_boxes:
+            return np.ones(len(positions))
+
+        x, y = positions[:, 0], positions[:, 1]
+        min_dist = np.full(len(positions), np.inf)
+        for min_x, max_x, min_y, max_y in self.hazard_boxes:
+            dx = x - np.minimum(np.maximum(x, min_x), max_x)
+            dy = y - np.minimum(np.maximum(y, min_y), max_y)
+            min_dist = np.minimum(min_dist, np.sqrt(dx**2 + dy**2))
+
+        norm = max(self.settings.width, self.settings.height)
+        return np.minimum(1.0, min_dist / norm)
+
+
+def world_variants(settings: WorldSettings, episodes: EpisodeSettings, seed: int | None = None) -> List[WorldSettings]:
+    """Return `episodes.count` seeded variants of `settings` for multi-episode evaluation.
+
+    Variant 0 is `settings` itself. The others move the target start, scale its
+    motion amplitude and shift hazards horizontally, within the `*_jitter`
+    limits. Variants are drawn in order from one generator, so raising the
+    count keeps the earlier variants unchanged.
+    """
+
+    rng = random.Random(episodes.seed if seed is None else seed)
+    margin = 20.0
+    variants = [settings]
+    for _ in range(1, episodes.count):
+        x, y = settings.target_position
+        x = min(max(x + rng.uniform(-episodes.target_jitter, episodes.target_jitter), margin), settings.width - margin)
+        y = min(
+            max(y + rng.uniform(-episodes.target_jitter, episodes.target_jitter), settings.ground_height + margin),
+            settings.height - margin,
+        )
+        scale = 1.0 + rng.uniform(-episodes.amplitude_jitter, episodes.amplitude_jitter)
+        hazards = tuple(
+            (min(max(hx + rng.uniform(-episodes.hazard_jitter, episodes.hazard_jitter), 0.0), settings.width), hy, w, h)
+            for hx, hy, w, h in settings.hazards
+        )
+        variants.append(
+            settings.model_copy(
+                update={
+                    "target_position": (x, y),
+                    "target_motion_amplitude": max(0.0, settings.target_motion_amplitude * scale),
+                    "hazards": hazards,
+                }
+            )
+        )
+    return variants
+
+
+def save_snapshot(snapshot: WorldSnapshot, path: Path | str) -> Path:
+    """Write a snapshot to a single compressed `.npz` file."""
+
+    destination = Path(path)
+    header = {
+        "format_version": SNAPSHOT_FORMAT_VERSION,
+        "time": snapshot.time,
+        "settings": snapshot.settings.model_dump(mode="json"),
+    }
+    with destination.open("wb") as f:
+        np.savez_compressed(
+            f, header=np.array(json.dumps(header)), target=snapshot.target, bodies=snapshot.bodies, energy=snapshot.energy
+        )
+    return destination
+
+
+def load_snapshot(path: Path | str) -> WorldSnapshot:
+    """Load a snapshot written by `save_snapshot`."""
+
+    with np.load(Path(path), allow_pickle=False) as data:
+        header = json.loads(str(data["header"]))
+        if header.get("format_version") != SNAPSHOT_FORMAT_VERSION:
+            raise ValueError(f"Unsupported snapshot format version {header.get('format_version')!r}")
+        return WorldSnapshot(
+            settings=WorldSettings.model_validate(header["settings"]),
+            time=float(header["time"]),
+            target=data["target"],
+            bodies=data["bodies"],
+            energy=data["energy"],
+        )
+
+
+def _bounding_box(shape: pymunk.Poly) -> Tuple[float, float, float, float]:
+    """World-space (min_x, max_x, min_y, max_y) of a static polygon."""
+
+    vertices = [v + shape.body.position for v in shape.get_vertices()]
+    xs = [p.x for p in vertices]
+    ys = [p.y for p in vertices]
+    return min(xs), max(xs), min(ys), max(ys)
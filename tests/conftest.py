@@ -1,10 +1,82 @@
 from __future__ import annotations
 
+import random
 import sys
 from pathlib import Path
 
+import pytest
+
 ROOT = Path(__file__).resolve().parents[1]
 SRC = ROOT / "src"
 if str(SRC) not in sys.path:
     sys.path.insert(0, str(SRC))
 
+import neat  # noqa: E402
+
+from evo_game import neat_runner  # noqa: E402
+
+
+@pytest.fixture
+def neat_config_path() -> Path:
+    """The repository's NEAT configuration file."""
+
+    return ROOT / "neat-config.cfg"
+
+
+@pytest.fixture
+def config_file(tmp_path: Path, neat_config_path: Path):
+    """Factory writing a short training config that checkpoints every generation under `tmp_path`.
+
+    `sharded=True` evaluates with two worker processes (and no agent collisions).
+    """
+
+    def make(sharded: bool = False) -> Path:
+        path = tmp_path / "config.toml"
+        path.write_text(
+            f"""
+neat_config_path = "{neat_config_path}"
+
+[simulation]
+max_steps = 60
+agent_collisions = {"false" if sharded else "true"}
+
+[population]
+checkpoint_dir = "{tmp_path / 'checkpoints'}"
+checkpoint_interval = 1
+evaluation_workers = {2 if sharded else 0}
+"""
+        )
+        return path
+
+    return make
+
+
+@pytest.fixture
+def evolved_genomes(neat_config_path: Path):
+    """Factory for a seeded initial population, optionally mutated.
+
+    `evolved_genomes(seed, mutations, ...)` returns the NEAT config and the
+    first `count` (key, genome) pairs, each mutated `mutations` times.
+    """
+
+    def make(
+        seed: int = 3,
+        mutations: int = 0,
+        count: int | None = None,
+        feed_forward: bool = True,
+        num_inputs: int = 7,
+    ):
+        random.seed(seed)
+        neat_config = neat_runner._load_neat_config(neat_config_path)
+        genome_config = neat_config.genome_config
+        genome_config.feed_forward = feed_forward
+        if num_inputs != genome_config.num_inputs:
+            genome_config.num_inputs = num_inputs
+            genome_config.input_keys = [-i - 1 for i in range(num_inputs)]
+        genomes = list(neat.Population(neat_config).population.items())[:count]
+        for _, genome in genomes:
+            for _ in range(mutations):
+                genome.mutate(genome_config)
+        return neat_config, genomes
+
+    return make
@@ -0,0 +1,57 @@
+from concurrent.futures import Future
+
+import neat
+import pytest
+
+from evo_game import neat_runner
+from evo_game.budget import AdaptiveStepController
+from evo_game.config import PopulationSettings, load_config
+
+
+def test_controller_targets_generation_time() -> None:
+    controller = AdaptiveStepController(target_seconds=10.0, bounds=(10, 10_000), window=3)
+    # 600 steps took 3s with 1s of reproduction overhead -> 5ms per step.
+    controller.record(600, 3.0, 1.0)
+    assert controller.next_max_steps(600) == 1200  # capped at 2x per update
+    assert controller.next_max_steps(1200) == 1800  # (10 - 1) / 0.005
+
+
+def test_controller_respects_bounds() -> None:
+    controller = AdaptiveStepController(target_seconds=1.0, bounds=(100, 500), window=2)
+    controller.record(400, 40.0)
+    assert controller.next_max_steps(400) == 200
+    assert controller.next_max_steps(150) == 100
+
+
+def test_controller_from_settings() -> None:
+    assert AdaptiveStepController.from_settings(PopulationSettings()) is None
+
+    settings = PopulationSettings(adaptive_max_steps=True, target_generations_per_hour=360.0)
+    assert AdaptiveStepController.from_settings(settings).target_seconds == pytest.approx(10.0)
+
+    with pytest.raises(ValueError):
+        AdaptiveStepController.from_settings(PopulationSettings(adaptive_max_steps=True))
+
+
+def test_sharded_generation_budget_sums_shard_time(neat_config_path) -> None:
+    app_config = load_config()
+    app_config.simulation.agent_collisions = False
+    app_config.population.evaluation_workers = 2
+    app_config.population.generation_time_budget = 1.0
+    population = neat.Population(neat_runner._load_neat_config(neat_config_path))
+    evaluator = neat_runner._GenerationEvaluator(population, app_config, render=False)
+    genomes = list(population.population.items())[:4]
+    shards = [genomes[:2], genomes[2:]]
+    futures = []
+    for result in (([1.0, 2.0], 50, False, 0.6), ([3.0, 4.0], 60, False, 0.6)):
+        future = Future()
+        future.set_result(result)
+        futures.append(future)
+
+    # Neither shard ran out of its own time, but together they exceeded the generation's budget.
+    steps_run, truncated, spent = evaluator._collect_shards((0, [key for key, _ in genomes], shards, futures, 0.0))
+    evaluator.close()
+    assert steps_run == 60
+    assert truncated
+    assert spent == pytest.approx(1.2)
+    assert [genome.fitness for _, genome in genomes] == [1.0, 2.0, 3.0, 4.0]
@@ -0,0 +1,81 @@
+import random
+from pathlib import Path
+
+import neat
+import pymunk
+import pytest
+
+from evo_game import neat_runner
+from evo_game.config import AppConfig, CurriculumSettings
+from evo_game.curriculum import CurriculumScheduler
+from evo_game.world import World, save_snapshot
+
+
+def _scheduler(**kwargs) -> CurriculumScheduler:
+    config = AppConfig(curriculum=CurriculumSettings(enabled=True, **kwargs))
+    return CurriculumScheduler.from_settings(config)
+
+
+def test_levels_ramp_up_to_the_configured_world() -> None:
+    assert CurriculumScheduler.from_settings(AppConfig()) is None
+
+    scheduler = _scheduler(levels=3, start_fraction=0.5)
+    base = scheduler.base
+    first = scheduler.world_settings(0)
+    assert first.hazards == ()
+    assert first.target_position[0] - scheduler.start_x == (base.target_position[0] - scheduler.start_x) * 0.5
+    assert first.target_motion_speed == base.target_motion_speed * 0.5
+    assert scheduler.world_settings(1).hazards == base.hazards
+    assert scheduler.world_settings(2) is base
+
+    # Levels are cached by difficulty, so switching back returns the same settings.
+    assert scheduler.world_settings(0) is first
+
+
+def test_record_promotes_after_a_full_window_of_good_fitness() -> None:
+    scheduler = _scheduler(levels=3, window=2, promote_best=0.6, promote_mean=0.25)
+    distance = scheduler.difficulty().target_distance
+
+    assert not scheduler.record(distance, distance)  # window not full yet
+    assert not scheduler.record(0.0, 0.0)  # averages too low
+    assert not scheduler.record(distance, distance)  # the poor generation is still in the window
+    assert scheduler.record(distance, distance)
+    assert scheduler.level == 1
+
+    assert not scheduler.record(10 * distance, 10 * distance)  # window restarts after a level-up
+    assert scheduler.record(10 * distance, 10 * distance)
+    assert not scheduler.record(10 * distance, 10 * distance)
+    assert not scheduler.record(10 * distance, 10 * distance)
+    assert scheduler.level == 2
+
+
+def test_evaluator_reuses_one_world_across_levels(neat_config_path: Path) -> None:
+    random.seed(0)
+    neat_config = neat_runner._load_neat_config(neat_config_path)
+    population = neat.Population(neat_config)
+    config = AppConfig(curriculum=CurriculumSettings(enabled=True, levels=2, window=1, promote_best=0.0, promote_mean=0.0))
+    config.simulation.max_steps = 20
+    evaluator = neat_runner._GenerationEvaluator(population, config, render=False)
+    genomes = list(population.population.items())
+
+    evaluator(genomes, neat_config)
+    world = evaluator.world
+    assert world.settings == evaluator.curriculum.world_settings(0)
+    assert evaluator.curriculum.level == 1
+
+    evaluator(genomes, neat_config)
+    assert evaluator.world is world
+    assert world.settings is config.world
+    assert len(world.hazard_boxes) == len(config.world.hazards)
+    dynamic = [b for b in world.space.bodies if b.body_type == pymunk.Body.DYNAMIC]
+    assert len(dynamic) == len(genomes)
+
+
+def test_curriculum_rejects_start_snapshot(neat_config_path: Path, tmp_path: Path) -> None:
+    neat_config = neat_runner._load_neat_config(neat_config_path)
+    config = AppConfig(curriculum=CurriculumSettings(enabled=True))
+    world = World(config.world)
+    config.simulation.start_snapshot = str(save_snapshot(world.snapshot([]), tmp_path / "start.npz"))
+
+    with pytest.raises(ValueError, match="start_snapshot"):
+        neat_runner._GenerationEvaluator(neat.Population(neat_config), config, render=False)
@@ -0,0 +1,123 @@
+import asyncio
+import base64
+import json
+import os
+import socket
+import struct
+import time
+from pathlib import Path
+
+import neat
+import pytest
+
+from evo_game import neat_runner
+from evo_game.dashboard import DashboardServer, _offer, parse_address
+
+
+def _recv_exact(sock: socket.socket, size: int) -> bytes:
+    data = b""
+    while len(data) < size:
+        chunk = sock.recv(size - len(data))
+        assert chunk, "connection closed"
+        data += chunk
+    return data
+
+
+def _open_websocket(port: int) -> socket.socket:
+    sock = socket.create_connection(("127.0.0.1", port), timeout=5.0)
+    key = base64.b64encode(os.urandom(16)).decode("ascii")
+    sock.sendall(
+        (
+            "GET /ws HTTP/1.1\r\nHost: localhost\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n"
+            f"Sec-WebSocket-Key: {key}\r\nSec-WebSocket-Version: 13\r\n\r\n"
+        ).encode("ascii")
+    )
+    response = b""
+    while not response.endswith(b"\r\n\r\n"):
+        response += sock.recv(1)
+    assert response.startswith(b"HTTP/1.1 101")
+    return sock
+
+
+def test_parse_address() -> None:
+    assert parse_address(":8080") == ("127.0.0.1", 8080)
+    assert parse_address("0.0.0.0:9000") == ("0.0.0.0", 9000)
+    assert parse_address("8081") == ("127.0.0.1", 8081)
+    with pytest.raises(ValueError):
+        parse_address("localhost:http")
+
+
+def test_offer_drops_oldest_frame_when_full() -> None:
+    queue: asyncio.Queue = asyncio.Queue(maxsize=2)
+    assert _offer(queue, b"a")
+    assert _offer(queue, b"b")
+    assert not _offer(queue, b"c")
+    assert [queue.get_nowait(), queue.get_nowait()] == [b"b", b"c"]
+
+
+def test_server_pushes_messages_to_websocket_clients() -> None:
+    server = DashboardServer(port=0)
+    server.start()
+    try:
+        with socket.create_connection(("127.0.0.1", server.port), timeout=5.0) as http:
+            http.sendall(b"GET / HTTP/1.1\r\nHost: localhost\r\n\r\n")
+            assert http.recv(64).startswith(b"HTTP/1.1 200")
+
+        client = _open_websocket(server.port)
+        deadline = time.monotonic() + 5.0
+        while server.client_count == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        server.publish({"type": "generation", "generation": 3, "best_fitness": 1.5})
+        header = _recv_exact(client, 2)
+        assert header[0] == 0x81
+        payload = json.loads(_recv_exact(client, header[1] & 0x7F))
+        assert payload == {"type": "generation", "generation": 3, "best_fitness": 1.5}
+        client.close()
+    finally:
+        server.stop()
+
+
+def _masked_frame(opcode: int, payload: bytes) -> bytes:
+    mask = os.urandom(4)
+    return bytes([0x80 | opcode, 0x80 | len(payload)]) + mask + bytes(b ^ mask[i % 4] for i, b in enumerate(payload))
+
+
+def test_server_answers_close_and_rejects_oversized_frames() -> None:
+    server = DashboardServer(port=0)
+    server.start()
+    try:
+        client = _open_websocket(server.port)
+        client.sendall(_masked_frame(0x8, struct.pack("!H", 1000)))
+        assert _recv_exact(client, 4) == bytes([0x88, 2]) + struct.pack("!H", 1000)
+        client.close()
+
+        client = _open_websocket(server.port)
+        # Announce a 2**40-byte payload; the server must not try to buffer it.
+        client.sendall(bytes([0x82, 0x80 | 127]) + struct.pack("!Q", 1 << 40))
+        assert _recv_exact(client, 4) == bytes([0x88, 2]) + struct.pack("!H", 1009)
+        assert client.recv(1) == b""
+        client.close()
+    finally:
+        server.stop()
+
+
+def test_training_with_dashboard_writes_checkpoints(neat_config_path: Path, tmp_path: Path) -> None:
+    config_path = tmp_path / "config.toml"
+    config_path.write_text(
+        f"""
+neat_config_path = "{neat_config_path}"
+
+[simulation]
+max_steps = 30
+
+[population]
+checkpoint_dir = "{tmp_path / 'checkpoints'}"
+checkpoint_interval = 1
+"""
+    )
+    neat_runner.run_training(2, config_path=config_path, dashboard=":0")
+
+    latest = neat_runner._find_latest_checkpoint(tmp_path / "checkpoints")
+    assert latest is not None and latest.name == "neat-checkpoint-2"
+    assert neat.Checkpointer.restore_checkpoint(str(latest)).generation == 2
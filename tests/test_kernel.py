@@ -0,0 +1,69 @@
+import neat
+import pytest
+
+from evo_game.agent import Agent
+from evo_game.config import load_config
+from evo_game.kernel import HAS_NUMBA, FusedTicker, fused_tick
+from evo_game.policy import compile_genome
+from evo_game.simulation import Simulation
+from evo_game.world import World
+
+
+def _run(neat_config, genomes, kernel, steps: int = 200):
+    """Step a world either through Agent.update (kernel=None) or a FusedTicker.
+
+    Returns the agents' alive flags and their fitness, energy and position values.
+    """
+
+    app_config = load_config()
+    world = World(app_config.world)
+    agents = [Agent(world, app_config.simulation) for _ in genomes]
+    dt = 1.0 / app_config.simulation.ticks_per_second
+
+    if kernel is None:
+        networks = [neat.nn.FeedForwardNetwork.create(g, neat_config) for _, g in genomes]
+        for _ in range(steps):
+            for agent, network in zip(agents, networks):
+                if agent.alive:
+                    agent.update(dt, network)
+            world.step(dt)
+    else:
+        policies = [compile_genome(g, neat_config) for _, g in genomes]
+        ticker = FusedTicker(world, agents, policies, app_config.simulation, kernel=kernel)
+        for _ in range(steps):
+            ticker.tick(dt)
+            world.step(dt)
+
+    alive = [a.alive for a in agents]
+    values = [value for a in agents for value in (a.fitness, a.energy, *a.body.position)]
+    return alive, values
+
+
+def _assert_matches(actual, expected) -> None:
+    # Summation order can differ between backends (Python 3.12+ `sum` is compensated).
+    assert actual[0] == expected[0]
+    assert actual[1] == pytest.approx(expected[1], rel=1e-9, abs=1e-9)
+
+
+def test_fused_kernel_matches_agent_update(evolved_genomes) -> None:
+    expected = _run(*evolved_genomes(seed=5, mutations=6), None)
+    _assert_matches(_run(*evolved_genomes(seed=5, mutations=6), fused_tick), expected)
+
+
+@pytest.mark.skipif(not HAS_NUMBA, reason="numba not installed; fused_tick is already pure Python")
+def test_pure_python_fallback_matches_agent_update(evolved_genomes) -> None:
+    expected = _run(*evolved_genomes(seed=5, mutations=6), None, steps=60)
+    _assert_matches(_run(*evolved_genomes(seed=5, mutations=6), fused_tick.py_func, steps=60), expected)
+
+
+def test_simulation_fused_backend_matches_python_backend(evolved_genomes) -> None:
+    app_config = load_config()
+    app_config.simulation.max_steps = 150
+    neat_config, genomes = evolved_genomes(seed=5, mutations=6)
+    Simulation(genomes, neat_config, app_config).run()
+    expected = [g.fitness for _, g in genomes]
+
+    app_config.simulation.tick_backend = "fused"
+    neat_config, genomes = evolved_genomes(seed=5, mutations=6)
+    Simulation(genomes, neat_config, app_config).run()
+    assert [g.fitness for _, g in genomes] == pytest.approx(expected, rel=1e-9, abs=1e-9)
@@ -96,4 +96,7 @@ neat_config_path = "{neat_config_path}"
 
     neat_runner.run_training(1, render=False, config_path=config_path)
     assert checkpoint_dir.exists()
+    assert (checkpoint_dir / "best-policy.npz").exists()
+
+    neat_runner.run_best(render=False, config_path=config_path)
 
@@ -0,0 +1,111 @@
+import pickle
+import time
+from pathlib import Path
+
+import neat
+from neat.reporting import BaseReporter
+
+from evo_game import neat_runner, pipeline
+from evo_game.config import load_config
+from evo_game.pipeline import BackgroundReporter, PipelineStats, run_generations
+
+
+def test_pipelined_loop_matches_population_run(config_file) -> None:
+    config_path = config_file(sharded=True)
+    runs = []
+    for pipelined in (False, True):
+        app_config = load_config(config_path)
+        app_config.population.pipelined = pipelined
+        runs.append(neat_runner._seeded_run_stats(app_config, 3, seed=11))
+    assert runs[0] == runs[1]
+
+
+def test_background_checkpoints_are_complete_and_resumable(config_file, tmp_path: Path) -> None:
+    config_path = config_file(sharded=True)
+    neat_runner.run_training(2, config_path=config_path, seed=2)
+
+    checkpoint_dir = tmp_path / "checkpoints"
+    assert not list(checkpoint_dir.glob("*.partial"))
+    latest = neat_runner._find_latest_checkpoint(checkpoint_dir)
+    assert latest is not None and latest.name == "neat-checkpoint-2"
+    population = neat.Checkpointer.restore_checkpoint(str(latest))
+    assert population.generation == 2
+
+
+def test_background_reporter_sees_frozen_generation(neat_config_path: Path) -> None:
+    neat_config = neat_runner._load_neat_config(neat_config_path)
+    population = neat.Population(neat_config)
+    for genome in population.population.values():
+        genome.fitness = 1.0
+    best = next(iter(population.population.values()))
+
+    statistics = neat.StatisticsReporter()
+    stats = PipelineStats()
+    reporter = BackgroundReporter(statistics, stats)
+    reporter.post_evaluate(neat_config, population.population, population.species, best)
+    for genome in population.population.values():
+        genome.fitness = 5.0  # the next generation's evaluation reuses surviving genomes
+    reporter.close()
+
+    assert statistics.get_fitness_mean() == [1.0]
+    assert statistics.best_genome().fitness == 1.0
+    assert stats.background_seconds["StatisticsReporter"] > 0.0
+
+
+class _SlowReporter(BaseReporter):
+    def __init__(self) -> None:
+        self.generations = []
+
+    def start_generation(self, generation):
+        time.sleep(0.05)
+        self.generations.append(generation)
+
+
+def test_background_reporter_skips_callbacks_it_does_not_wrap(neat_config_path: Path, monkeypatch) -> None:
+    neat_config = neat_runner._load_neat_config(neat_config_path)
+    population = neat.Population(neat_config)
+    frozen = []
+    monkeypatch.setattr(pipeline, "_freeze", lambda *args: frozen.append(args))
+
+    reporter = BackgroundReporter(neat.StatisticsReporter())
+    reporter.end_generation(neat_config, population.population, population.species)
+    reporter.post_reproduction(neat_config, population.population, population.species)
+    reporter.close()
+    assert frozen == []
+
+
+def test_pickled_background_reporter_waits_for_queued_callbacks() -> None:
+    reporter = BackgroundReporter(_SlowReporter())
+    reporter.start_generation(4)
+    restored = pickle.loads(pickle.dumps(reporter))
+    reporter.close()
+    assert restored.reporter.generations == [4]
+    restored.start_generation(5)
+    restored.close()
+    assert restored.reporter.generations == [4, 5]
+
+
+def test_pipeline_stats_shares() -> None:
+    stats = PipelineStats(evaluators=2)
+    stats.stage_seconds["evaluate"] = 3.0
+    stats.add_evaluator_busy(4.0)
+    shares = stats.end_generation(4.0)
+    assert shares["evaluators"] == 0.5
+    assert stats.utilization()["evaluate"] == 0.75
+    assert "evaluators busy 50%" in stats.summary()
+
+
+def test_solved_generation_is_counted_in_stats(neat_config_path: Path) -> None:
+    neat_config = neat_runner._load_neat_config(neat_config_path)
+    neat_config.fitness_threshold = 1.0
+    population = neat.Population(neat_config)
+    population.reporters.info = lambda message: None
+
+    def solve(genomes, config) -> None:
+        for _, genome in genomes:
+            genome.fitness = 1.0
+
+    stats = PipelineStats()
+    run_generations(population, solve, 5, stats)
+    assert stats.generations == 1
+    assert stats.utilization()["evaluate"] <= 1.0
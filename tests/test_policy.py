@@ -0,0 +1,79 @@
+from pathlib import Path
+
+import neat
+import numpy as np
+import pytest
+
+from evo_game.policy import PolicyBatch, RecurrentBatch, compile_genome, export_genome, load_policy
+
+
+def test_compiled_policy_matches_feed_forward_network(evolved_genomes) -> None:
+    config, genomes = evolved_genomes(seed=7, mutations=8, count=12)
+    rng = np.random.default_rng(0)
+    for _, genome in genomes:
+        network = neat.nn.FeedForwardNetwork.create(genome, config)
+        policy = compile_genome(genome, config)
+        for _ in range(5):
+            inputs = rng.uniform(-1.0, 1.0, size=7).tolist()
+            assert policy.activate(inputs) == pytest.approx(network.activate(inputs), abs=1e-12)
+
+
+def test_policy_batch_matches_individual_networks(evolved_genomes) -> None:
+    config, genomes = evolved_genomes(seed=7, mutations=8, count=12)
+    networks = [neat.nn.FeedForwardNetwork.create(g, config) for _, g in genomes]
+    batch = PolicyBatch([compile_genome(g, config) for _, g in genomes])
+
+    inputs = np.random.default_rng(1).uniform(-1.0, 1.0, size=(len(genomes), 7))
+    outputs = batch.activate(inputs)
+    assert outputs.shape == (len(genomes), 2)
+    for row, network in enumerate(networks):
+        assert outputs[row].tolist() == pytest.approx(network.activate(inputs[row].tolist()), abs=1e-12)
+
+
+def test_export_round_trip(tmp_path: Path, evolved_genomes) -> None:
+    config, genomes = evolved_genomes(seed=7, mutations=8, count=1)
+    path = export_genome(genomes[0][1], config, tmp_path / "policy.npz", {"generation": 3})
+
+    policy = load_policy(path)
+    assert policy.metadata["generation"] == 3
+    assert policy.metadata["genome_key"] == genomes[0][1].key
+    inputs = [0.1, -0.2, 0.3, 0.0, 0.5, 1.0, -0.4]
+    network = neat.nn.FeedForwardNetwork.create(genomes[0][1], config)
+    assert policy.activate(inputs) == pytest.approx(network.activate(inputs), abs=1e-12)
+
+
+def test_batch_rejects_mismatched_inputs(evolved_genomes) -> None:
+    config, genomes = evolved_genomes(seed=7, mutations=8, count=2)
+    batch = PolicyBatch([compile_genome(g, config) for _, g in genomes])
+    with pytest.raises(RuntimeError):
+        batch.activate(np.zeros((2, 3)))
+
+
+def test_recurrent_batch_matches_recurrent_networks(evolved_genomes) -> None:
+    config, genomes = evolved_genomes(seed=7, mutations=15, count=12, feed_forward=False)
+    networks = [neat.nn.RecurrentNetwork.create(g, config) for _, g in genomes]
+    policies = [compile_genome(g, config) for _, g in genomes]
+    assert not any(p.feed_forward for p in policies)
+    batch = RecurrentBatch(policies)
+
+    rng = np.random.default_rng(2)
+    for episode in range(2):
+        batch.reset()
+        for network in networks:
+            network.reset()
+        for _ in range(10):
+            inputs = rng.uniform(-1.0, 1.0, size=(len(genomes), 7))
+            outputs = batch.activate(inputs)
+            for row, network in enumerate(networks):
+                assert outputs[row].tolist() == pytest.approx(network.activate(inputs[row].tolist()), abs=1e-12)
+
+
+def test_recurrent_policy_round_trip_keeps_state(tmp_path: Path, evolved_genomes) -> None:
+    config, genomes = evolved_genomes(seed=7, mutations=15, count=1, feed_forward=False)
+    policy = load_policy(export_genome(genomes[0][1], config, tmp_path / "policy.npz"))
+    network = neat.nn.RecurrentNetwork.create(genomes[0][1], config)
+    inputs = [0.1, -0.2, 0.3, 0.0, 0.5, 1.0, -0.4]
+    first = [policy.activate(inputs) for _ in range(3)]
+    assert first == [pytest.approx(network.activate(inputs), abs=1e-12) for _ in range(3)]
+    policy.reset()
+    assert policy.activate(inputs) == pytest.approx(first[0], abs=1e-12)
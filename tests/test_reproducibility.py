@@ -0,0 +1,70 @@
+import random
+from pathlib import Path
+
+import neat
+import pytest
+
+from evo_game import neat_runner
+from evo_game.config import load_config
+from evo_game.reproducibility import GenerationStatsReporter, derive_seed, first_difference, isolated_rng
+
+
+def test_derived_seeds_and_isolated_rng() -> None:
+    assert derive_seed(7, "neat") == derive_seed(7, "neat")
+    assert len({derive_seed(7, "neat"), derive_seed(8, "neat"), derive_seed(7, "evaluation", 0, 0)}) == 3
+
+    random.seed(1)
+    expected = random.random()
+    random.seed(1)
+    with isolated_rng(5):
+        inside = random.random()
+    assert random.random() == expected
+    with isolated_rng(5):
+        assert random.random() == inside
+
+
+def test_serial_and_sharded_runs_match_bitwise(config_file) -> None:
+    config_path = config_file()
+    assert neat_runner.check_reproducibility(2, seed=3, workers=(0, 2), config_path=config_path)
+
+    app_config = load_config(config_path)
+    app_config.simulation.agent_collisions = False
+    other_seed = neat_runner._seeded_run_stats(app_config, 2, seed=4)
+    app_config = load_config(config_path)
+    app_config.simulation.agent_collisions = False
+    assert neat_runner._seeded_run_stats(app_config, 2, seed=3) != other_seed
+
+
+def test_sharding_requires_independent_agents(neat_config_path: Path) -> None:
+    app_config = load_config()
+    app_config.population.evaluation_workers = 2
+    population = neat.Population(neat_runner._load_neat_config(neat_config_path))
+    with pytest.raises(ValueError, match="agent_collisions"):
+        neat_runner._GenerationEvaluator(population, app_config, render=False)
+
+
+def test_checkpoints_record_the_root_seed(config_file, tmp_path: Path) -> None:
+    config_path = config_file()
+    neat_runner.run_training(1, config_path=config_path, seed=11)
+
+    latest = neat_runner._find_latest_checkpoint(tmp_path / "checkpoints")
+    assert latest is not None and latest.name == "neat-checkpoint-1"
+    population = neat.Checkpointer.restore_checkpoint(str(latest))
+    assert population.config.run_seed == 11
+
+
+def test_resumed_run_matches_uninterrupted_run(config_file, tmp_path: Path) -> None:
+    config_path = config_file()
+    uninterrupted = neat_runner._seeded_run_stats(load_config(config_path), 4, seed=6)
+
+    neat_runner.run_training(2, config_path=config_path, seed=6)
+    app_config = load_config(config_path)
+    population = neat_runner._restore_checkpoint(tmp_path / "checkpoints" / "neat-checkpoint-2", app_config)
+    assert population.generation == 2
+    stats = GenerationStatsReporter()
+    population.add_reporter(stats)
+    evaluator = neat_runner._GenerationEvaluator(population, app_config, render=False)
+    neat_runner._run_population(population, evaluator, 2)
+
+    assert [record["generation"] for record in stats.records] == [2, 3]
+    assert first_difference(uninterrupted[2:], stats.records) is None
@@ -0,0 +1,21 @@
+import json
+from pathlib import Path
+
+from evo_game.scaling import STAGES, run_scaling
+
+
+def test_scaling_report(tmp_path: Path) -> None:
+    output = tmp_path / "scaling.json"
+    report = run_scaling([6, 12], generations=2, max_steps=5, seed=1, top_n=3, output=output)
+
+    assert [point["population_size"] for point in report["curve"]] == [6, 12]
+    for result in report["results"]:
+        assert len(result["generations"]) == 2
+        for record in result["generations"]:
+            for stage in STAGES:
+                assert record[f"{stage}_seconds"] >= 0.0
+                assert record[f"{stage}_peak_bytes"] >= 0
+        assert result["top_sites"]["evaluation"]
+        assert len(result["top_sites"]["reproduction"]) <= 3
+
+    assert json.loads(output.read_text())["curve"] == report["curve"]
@@ -0,0 +1,128 @@
+import neat
+import pytest
+
+from evo_game.agent import Agent
+from evo_game.config import load_config
+from evo_game.simulation import Simulation
+from evo_game.world import World, save_snapshot, world_variants
+
+
+def _fitnesses(evolved_genomes, app_config) -> list[float]:
+    neat_config, genomes = evolved_genomes()
+    Simulation(genomes, neat_config, app_config).run()
+    return [genome.fitness for _, genome in genomes]
+
+
+def test_threaded_solver_is_deterministic_enough(evolved_genomes) -> None:
+    app_config = load_config()
+    app_config.simulation.max_steps = 120
+    baseline = _fitnesses(evolved_genomes, app_config)
+
+    app_config.world.threaded_solver = True
+    app_config.world.solver_threads = 2
+    threaded_a = _fitnesses(evolved_genomes, app_config)
+    threaded_b = _fitnesses(evolved_genomes, app_config)
+
+    assert threaded_a == pytest.approx(threaded_b, rel=1e-6, abs=1e-6)
+    assert threaded_a == pytest.approx(baseline, rel=1e-3, abs=1e-3)
+
+
+def test_threaded_solver_falls_back_for_single_thread(evolved_genomes) -> None:
+    app_config = load_config()
+    app_config.world.threaded_solver = True
+    app_config.world.solver_threads = 1
+    neat_config, genomes = evolved_genomes()
+    simulation = Simulation(genomes, neat_config, app_config)
+    assert simulation.world.solver_threads == 1
+
+
+def test_time_budget_truncates_generation(evolved_genomes) -> None:
+    app_config = load_config()
+    app_config.population.generation_time_budget = 1e-9
+    neat_config, genomes = evolved_genomes()
+    simulation = Simulation(genomes, neat_config, app_config)
+    simulation.run()
+
+    assert simulation.truncated
+    assert simulation.steps_run < app_config.simulation.max_steps
+    assert all(genome.fitness is not None and genome.fitness >= 0.0 for _, genome in genomes)
+
+
+def test_recurrent_genomes_match_per_agent_networks(evolved_genomes) -> None:
+    app_config = load_config()
+    app_config.simulation.max_steps = 150
+    neat_config, genomes = evolved_genomes(mutations=10, feed_forward=False)
+
+    simulation = Simulation(genomes, neat_config, app_config)
+    assert simulation.recurrent is not None
+    simulation.run()
+
+    # Reference: neat's own RecurrentNetwork driven through Agent.update.
+    world = World(app_config.world)
+    dt = 1.0 / app_config.simulation.ticks_per_second
+    networks = [neat.nn.RecurrentNetwork.create(g, neat_config) for _, g in genomes]
+    agents = [Agent(world, app_config.simulation) for _ in genomes]
+    for _ in range(app_config.simulation.max_steps):
+        for agent, network in zip(agents, networks):
+            agent.update(dt, network)
+        world.step(dt)
+
+    assert [g.fitness for _, g in genomes] == pytest.approx([max(a.fitness, 0.0) for a in agents], abs=1e-9)
+
+
+@pytest.mark.parametrize("backend", ["python", "fused"])
+def test_pooled_episodes_match_separate_runs(evolved_genomes, backend: str) -> None:
+    app_config = load_config()
+    app_config.simulation.max_steps = 120
+    app_config.simulation.tick_backend = backend
+    app_config.episodes.count = 3
+    app_config.episodes.seed = 5
+    neat_config, genomes = evolved_genomes()
+    simulation = Simulation(genomes, neat_config, app_config)
+    assert len(simulation.worlds) == 3
+    assert len(simulation.agents) == 3 * len(genomes)
+    simulation.run()
+    pooled_mean = [genome.fitness for _, genome in genomes]
+
+    # Reference: one single-episode Simulation per variant.
+    expected = []
+    for variant in world_variants(app_config.world, app_config.episodes):
+        single = app_config.model_copy(deep=True)
+        single.world = variant
+        single.episodes.count = 1
+        expected.append(_fitnesses(evolved_genomes, single))
+
+    assert simulation.episode_fitness.tolist() == expected
+    assert pooled_mean == pytest.approx([max(sum(col) / 3, 0.0) for col in zip(*expected)], abs=1e-12)
+
+    app_config.episodes.aggregate = "min"
+    neat_config, genomes = evolved_genomes()
+    Simulation(genomes, neat_config, app_config).run()
+    assert [genome.fitness for _, genome in genomes] == [max(min(col), 0.0) for col in zip(*expected)]
+
+
+def test_forked_simulation_matches_resimulated_prefix(evolved_genomes, tmp_path) -> None:
+    app_config = load_config()
+    app_config.simulation.max_steps = 90
+    dt = 1.0 / app_config.simulation.ticks_per_second
+    neat_config, genomes = evolved_genomes()
+    genome = genomes[0][1]
+    network = neat.nn.FeedForwardNetwork.create(genome, neat_config)
+
+    # Reference: simulate a passive 10-tick fall, then hand control to the genome.
+    world = World(app_config.world)
+    agent = Agent(world, app_config.simulation, start_position=(250.0, 300.0))
+    for _ in range(10):
+        world.step(dt)
+    app_config.simulation.start_snapshot = str(save_snapshot(world.snapshot([agent]), tmp_path / "start.npz"))
+    agent.initial_distance = agent._distance_to_target()
+    for _ in range(app_config.simulation.max_steps):
+        agent.update(dt, network)
+        world.step(dt)
+        if not agent.alive:
+            break
+
+    simulation = Simulation(genomes[:1], neat_config, app_config)
+    assert simulation.world.time == pytest.approx(10 * dt)
+    simulation.run()
+    assert genome.fitness == max(agent.fitness, 0.0)
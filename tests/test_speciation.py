@@ -0,0 +1,79 @@
+import pickle
+import random
+
+import neat
+
+from evo_game import neat_runner, speciation
+from evo_game.speciation import CachedSpeciesSet
+
+
+def _evolve(config_path, species_type, generations: int = 6, workers: int = 0, pop_size: int = 60):
+    """Evolve with random fitness and record every generation's species assignment and log."""
+
+    random.seed(11)
+    config = neat_runner._load_neat_config(config_path, speciation_workers=workers)
+    config.species_set_type = species_type
+    config.pop_size = pop_size
+    config.fitness_threshold = float("inf")
+    # Loosen the threshold so the run produces several species.
+    config.species_set_config.compatibility_threshold = 1.5
+    population = neat.Population(config)
+    messages = []
+    population.reporters.info = messages.append
+
+    history = []
+
+    def evaluate(genomes, _config):
+        history.append(dict(population.species.genome_to_species))
+        for _, genome in genomes:
+            genome.fitness = random.random()
+
+    population.run(evaluate, generations)
+    if isinstance(population.species, CachedSpeciesSet):
+        population.species.close()
+    return history, messages
+
+
+def test_load_neat_config_uses_cached_species_set(neat_config_path) -> None:
+    config = neat_runner._load_neat_config(neat_config_path, speciation_workers=3)
+    population = neat.Population(config)
+    assert isinstance(population.species, CachedSpeciesSet)
+    assert population.species.workers == 3
+
+
+def test_cached_species_match_default(neat_config_path, monkeypatch) -> None:
+    # A small window exercises the window boundaries with a small population.
+    monkeypatch.setattr(speciation, "_WINDOW", 7)
+    expected, expected_log = _evolve(neat_config_path, neat.DefaultSpeciesSet)
+    actual, actual_log = _evolve(neat_config_path, CachedSpeciesSet)
+    assert len({sid for generation in expected for sid in generation.values()}) > 1
+    assert actual == expected
+    # Same distances in the same order, so even the reported statistics agree.
+    assert actual_log == expected_log
+
+
+def test_sharded_species_match_default(neat_config_path) -> None:
+    expected, _ = _evolve(neat_config_path, neat.DefaultSpeciesSet, generations=3)
+    actual, _ = _evolve(neat_config_path, CachedSpeciesSet, generations=3, workers=2)
+    assert actual == expected
+
+
+def test_distances_are_bitwise_equal_to_genome_distance(evolved_genomes) -> None:
+    config, items = evolved_genomes(seed=4, mutations=10)
+    genomes = [genome for _, genome in items]
+    species_set = CachedSpeciesSet(config.species_set_config, neat.reporting.ReporterSet())
+    species_set.speciate(config, {g.key: g for g in genomes}, 0)
+
+    by_key = {g.key: g for g in genomes}
+    assert species_set._memo
+    for rep_key, (keys, distances) in species_set._memo.items():
+        for key, d in zip(keys.tolist(), distances.tolist()):
+            assert d == by_key[rep_key].distance(by_key[key], config.genome_config)
+
+
+def test_pickle_drops_caches(neat_config_path) -> None:
+    config = neat_runner._load_neat_config(neat_config_path)
+    population = neat.Population(config)
+    restored = pickle.loads(pickle.dumps(population.species))
+    assert restored._memo == {} and restored._genes == {}
+    assert restored.genome_to_species == population.species.genome_to_species
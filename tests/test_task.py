@@ -0,0 +1,99 @@
+import neat
+import numpy as np
+import pytest
+
+from evo_game.agent import Agent
+from evo_game.config import load_config
+from evo_game.simulation import Simulation
+from evo_game.task import TASKS, Task, register_task
+from evo_game.world import World
+
+
+def test_default_task_matches_agent_update(evolved_genomes) -> None:
+    app_config = load_config()
+    app_config.simulation.max_steps = 200
+    app_config.simulation.max_energy = 3.0  # exercise energy deaths too
+    neat_config, genomes = evolved_genomes(seed=9, mutations=6)
+    Simulation(genomes, neat_config, app_config).run()
+
+    world = World(app_config.world)
+    agents = [Agent(world, app_config.simulation) for _ in genomes]
+    networks = [neat.nn.FeedForwardNetwork.create(g, neat_config) for _, g in genomes]
+    dt = 1.0 / app_config.simulation.ticks_per_second
+    for _ in range(app_config.simulation.max_steps):
+        for agent, network in zip(agents, networks):
+            agent.update(dt, network)
+        world.step(dt)
+
+    assert any(not a.alive for a in agents)
+    assert [g.fitness for _, g in genomes] == [max(a.fitness, 0.0) for a in agents]
+
+
+class _SurviveTask(Task):
+    """Rewards only time alive and feeds the elapsed time as an extra sensor."""
+
+    num_sensor_extras = 1
+
+    def reset(self, world, state) -> None:
+        self.seen = []
+
+    def sensor_extras(self, world, state) -> np.ndarray:
+        return np.full((len(state), 1), world.time)
+
+    def sensors(self, world, state) -> np.ndarray:
+        inputs = super().sensors(world, state)
+        self.seen.append(inputs.shape)
+        return inputs
+
+    def reward(self, world, state, dt) -> None:
+        state.fitness[state.living] += dt
+
+    def termination(self, world, state) -> np.ndarray:
+        return np.zeros(len(state), dtype=bool)
+
+
+def test_custom_task_with_sensor_extras(evolved_genomes, monkeypatch) -> None:
+    monkeypatch.setitem(TASKS, "survive", _SurviveTask)
+    app_config = load_config()
+    app_config.simulation.max_steps = 30
+    app_config.simulation.task = "survive"
+    neat_config, genomes = evolved_genomes(seed=9, mutations=6, num_inputs=8)
+
+    simulation = Simulation(genomes, neat_config, app_config)
+    simulation.run()
+
+    assert simulation.task.seen[0] == (len(genomes), 8)
+    dt = 1.0 / app_config.simulation.ticks_per_second
+    assert [g.fitness for _, g in genomes] == pytest.approx([30 * dt] * len(genomes))
+
+
+def test_register_task_and_unknown_task(evolved_genomes) -> None:
+    register_task("survive-registered", _SurviveTask)
+    try:
+        assert TASKS["survive-registered"] is _SurviveTask
+    finally:
+        del TASKS["survive-registered"]
+
+    class _NoTermination(Task):
+        def reward(self, world, state, dt) -> None:
+            pass
+
+    with pytest.raises(TypeError, match="termination"):
+        register_task("incomplete", _NoTermination)
+    assert "incomplete" not in TASKS
+    with pytest.raises(TypeError):
+        _NoTermination(load_config().simulation)
+
+    app_config = load_config()
+    app_config.simulation.task = "missing"
+    neat_config, genomes = evolved_genomes(seed=9, mutations=6)
+    with pytest.raises(ValueError, match="Unknown task"):
+        Simulation(genomes, neat_config, app_config)
+
+
+def test_fused_backend_rejects_custom_tasks(evolved_genomes) -> None:
+    app_config = load_config()
+    app_config.simulation.tick_backend = "fused"
+    neat_config, genomes = evolved_genomes(seed=9, mutations=6)
+    with pytest.raises(ValueError, match="reach_target"):
+        Simulation(genomes, neat_config, app_config, task=_SurviveTask(app_config.simulation))
@@ -1,5 +1,9 @@
-from evo_game.config import load_config
-from evo_game.world import World
+import pymunk
+import pytest
+
+from evo_game.agent import Agent
+from evo_game.config import EpisodeSettings, load_config
+from evo_game.world import World, load_snapshot, save_snapshot, world_variants
 
 
 def test_world_constructs() -> None:
@@ -9,3 +13,88 @@ def test_world_constructs() -> None:
     assert len(world.obstacles) == len(config.world.obstacles)
     assert world.target_body is not None
 
+
+def test_large_world_uses_spatial_hash() -> None:
+    config = load_config()
+    obstacles = tuple((50.0 + 30.0 * i, 100.0, 20.0, 10.0) for i in range(20))
+    settings = config.world.model_copy(
+        update={"width": 8000.0, "large_world": True, "obstacles": obstacles, "solver_iterations": 4, "collision_slop": 0.5}
+    )
+    with pytest.raises(ValueError, match="agent radius"):
+        World(settings)
+    world = World(settings, agent_radius=12.0, expected_agents=100)
+
+    assert len(world.obstacles) == len(obstacles)
+    assert len(world.boundaries) == 3
+    assert world.space.iterations == 4
+    assert world.space.collision_slop == 0.5
+
+    x, y, w, h = obstacles[5]
+    hit = world.space.point_query_nearest((x, y), 0.0, pymunk.ShapeFilter())
+    assert hit is not None and hit.shape is world.obstacles[5]
+
+    world.step(1.0 / 60.0)
+
+
+def test_world_variants_are_seeded_and_prefix_stable() -> None:
+    config = load_config()
+    assert world_variants(config.world, EpisodeSettings()) == [config.world]
+
+    three = world_variants(config.world, EpisodeSettings(count=3, seed=7))
+    five = world_variants(config.world, EpisodeSettings(count=5, seed=7))
+    assert three[0] is config.world
+    assert five[:3] == three
+    assert world_variants(config.world, EpisodeSettings(count=5, seed=8)) != five
+    for variant in five[1:]:
+        assert variant.target_position != config.world.target_position
+        assert variant.hazards[0][1:] == config.world.hazards[0][1:]
+        assert config.world.ground_height < variant.target_position[1] < config.world.height
+
+
+def test_snapshot_round_trips_and_forks(tmp_path) -> None:
+    config = load_config()
+    world = World(config.world)
+    agent = Agent(world, config.simulation, start_position=(250.0, 300.0))
+    agent.energy = 7.5
+    agent.body.angular_velocity = 2.0
+    for _ in range(30):
+        world.step(1.0 / 60.0)
+
+    snapshot = load_snapshot(save_snapshot(world.snapshot([agent]), tmp_path / "snap.npz"))
+    assert snapshot.settings == config.world
+    assert snapshot.time == world.time
+
+    fork = World(snapshot.settings)
+    clones = [Agent(fork, config.simulation) for _ in range(3)]
+    fork.restore(snapshot, clones)
+    assert fork.time == world.time
+    assert fork.target_body.position == world.target_body.position
+    assert fork.target_body.velocity == world.target_body.velocity
+    for clone in clones:
+        assert clone.body.position == agent.body.position
+        assert clone.body.velocity == agent.body.velocity
+        assert clone.body.angle == agent.body.angle
+        assert clone.energy == 7.5
+
+
+def test_apply_settings_patches_hazards_and_target_in_place() -> None:
+    config = load_config()
+    world = World(config.world)
+    space_shapes = set(world.space.shapes)
+    Agent(world, config.simulation)
+    easy = config.world.model_copy(update={"hazards": (), "target_position": (400.0, 100.0)})
+
+    world.reset()
+    world.apply_settings(easy)
+    fresh = World(easy)
+    assert world.hazard_boxes == fresh.hazard_boxes == []
+    assert world.target_body.position == fresh.target_body.position
+    assert set(world.space.shapes) == space_shapes - set(world._hazard_sets[tuple(config.world.hazards)][1])
+
+    original_hazards = list(world._hazard_sets[tuple(config.world.hazards)][1])
+    world.apply_settings(config.world)
+    assert world.hazards == original_hazards  # cached shapes are reused
+    assert set(world.space.shapes) == space_shapes
+
+    with pytest.raises(ValueError, match="width"):
+        world.apply_settings(config.world.model_copy(update={"width": 1000.0}))